@@ -0,0 +1,286 @@
+import asyncio
+import json
+import os
+import time
+from collections import deque
+from collections.abc import Callable
+from datetime import datetime
+from pathlib import Path
+from typing import Any, TypedDict
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.adapters.outbound.analytics.rescore_sinks import RescoreSink
+from app.adapters.outbound.logging.logger import LoggerPort
+from app.adapters.outbound.persistence.repositories.fraud_decision_repository import FraudDecisionRepository
+from app.adapters.outbound.persistence.repositories.transaction_repository import TransactionRepository
+from app.application.use_cases.rescore_transactions_use_case import RescoreTransactionsUseCase
+from app.domain.entities.transaction import Transaction
+from app.domain.ports.velocity_index_port import VelocityIndexPort
+
+NO_PREVIOUS_DECISION = "none"
+
+Position = tuple[int, datetime | None]
+ChunkResult = tuple[Position, list[dict[str, Any]]]
+
+
+class RescoreCheckpoint(TypedDict):
+    run_id: str
+    last_id: int
+    last_timestamp: str | None
+    rows: int
+    sink_position: int
+    changed: int
+    score_delta_sum: float
+    compared: int
+    shifts: dict[str, dict[str, int]]
+
+
+class RescoreJobStats(TypedDict):
+    run_id: str
+    rows: int
+    total: int
+    last_id: int
+    elapsed_seconds: float
+    rows_per_second: float
+    changed: int
+    mean_abs_score_delta: float
+    shifts: dict[str, dict[str, int]]
+
+
+class RescoreJob:
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        use_case: RescoreTransactionsUseCase,
+        sink: RescoreSink,
+        logger: LoggerPort,
+        run_id: str,
+        checkpoint_path: str | None = None,
+        chunk_size: int = 10000,
+        max_in_flight: int = 2,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        velocity_index: VelocityIndexPort | None = None,
+        progress_interval_seconds: float = 10.0,
+        exact_total: bool = False,
+    ) -> None:
+        self._session_factory = session_factory
+        self._use_case = use_case
+        self._sink = sink
+        self._logger = logger
+        self._checkpoint_path = Path(checkpoint_path) if checkpoint_path else None
+        self._chunk_size = chunk_size
+        self._max_in_flight = 1 if velocity_index is not None else max_in_flight
+        self._start = start
+        self._end = end
+        self._velocity_index = velocity_index
+        self._time_ordered = velocity_index is not None
+        self._progress_interval = progress_interval_seconds
+        self._exact_total = exact_total
+        self._checkpoint = RescoreCheckpoint(
+            run_id=run_id,
+            last_id=0,
+            last_timestamp=None,
+            rows=0,
+            sink_position=0,
+            changed=0,
+            score_delta_sum=0.0,
+            compared=0,
+            shifts={},
+        )
+        self._total = 0
+        self._resumed_rows = 0
+        self._started = time.perf_counter()
+        self._reported = self._started
+
+    @property
+    def run_id(self) -> str:
+        return self._checkpoint["run_id"]
+
+    def stats(self) -> RescoreJobStats:
+        checkpoint = self._checkpoint
+        elapsed = time.perf_counter() - self._started
+        scored = checkpoint["rows"] - self._resumed_rows
+        compared = checkpoint["compared"]
+        return RescoreJobStats(
+            run_id=checkpoint["run_id"],
+            rows=checkpoint["rows"],
+            total=self._total,
+            last_id=checkpoint["last_id"],
+            elapsed_seconds=elapsed,
+            rows_per_second=scored / elapsed if elapsed else 0.0,
+            changed=checkpoint["changed"],
+            mean_abs_score_delta=checkpoint["score_delta_sum"] / compared if compared else 0.0,
+            shifts=checkpoint["shifts"],
+        )
+
+    async def run(self, resume: bool = False) -> RescoreJobStats:
+        if resume:
+            self._checkpoint = await asyncio.to_thread(self._read_checkpoint)
+            self._resumed_rows = self._checkpoint["rows"]
+        checkpoint = self._checkpoint
+        await self._sink.restore(checkpoint["sink_position"])
+        self._started = self._reported = time.perf_counter()
+        pending: deque[asyncio.Task[ChunkResult]] = deque()
+        try:
+            id_range = await self._find_id_range()
+            if self._exact_total:
+                self._total = await self._count_total()
+            else:
+                self._total = id_range[1] - id_range[0] + 1 if id_range is not None else 0
+            self._logger.info(
+                "Rescoring transactions",
+                run_id=self.run_id,
+                after_id=checkpoint["last_id"],
+                rows=max(0, self._total - checkpoint["rows"]),
+            )
+            last_timestamp = checkpoint.get("last_timestamp")
+            position: Position = (
+                checkpoint["last_id"],
+                datetime.fromisoformat(last_timestamp) if last_timestamp else None,
+            )
+            while id_range is not None:
+                position, transactions = await self._read_chunk(position, id_range)
+                if not transactions:
+                    break
+                while len(pending) >= self._max_in_flight:
+                    await self._complete(pending.popleft())
+                pending.append(asyncio.create_task(self._score(position, transactions)))
+                while pending and pending[0].done():
+                    await self._complete(pending.popleft())
+            while pending:
+                await self._complete(pending.popleft())
+            self._total = checkpoint["rows"]
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+        stats = self.stats()
+        self._logger.info(
+            "Rescoring finished",
+            run_id=self.run_id,
+            rows=stats["rows"],
+            changed=stats["changed"],
+            rows_per_second=round(stats["rows_per_second"], 1),
+        )
+        return stats
+
+    async def _find_id_range(self) -> tuple[int, int] | None:
+        session = self._session_factory()
+        try:
+            return await TransactionRepository(session).find_id_range(self._start, self._end)
+        finally:
+            await session.close()
+
+    async def _count_total(self) -> int:
+        session = self._session_factory()
+        try:
+            return await TransactionRepository(session).count_in_range(self._start, self._end)
+        finally:
+            await session.close()
+
+    async def _read_chunk(self, position: Position, id_range: tuple[int, int]) -> tuple[Position, list[Transaction]]:
+        after_id, after_timestamp = position
+        session = self._session_factory()
+        try:
+            repository = TransactionRepository(session)
+            if not self._time_ordered:
+                last_id, transactions = await repository.find_chunk_after(
+                    max(after_id, id_range[0] - 1), self._start, self._end, self._chunk_size, id_range[1]
+                )
+                return (last_id, None), transactions
+            cursor, transactions = await repository.find_chunk_after_timestamp(
+                (after_timestamp, after_id) if after_timestamp is not None else None,
+                self._start,
+                self._end,
+                self._chunk_size,
+            )
+            return (cursor[1], cursor[0]) if cursor is not None else position, transactions
+        finally:
+            await session.close()
+
+    async def _score(self, position: Position, transactions: list[Transaction]) -> ChunkResult:
+        fraud_decisions = await self._use_case.execute(transactions)
+        if self._velocity_index is not None:
+            self._velocity_index.record_many(transactions)
+        session = self._session_factory()
+        try:
+            previous = {
+                fraud_decision.transaction_id: fraud_decision
+                for fraud_decision in await FraudDecisionRepository(session).find_by_transaction_ids(
+                    [transaction.transaction_id for transaction in transactions]
+                )
+            }
+        finally:
+            await session.close()
+        rows = []
+        for fraud_decision in fraud_decisions:
+            stored = previous.get(fraud_decision.transaction_id)
+            rows.append(
+                {
+                    "run_id": self.run_id,
+                    "transaction_id": str(fraud_decision.transaction_id.value),
+                    "risk_score": fraud_decision.risk_score,
+                    "decision": fraud_decision.decision.value,
+                    "model_version": fraud_decision.model_version,
+                    "matched_rules": list(fraud_decision.matched_rules) or None,
+                    "previous_risk_score": stored.risk_score if stored is not None else None,
+                    "previous_decision": stored.decision.value if stored is not None else None,
+                    "previous_model_version": stored.model_version if stored is not None else None,
+                    "scored_at": fraud_decision.timestamp,
+                }
+            )
+        return position, rows
+
+    async def _complete(self, task: "asyncio.Task[ChunkResult]") -> None:
+        (last_id, last_timestamp), rows = await task
+        await self._sink.write(rows)
+        checkpoint = self._checkpoint
+        for row in rows:
+            previous = row["previous_decision"] or NO_PREVIOUS_DECISION
+            by_decision = checkpoint["shifts"].setdefault(previous, {})
+            by_decision[row["decision"]] = by_decision.get(row["decision"], 0) + 1
+            if row["previous_risk_score"] is not None:
+                checkpoint["compared"] += 1
+                checkpoint["score_delta_sum"] += abs(row["risk_score"] - row["previous_risk_score"])
+                checkpoint["changed"] += row["decision"] != previous
+        checkpoint["rows"] += len(rows)
+        checkpoint["last_id"] = last_id
+        checkpoint["last_timestamp"] = last_timestamp.isoformat() if last_timestamp is not None else None
+        checkpoint["sink_position"] = self._sink.position()
+        if self._checkpoint_path is not None:
+            await asyncio.to_thread(self._write_checkpoint)
+        now = time.perf_counter()
+        if now - self._reported >= self._progress_interval:
+            self._reported = now
+            self._report_progress()
+
+    def _report_progress(self) -> None:
+        stats = self.stats()
+        rate = stats["rows_per_second"]
+        self._logger.info(
+            "Rescore progress",
+            run_id=self.run_id,
+            rows=stats["rows"],
+            total=stats["total"],
+            last_id=stats["last_id"],
+            rows_per_second=round(rate, 1),
+            eta_seconds=round((stats["total"] - stats["rows"]) / rate, 1) if rate else 0.0,
+        )
+
+    def _read_checkpoint(self) -> RescoreCheckpoint:
+        if self._checkpoint_path is None or not self._checkpoint_path.exists():
+            raise FileNotFoundError(f"No rescore checkpoint at {self._checkpoint_path}")
+        checkpoint: RescoreCheckpoint = json.loads(self._checkpoint_path.read_text())
+        return checkpoint
+
+    def _write_checkpoint(self) -> None:
+        assert self._checkpoint_path is not None
+        self._checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+        staging = self._checkpoint_path.with_name(f".{self._checkpoint_path.name}.tmp")
+        with open(staging, "w") as f:
+            json.dump(self._checkpoint, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(staging, self._checkpoint_path)
@@ -0,0 +1,48 @@
+import hmac
+from collections.abc import AsyncIterator
+
+from fastapi import Depends, Header, HTTPException, Request, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.composition.dependency_registry import DependencyRegistry
+
+
+def get_registry(request: Request) -> DependencyRegistry:
+    registry: DependencyRegistry = request.app.state.registry
+    return registry
+
+
+async def get_db_session(
+    registry: DependencyRegistry = Depends(get_registry),
+) -> AsyncIterator[AsyncSession]:
+    async with registry.get_database_session() as session:
+        yield session
+
+
+async def get_decision_read_session(
+    transaction_id: str,
+    registry: DependencyRegistry = Depends(get_registry),
+) -> AsyncIterator[AsyncSession]:
+    async with registry.get_read_session(transaction_id=transaction_id) as session:
+        yield session
+
+
+async def get_history_read_session(
+    user_id: str,
+    registry: DependencyRegistry = Depends(get_registry),
+) -> AsyncIterator[AsyncSession]:
+    async with registry.get_read_session(user_id=user_id) as session:
+        yield session
+
+
+def require_admin(
+    x_admin_token: str | None = Header(default=None),
+    registry: DependencyRegistry = Depends(get_registry),
+) -> None:
+    expected = registry.get_admin_token()
+    if expected is None:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN, detail="Admin endpoints are disabled: ADMIN_TOKEN is not set"
+        )
+    if not (x_admin_token and hmac.compare_digest(x_admin_token, expected)):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid admin token")
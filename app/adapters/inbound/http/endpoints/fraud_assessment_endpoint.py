@@ -1,12 +1,25 @@
-from datetime import datetime
+import time
 from uuid import uuid4
 
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.adapters.inbound.http.dependencies import get_db_session, get_registry
+from app.adapters.inbound.http.fast_codec import (
+    decision_payload,
+    decode_body,
+    encode_body,
+    parse_assessment_batch_request,
+    parse_assessment_request,
+    request_body_schema,
+)
+from app.adapters.inbound.http.models.fraud_assessment_batch_request import FraudAssessmentBatchRequest
+from app.adapters.inbound.http.models.fraud_assessment_batch_response import FraudAssessmentBatchResponse
 from app.adapters.inbound.http.models.fraud_assessment_request import FraudAssessmentRequest
 from app.adapters.inbound.http.models.fraud_assessment_response import FraudAssessmentResponse
+from app.application.dtos import FraudAssessmentCommand
 from app.composition.dependency_registry import DependencyRegistry
+from app.domain.exceptions import DomainException
 from app.domain.value_objects.merchant_id import MerchantId
 from app.domain.value_objects.transaction_amount import TransactionAmount
 from app.domain.value_objects.transaction_id import TransactionId
@@ -14,34 +27,45 @@ from app.domain.value_objects.user_id import UserId
 
 router = APIRouter()
 
+REPLAYED_HEADER = "Idempotent-Replayed"
+IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
+_MAX_IDEMPOTENCY_KEY_LENGTH = 255
 
-def get_registry(request: Request) -> DependencyRegistry:
-    return request.app.state.registry
 
-
-async def get_db_session(
-    registry: DependencyRegistry = Depends(get_registry),
-) -> AsyncSession:
-    session = registry.get_database_session()
-    try:
-        yield session
-    finally:
-        await session.close()
-
-
-@router.post("/assess-fraud", response_model=FraudAssessmentResponse, status_code=status.HTTP_201_CREATED)
+@router.post(
+    "/assess-fraud",
+    response_model=FraudAssessmentResponse,
+    status_code=status.HTTP_201_CREATED,
+    openapi_extra={"requestBody": request_body_schema(FraudAssessmentRequest)},
+)
 async def assess_fraud(
-    request: FraudAssessmentRequest,
+    http_request: Request,
     session: AsyncSession = Depends(get_db_session),
     registry: DependencyRegistry = Depends(get_registry),
-) -> FraudAssessmentResponse:
+) -> Response:
+    started = time.perf_counter()
+    request = parse_assessment_request(decode_body(await http_request.body(), http_request.headers.get("content-type")))
+    idempotency_key = _idempotency_key(http_request)
     try:
-        transaction_id = TransactionId.create(uuid4())
+        client_transaction_id = _client_transaction_id(request, idempotency_key)
+        transaction_id = client_transaction_id or TransactionId.create(uuid4())
         user_id = UserId.create(request.user_id)
         merchant_id = MerchantId.create(request.merchant_id)
         amount = TransactionAmount.create(request.amount)
+        registry.get_stage_metrics().observe_stage("validate", time.perf_counter() - started)
         use_case = registry.get_assess_fraud_risk_use_case(session)
-        fraud_decision = await use_case.execute(
+        accept = http_request.headers.get("accept")
+        if client_transaction_id is None:
+            fraud_decision = await use_case.execute(
+                transaction_id=transaction_id,
+                user_id=user_id,
+                merchant_id=merchant_id,
+                amount=amount,
+                timestamp=request.timestamp,
+                metadata=request.metadata,
+            )
+            return encode_body(decision_payload(fraud_decision), accept, status.HTTP_201_CREATED)
+        outcome = await use_case.execute_idempotent(
             transaction_id=transaction_id,
             user_id=user_id,
             merchant_id=merchant_id,
@@ -49,15 +73,83 @@ async def assess_fraud(
             timestamp=request.timestamp,
             metadata=request.metadata,
         )
-        return FraudAssessmentResponse(
-            transaction_id=str(fraud_decision.transaction_id.value),
-            risk_score=fraud_decision.risk_score,
-            decision=fraud_decision.decision.value,
-            timestamp=fraud_decision.timestamp,
+        if not outcome.replayed:
+            return encode_body(decision_payload(outcome.fraud_decision), accept, status.HTTP_201_CREATED)
+        response = encode_body(decision_payload(outcome.fraud_decision, replayed=True), accept)
+        response.headers[REPLAYED_HEADER] = "true"
+        return response
+    except DomainException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e),
         )
+
+
+@router.post(
+    "/assess-fraud/batch",
+    response_model=FraudAssessmentBatchResponse,
+    status_code=status.HTTP_201_CREATED,
+    openapi_extra={"requestBody": request_body_schema(FraudAssessmentBatchRequest)},
+)
+async def assess_fraud_batch(
+    http_request: Request,
+    session: AsyncSession = Depends(get_db_session),
+    registry: DependencyRegistry = Depends(get_registry),
+) -> Response:
+    started = time.perf_counter()
+    request = parse_assessment_batch_request(
+        decode_body(await http_request.body(), http_request.headers.get("content-type"))
+    )
+    try:
+        commands = [
+            FraudAssessmentCommand(
+                transaction_id=_client_transaction_id(item, None) or TransactionId.create(uuid4()),
+                user_id=UserId.create(item.user_id),
+                merchant_id=MerchantId.create(item.merchant_id),
+                amount=TransactionAmount.create(item.amount),
+                timestamp=item.timestamp,
+                metadata=item.metadata,
+            )
+            for item in request.transactions
+        ]
+        registry.get_stage_metrics().observe_stage("validate", time.perf_counter() - started)
+        use_case = registry.get_assess_fraud_risk_use_case(session)
+        accept = http_request.headers.get("accept")
+        if not any(item.transaction_id for item in request.transactions):
+            fraud_decisions = await use_case.execute_many(commands)
+            results = [decision_payload(fraud_decision) for fraud_decision in fraud_decisions]
+            return encode_body({"results": results}, accept, status.HTTP_201_CREATED)
+        outcomes = await use_case.execute_many_idempotent(commands)
+        results = [decision_payload(outcome.fraud_decision, outcome.replayed) for outcome in outcomes]
+        if not all(outcome.replayed for outcome in outcomes):
+            return encode_body({"results": results}, accept, status.HTTP_201_CREATED)
+        response = encode_body({"results": results}, accept)
+        response.headers[REPLAYED_HEADER] = "true"
+        return response
+    except DomainException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=str(e),
         )
 
+
+def _idempotency_key(http_request: Request) -> str | None:
+    idempotency_key = http_request.headers.get(IDEMPOTENCY_KEY_HEADER)
+    if idempotency_key is not None and not 0 < len(idempotency_key) <= _MAX_IDEMPOTENCY_KEY_LENGTH:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"{IDEMPOTENCY_KEY_HEADER} must be 1-{_MAX_IDEMPOTENCY_KEY_LENGTH} characters",
+        )
+    return idempotency_key
+
+
+def _client_transaction_id(request: FraudAssessmentRequest, idempotency_key: str | None) -> TransactionId | None:
+    if request.transaction_id:
+        return TransactionId.create(request.transaction_id)
+    if idempotency_key:
+        return TransactionId.from_idempotency_key(idempotency_key, scope=request.user_id)
+    return None
@@ -1,6 +1,7 @@
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.adapters.inbound.http.dependencies import get_decision_read_session, get_registry
 from app.adapters.inbound.http.models.fraud_decision_response import FraudDecisionResponse
 from app.composition.dependency_registry import DependencyRegistry
 from app.domain.value_objects.transaction_id import TransactionId
@@ -8,24 +9,10 @@ from app.domain.value_objects.transaction_id import TransactionId
 router = APIRouter()
 
 
-def get_registry(request: Request) -> DependencyRegistry:
-    return request.app.state.registry
-
-
-async def get_db_session(
-    registry: DependencyRegistry = Depends(get_registry),
-) -> AsyncSession:
-    session = registry.get_database_session()
-    try:
-        yield session
-    finally:
-        await session.close()
-
-
 @router.get("/fraud-decisions/{transaction_id}", response_model=FraudDecisionResponse)
 async def get_fraud_decision(
     transaction_id: str,
-    session: AsyncSession = Depends(get_db_session),
+    session: AsyncSession = Depends(get_decision_read_session),
     registry: DependencyRegistry = Depends(get_registry),
 ) -> FraudDecisionResponse:
     try:
@@ -37,6 +24,8 @@ async def get_fraud_decision(
             risk_score=fraud_decision.risk_score,
             decision=fraud_decision.decision.value,
             timestamp=fraud_decision.timestamp,
+            model_version=fraud_decision.model_version,
+            matched_rules=list(fraud_decision.matched_rules),
         )
     except Exception as e:
         raise HTTPException(
@@ -1,55 +1,71 @@
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+from collections.abc import AsyncIterator
+from datetime import datetime
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.adapters.inbound.http.models.fraud_history_response import (
-    FraudHistoryItem,
-    FraudHistoryResponse,
-)
+from app.adapters.inbound.http.dependencies import get_history_read_session, get_registry
+from app.adapters.inbound.http.fast_codec import encode_body, encode_ndjson, history_payloads
+from app.adapters.inbound.http.models.fraud_history_response import FraudHistoryResponse
 from app.composition.dependency_registry import DependencyRegistry
+from app.domain.entities.fraud_decision import Decision
+from app.domain.value_objects.fraud_history_filter import FraudHistoryFilter
+from app.domain.value_objects.history_cursor import HistoryCursor
 from app.domain.value_objects.user_id import UserId
 
 router = APIRouter()
 
 
-def get_registry(request: Request) -> DependencyRegistry:
-    return request.app.state.registry
-
-
-async def get_db_session(
-    registry: DependencyRegistry = Depends(get_registry),
-) -> AsyncSession:
-    session = registry.get_database_session()
-    try:
-        yield session
-    finally:
-        await session.close()
+def get_history_filter(
+    start: datetime | None = Query(default=None, description="Only decisions at or after this time"),
+    end: datetime | None = Query(default=None, description="Only decisions before this time"),
+    decision: Decision | None = Query(default=None, description="Only decisions with this outcome"),
+) -> FraudHistoryFilter:
+    return FraudHistoryFilter(start=start, end=end, decision=decision)
 
 
 @router.get("/fraud-decisions/user/{user_id}", response_model=FraudHistoryResponse)
 async def get_fraud_history(
+    http_request: Request,
     user_id: str,
-    session: AsyncSession = Depends(get_db_session),
+    limit: int = Query(default=100, ge=1, le=1000, description="Maximum decisions per page"),
+    cursor: str | None = Query(default=None, description="Cursor returned by the previous page"),
+    history_filter: FraudHistoryFilter = Depends(get_history_filter),
+    session: AsyncSession = Depends(get_history_read_session),
     registry: DependencyRegistry = Depends(get_registry),
-) -> FraudHistoryResponse:
+) -> Response:
+    page_cursor = HistoryCursor.decode(cursor) if cursor is not None else None
     try:
         uid = UserId.create(user_id)
         use_case = registry.get_retrieve_fraud_history_use_case(session)
-        decisions = await use_case.execute(uid)
-        return FraudHistoryResponse(
-            user_id=user_id,
-            decisions=[
-                FraudHistoryItem(
-                    transaction_id=str(d.transaction_id.value),
-                    risk_score=d.risk_score,
-                    decision=d.decision.value,
-                    timestamp=d.timestamp,
-                )
-                for d in decisions
-            ],
-        )
+        page = await use_case.execute_page(uid, limit, page_cursor, history_filter)
+        payload = {
+            "user_id": user_id,
+            "decisions": history_payloads(page.decisions),
+            "next_cursor": page.next_cursor.encode() if page.next_cursor is not None else None,
+        }
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=str(e),
         )
+    return encode_body(payload, http_request.headers.get("accept"))
+
+
+@router.get("/fraud-decisions/user/{user_id}/stream")
+async def stream_fraud_history(
+    user_id: str,
+    history_filter: FraudHistoryFilter = Depends(get_history_filter),
+    registry: DependencyRegistry = Depends(get_registry),
+) -> StreamingResponse:
+    uid = UserId.create(user_id)
+
+    async def ndjson_chunks() -> AsyncIterator[bytes]:
+        async with registry.get_read_session(user_id=user_id) as session:
+            use_case = registry.get_retrieve_fraud_history_use_case(session)
+            async for batch in use_case.stream(uid, history_filter):
+                yield encode_ndjson(history_payloads(batch))
+
+    return StreamingResponse(ndjson_chunks(), media_type="application/x-ndjson")
 
@@ -1,7 +1,9 @@
 from typing import TypedDict
 
-from fastapi import APIRouter, Depends, Request
+from fastapi import APIRouter, Depends
 
+from app.adapters.inbound.http.dependencies import get_registry
+from app.adapters.outbound.persistence.read_routing import ReplicaHealth
 from app.composition.dependency_registry import DependencyRegistry
 
 router = APIRouter()
@@ -11,10 +13,7 @@ class HealthStatus(TypedDict):
     status: str
     database: str
     ml_model: str
-
-
-def get_registry(request: Request) -> DependencyRegistry:
-    return request.app.state.registry
+    replicas: list[ReplicaHealth]
 
 
 @router.get("/health")
@@ -37,5 +36,6 @@ async def health_check(
         status=overall_status,
         database=database_status,
         ml_model=ml_model_status,
+        replicas=await registry.check_replica_health(),
     )
 
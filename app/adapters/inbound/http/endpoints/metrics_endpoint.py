@@ -0,0 +1,52 @@
+from typing import TypedDict
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import PlainTextResponse
+
+from app.adapters.inbound.http.dependencies import get_registry
+from app.adapters.outbound.cache.idempotency_index import IdempotencyIndexStats
+from app.adapters.outbound.cache.in_memory_decision_cache import DecisionCacheStats
+from app.adapters.outbound.feature_store.cached_feature_store import FeatureCacheStats
+from app.adapters.outbound.feature_store.velocity_index import VelocityIndexStats
+from app.adapters.outbound.ml.inference_executor import InferenceExecutorStats
+from app.adapters.outbound.ml.micro_batcher import MicroBatcherStats
+from app.adapters.outbound.persistence.database import DatabasePoolStats
+from app.composition.dependency_registry import DependencyRegistry
+
+router = APIRouter()
+
+
+class MetricsResponse(TypedDict):
+    scoring_batcher: MicroBatcherStats | None
+    inference_executor: InferenceExecutorStats
+    feature_store_cache: FeatureCacheStats
+    velocity_index: VelocityIndexStats | None
+    decision_cache: DecisionCacheStats
+    idempotency_index: IdempotencyIndexStats
+    database_pool: DatabasePoolStats
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics(
+    registry: DependencyRegistry = Depends(get_registry),
+) -> PlainTextResponse:
+    return PlainTextResponse(
+        registry.get_metrics().registry.render(),
+        media_type="text/plain; version=0.0.4",
+    )
+
+
+@router.get("/metrics/summary")
+async def get_metrics_summary(
+    registry: DependencyRegistry = Depends(get_registry),
+) -> MetricsResponse:
+    velocity_index = registry.get_velocity_index()
+    return MetricsResponse(
+        scoring_batcher=registry.get_fraud_scoring_service().batching_stats(),
+        inference_executor=registry.get_fraud_scoring_service().inference_stats(),
+        feature_store_cache=registry.get_feature_store().stats(),
+        velocity_index=velocity_index.stats() if velocity_index is not None else None,
+        decision_cache=registry.get_decision_cache().stats(),
+        idempotency_index=registry.get_idempotency_index().stats(),
+        database_pool=registry.get_database_pool_stats(),
+    )
@@ -0,0 +1,55 @@
+from typing import TypedDict
+
+from fastapi import APIRouter, Depends, HTTPException, status
+
+from app.adapters.inbound.http.dependencies import get_registry, require_admin
+from app.adapters.inbound.http.models.model_reload_request import ModelReloadRequest
+from app.adapters.outbound.ml.model_manager import ModelStatus
+from app.adapters.outbound.ml.model_registry import ModelVersionMetadata
+from app.adapters.outbound.ml.shadow_scorer import ShadowStats
+from app.composition.dependency_registry import DependencyRegistry
+
+router = APIRouter(prefix="/admin/model", dependencies=[Depends(require_admin)])
+
+
+class ModelOverviewResponse(TypedDict):
+    status: ModelStatus
+    versions: list[ModelVersionMetadata]
+
+
+@router.get("")
+async def get_model(
+    registry: DependencyRegistry = Depends(get_registry),
+) -> ModelOverviewResponse:
+    manager = registry.get_model_manager()
+    model_registry = manager.registry
+    return ModelOverviewResponse(
+        status=manager.status(),
+        versions=model_registry.versions() if model_registry is not None else [],
+    )
+
+
+@router.post("/reload")
+async def reload_model(
+    request: ModelReloadRequest | None = None,
+    registry: DependencyRegistry = Depends(get_registry),
+) -> ModelStatus:
+    version = request.version if request is not None else None
+    return await registry.get_model_manager().reload(version)
+
+
+@router.post("/rollback")
+async def rollback_model(
+    registry: DependencyRegistry = Depends(get_registry),
+) -> ModelStatus:
+    return await registry.get_model_manager().rollback()
+
+
+@router.get("/shadow")
+async def get_shadow_stats(
+    registry: DependencyRegistry = Depends(get_registry),
+) -> ShadowStats:
+    stats = registry.get_fraud_scoring_service().shadow_stats()
+    if stats is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Shadow scoring is not enabled")
+    return stats
@@ -0,0 +1,52 @@
+from typing import Any, TypedDict
+
+from fastapi import APIRouter, Depends
+
+from app.adapters.inbound.http.dependencies import get_registry, require_admin
+from app.adapters.outbound.rules.rule_set_manager import RuleSetStatus
+from app.composition.dependency_registry import DependencyRegistry
+
+router = APIRouter(prefix="/admin/rules", dependencies=[Depends(require_admin)])
+
+
+class RuleSummary(TypedDict):
+    id: str
+    description: str
+    conditions: list[dict[str, Any]]
+    adjust: float
+    decision: str | None
+
+
+class RuleSetResponse(TypedDict):
+    status: RuleSetStatus
+    rules: list[RuleSummary]
+
+
+@router.get("")
+async def get_rules(
+    registry: DependencyRegistry = Depends(get_registry),
+) -> RuleSetResponse:
+    manager = registry.get_rule_set_manager()
+    return RuleSetResponse(
+        status=manager.status(),
+        rules=[
+            RuleSummary(
+                id=rule.id,
+                description=rule.description,
+                conditions=[
+                    {"field": condition.field, "op": condition.op, "value": condition.value}
+                    for condition in rule.conditions
+                ],
+                adjust=rule.adjustment,
+                decision=rule.decision.value if rule.decision is not None else None,
+            )
+            for rule in manager.engine.rule_set.rules
+        ],
+    )
+
+
+@router.post("/reload")
+async def reload_rules(
+    registry: DependencyRegistry = Depends(get_registry),
+) -> RuleSetStatus:
+    return await registry.get_rule_set_manager().reload()
@@ -4,6 +4,7 @@ from fastapi.responses import JSONResponse
 from app.domain.exceptions import (
     DomainException,
     FraudDecisionNotFoundError,
+    IdempotencyConflictError,
     InvalidMerchantIdError,
     InvalidTransactionAmountError,
     InvalidTransactionIdError,
@@ -15,6 +16,8 @@ async def domain_exception_handler(request: Request, exc: DomainException) -> JS
     status_code = status.HTTP_400_BAD_REQUEST
     if isinstance(exc, FraudDecisionNotFoundError):
         status_code = status.HTTP_404_NOT_FOUND
+    elif isinstance(exc, IdempotencyConflictError):
+        status_code = status.HTTP_409_CONFLICT
     return JSONResponse(
         status_code=status_code,
         content={"error": exc.__class__.__name__, "message": str(exc)},
@@ -0,0 +1,149 @@
+import json
+from datetime import datetime
+from typing import Any, TypeVar
+
+from fastapi import HTTPException, status
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import Response
+from pydantic import BaseModel, ValidationError
+
+from app.adapters.inbound.http.models.fraud_assessment_batch_request import FraudAssessmentBatchRequest
+from app.adapters.inbound.http.models.fraud_assessment_request import FraudAssessmentRequest
+from app.domain.entities.fraud_decision import FraudDecision
+from app.domain.entities.fraud_decision_batch import FraudDecisionBatch
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import msgpack  # type: ignore[import-untyped]
+except ImportError:
+    msgpack = None
+
+RequestModel = TypeVar("RequestModel", bound=BaseModel)
+
+JSON_MEDIA_TYPE = "application/json"
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+MSGPACK_MEDIA_TYPES = (MSGPACK_MEDIA_TYPE, "application/x-msgpack")
+
+
+def decode_body(body: bytes, content_type: str | None) -> Any:
+    media_type = (content_type or JSON_MEDIA_TYPE).split(";", 1)[0].strip().lower()
+    if media_type in MSGPACK_MEDIA_TYPES:
+        if msgpack is None:
+            raise HTTPException(
+                status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+                detail="msgpack bodies need the msgpack package",
+            )
+        try:
+            return msgpack.unpackb(body, timestamp=3)
+        except ValueError as e:
+            raise _body_error("value_error", "Invalid msgpack body", str(e))
+    if media_type != JSON_MEDIA_TYPE and not media_type.endswith("+json"):
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail=f"Unsupported content type: {media_type}",
+        )
+    try:
+        return orjson.loads(body) if orjson is not None else json.loads(body)
+    except ValueError as e:
+        raise _body_error("json_invalid", "JSON decode error", str(e))
+
+
+def encode_body(payload: Any, accept: str | None, status_code: int = status.HTTP_200_OK) -> Response:
+    if accept and msgpack is not None and any(media_type in accept for media_type in MSGPACK_MEDIA_TYPES):
+        content = msgpack.packb(payload, default=_isoformat)
+        return Response(content, status_code=status_code, media_type=MSGPACK_MEDIA_TYPE)
+    if orjson is not None:
+        content = orjson.dumps(payload)
+    else:
+        content = json.dumps(payload, default=_isoformat, separators=(",", ":"), ensure_ascii=False).encode()
+    return Response(content, status_code=status_code, media_type=JSON_MEDIA_TYPE)
+
+
+def parse_assessment_request(data: Any) -> FraudAssessmentRequest:
+    return _validate(FraudAssessmentRequest, data)
+
+
+def parse_assessment_batch_request(data: Any) -> FraudAssessmentBatchRequest:
+    return _validate(FraudAssessmentBatchRequest, data)
+
+
+def decision_payload(fraud_decision: FraudDecision, replayed: bool = False) -> dict[str, Any]:
+    return {
+        "transaction_id": str(fraud_decision.transaction_id.value),
+        "risk_score": fraud_decision.risk_score,
+        "decision": fraud_decision.decision.value,
+        "timestamp": fraud_decision.timestamp,
+        "model_version": fraud_decision.model_version,
+        "matched_rules": list(fraud_decision.matched_rules),
+        "replayed": replayed,
+    }
+
+
+def history_payloads(batch: FraudDecisionBatch) -> list[dict[str, Any]]:
+    return [
+        {
+            "transaction_id": transaction_id,
+            "risk_score": risk_score,
+            "decision": decision,
+            "timestamp": timestamp,
+            "model_version": model_version,
+            "matched_rules": list(matched_rules),
+        }
+        for transaction_id, risk_score, decision, timestamp, model_version, matched_rules in batch.rows()
+    ]
+
+
+def encode_ndjson(payloads: list[dict[str, Any]]) -> bytes:
+    if orjson is not None:
+        return b"".join(orjson.dumps(payload, option=orjson.OPT_APPEND_NEWLINE) for payload in payloads)
+    return "".join(
+        json.dumps(payload, default=_isoformat, separators=(",", ":"), ensure_ascii=False) + "\n"
+        for payload in payloads
+    ).encode()
+
+
+def request_body_schema(model: type[BaseModel]) -> dict[str, Any]:
+    schema = model.model_json_schema()
+    definitions = schema.pop("$defs", {})
+    schema = _inline_refs(schema, definitions)
+    return {
+        "required": True,
+        "content": {JSON_MEDIA_TYPE: {"schema": schema}, MSGPACK_MEDIA_TYPE: {"schema": schema}},
+    }
+
+
+def _inline_refs(node: Any, definitions: dict[str, Any]) -> Any:
+    if isinstance(node, dict):
+        ref = node.get("$ref")
+        if isinstance(ref, str) and ref.startswith("#/$defs/"):
+            return _inline_refs(definitions[ref.rsplit("/", 1)[1]], definitions)
+        return {key: _inline_refs(value, definitions) for key, value in node.items()}
+    if isinstance(node, list):
+        return [_inline_refs(value, definitions) for value in node]
+    return node
+
+
+def _validate(model: type[RequestModel], data: Any) -> RequestModel:
+    try:
+        return model.model_validate(data)
+    except ValidationError as e:
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in e.errors(include_url=False)],
+            body=data,
+        )
+
+
+def _body_error(error_type: str, message: str, detail: str) -> RequestValidationError:
+    return RequestValidationError(
+        [{"type": error_type, "loc": ("body", 0), "msg": message, "input": {}, "ctx": {"error": detail}}]
+    )
+
+
+def _isoformat(value: Any) -> str:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
@@ -0,0 +1,61 @@
+import time
+from collections.abc import Callable
+from typing import Any
+
+from starlette.routing import BaseRoute
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.adapters.outbound.metrics.service_metrics import ServiceMetrics
+
+_UNMATCHED = "unmatched"
+
+
+class MetricsMiddleware:
+    def __init__(self, app: ASGIApp, get_metrics: Callable[[Scope], ServiceMetrics | None]) -> None:
+        self._app = app
+        self._get_metrics = get_metrics
+        self._routes: dict[Any, str] | None = None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self._app(scope, receive, send)
+            return
+        metrics = self._get_metrics(scope)
+        if metrics is None:
+            await self._app(scope, receive, send)
+            return
+        status_code = 500
+        started = time.perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self._app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            method = scope["method"]
+            route = self._route(scope)
+            metrics.http_request_duration.labels(method, route).observe(elapsed)
+            metrics.http_requests.inc((method, route, str(status_code)))
+
+    def _route(self, scope: Scope) -> str:
+        endpoint = scope.get("endpoint")
+        if endpoint is None:
+            return _UNMATCHED
+        if self._routes is None:
+            self._routes = _route_templates(scope["app"].routes)
+        return self._routes.get(endpoint, _UNMATCHED)
+
+
+def _route_templates(routes: list[BaseRoute]) -> dict[Any, str]:
+    templates: dict[Any, str] = {}
+    for route in routes:
+        endpoint = getattr(route, "endpoint", None)
+        path = getattr(route, "path", None)
+        if endpoint is not None and path is not None:
+            templates[endpoint] = path
+    return templates
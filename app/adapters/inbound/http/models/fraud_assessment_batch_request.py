@@ -0,0 +1,11 @@
+from pydantic import BaseModel, Field
+
+from app.adapters.inbound.http.models.fraud_assessment_request import FraudAssessmentRequest
+
+
+class FraudAssessmentBatchRequest(BaseModel):
+    transactions: list[FraudAssessmentRequest] = Field(
+        min_length=1,
+        max_length=10000,
+        description="Transactions to assess",
+    )
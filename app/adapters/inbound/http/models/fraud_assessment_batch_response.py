@@ -0,0 +1,7 @@
+from pydantic import BaseModel, Field
+
+from app.adapters.inbound.http.models.fraud_assessment_response import FraudAssessmentResponse
+
+
+class FraudAssessmentBatchResponse(BaseModel):
+    results: list[FraudAssessmentResponse] = Field(description="Fraud assessments in request order")
@@ -10,4 +10,8 @@ class FraudAssessmentRequest(BaseModel):
     merchant_id: str = Field(min_length=1, max_length=100, description="Merchant ID")
     timestamp: datetime = Field(description="Transaction timestamp")
     metadata: dict[str, str] | None = Field(default=None, description="Optional transaction metadata")
+    transaction_id: str | None = Field(
+        default=None,
+        description="Client-assigned transaction UUID; resubmitting it returns the original decision",
+    )
 
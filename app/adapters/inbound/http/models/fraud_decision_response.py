@@ -1,11 +1,15 @@
 from datetime import datetime
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class FraudDecisionResponse(BaseModel):
+    model_config = ConfigDict(protected_namespaces=())
+
     transaction_id: str = Field(description="Transaction ID")
     risk_score: float = Field(ge=0.0, le=1.0, description="Fraud risk score")
     decision: str = Field(description="Fraud decision")
     timestamp: datetime = Field(description="Decision timestamp")
+    model_version: str | None = Field(default=None, description="Model version that produced the score")
+    matched_rules: list[str] = Field(default_factory=list, description="Risk rules that matched the transaction")
 
@@ -0,0 +1,8 @@
+from pydantic import BaseModel, Field
+
+
+class ModelReloadRequest(BaseModel):
+    version: str | None = Field(
+        default=None,
+        description="Registry version to activate; omit to reload the currently active version",
+    )
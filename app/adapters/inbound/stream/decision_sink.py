@@ -0,0 +1,42 @@
+import os
+import sys
+from pathlib import Path
+from typing import Any, BinaryIO
+
+from app.adapters.inbound.http.fast_codec import encode_ndjson
+
+
+class NdjsonDecisionSink:
+    def __init__(self, path: str | None = None, fsync: bool = True) -> None:
+        self._path = Path(path) if path and path != "-" else None
+        self._fsync = fsync and self._path is not None
+        self._file: BinaryIO | None = None
+        self._written = 0
+
+    @property
+    def written(self) -> int:
+        return self._written
+
+    def write(self, records: list[dict[str, Any]]) -> None:
+        if not records:
+            return
+        file = self._open()
+        file.write(encode_ndjson(records))
+        file.flush()
+        if self._fsync:
+            os.fsync(file.fileno())
+        self._written += len(records)
+
+    def close(self) -> None:
+        if self._file is not None and self._path is not None:
+            self._file.close()
+        self._file = None
+
+    def _open(self) -> BinaryIO:
+        if self._file is None:
+            if self._path is None:
+                self._file = sys.stdout.buffer
+            else:
+                self._path.parent.mkdir(parents=True, exist_ok=True)
+                self._file = open(self._path, "ab")
+        return self._file
@@ -0,0 +1,173 @@
+import asyncio
+import os
+import sys
+import threading
+from pathlib import Path
+from typing import BinaryIO
+
+from app.domain.ports.transaction_queue_port import QueueMessage
+
+QUEUE_LOG_FILE = "transactions.ndjson"
+QUEUE_OFFSET_FILE = "consumer.offset"
+
+
+class NdjsonFileQueue:
+    def __init__(
+        self,
+        path: str,
+        checkpoint_path: str | None = None,
+        follow: bool = False,
+        poll_interval_seconds: float = 0.2,
+    ) -> None:
+        self._path = Path(path)
+        self._checkpoint_path = Path(checkpoint_path) if checkpoint_path else None
+        self._follow = follow
+        self._poll_interval = poll_interval_seconds
+        self._file: BinaryIO | None = None
+        self._committed = self._read_checkpoint()
+        self._offset = self._committed
+
+    @property
+    def committed_offset(self) -> int:
+        return self._committed
+
+    async def receive(self, max_messages: int, timeout_seconds: float) -> list[QueueMessage] | None:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout_seconds
+        while True:
+            messages, at_end = await asyncio.to_thread(self._read, max_messages)
+            if messages:
+                return messages
+            if at_end and not self._follow:
+                return None
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return []
+            await asyncio.sleep(min(self._poll_interval, remaining))
+
+    async def commit(self, offset: int) -> None:
+        if self._checkpoint_path is not None:
+            await asyncio.to_thread(self._write_checkpoint, offset)
+        self._committed = offset
+
+    async def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _read(self, max_messages: int) -> tuple[list[QueueMessage], bool]:
+        if self._file is None:
+            if not self._path.exists():
+                return [], True
+            self._file = open(self._path, "rb")
+        self._file.seek(self._offset)
+        messages: list[QueueMessage] = []
+        while len(messages) < max_messages:
+            line = self._file.readline()
+            if not line:
+                return messages, True
+            if not line.endswith(b"\n") and self._follow:
+                return messages, True
+            self._offset += len(line)
+            if line.strip():
+                messages.append((self._offset, line))
+        return messages, False
+
+    def _read_checkpoint(self) -> int:
+        if self._checkpoint_path is None or not self._checkpoint_path.exists():
+            return 0
+        return int(self._checkpoint_path.read_text().strip() or 0)
+
+    def _write_checkpoint(self, offset: int) -> None:
+        assert self._checkpoint_path is not None
+        self._checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+        staging = self._checkpoint_path.with_name(f".{self._checkpoint_path.name}.tmp")
+        with open(staging, "w") as f:
+            f.write(str(offset))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(staging, self._checkpoint_path)
+
+
+class FileBackedQueue(NdjsonFileQueue):
+    def __init__(self, directory: str, poll_interval_seconds: float = 0.2) -> None:
+        self._directory = Path(directory)
+        self._publish_lock = threading.Lock()
+        super().__init__(
+            str(self._directory / QUEUE_LOG_FILE),
+            checkpoint_path=str(self._directory / QUEUE_OFFSET_FILE),
+            follow=True,
+            poll_interval_seconds=poll_interval_seconds,
+        )
+
+    def publish(self, payloads: list[bytes]) -> int:
+        data = b"".join(payload.rstrip(b"\n") + b"\n" for payload in payloads)
+        with self._publish_lock:
+            self._directory.mkdir(parents=True, exist_ok=True)
+            with open(self._path, "ab") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+                return f.tell()
+
+    def lag(self) -> int:
+        return (self._path.stat().st_size if self._path.exists() else 0) - self._read_checkpoint()
+
+
+class StdinQueue:
+    def __init__(self, stream: BinaryIO | None = None, max_buffered: int = 10000) -> None:
+        self._stream = stream if stream is not None else sys.stdin.buffer
+        self._max_buffered = max_buffered
+        self._buffer: asyncio.Queue[QueueMessage | None] | None = None
+        self._exhausted = False
+        self._committed = 0
+
+    @property
+    def committed_offset(self) -> int:
+        return self._committed
+
+    async def receive(self, max_messages: int, timeout_seconds: float) -> list[QueueMessage] | None:
+        if self._exhausted:
+            return None
+        buffer = self._buffer
+        if buffer is None:
+            buffer = self._buffer = asyncio.Queue(self._max_buffered)
+            threading.Thread(
+                target=self._pump, args=(asyncio.get_running_loop(), buffer), name="stdin-queue", daemon=True
+            ).start()
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout_seconds
+        messages: list[QueueMessage] = []
+        while len(messages) < max_messages:
+            try:
+                item = buffer.get_nowait()
+            except asyncio.QueueEmpty:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    return messages
+                try:
+                    item = await asyncio.wait_for(buffer.get(), remaining)
+                except asyncio.TimeoutError:
+                    return messages
+            if item is None:
+                self._exhausted = True
+                return messages or None
+            messages.append(item)
+        return messages
+
+    async def commit(self, offset: int) -> None:
+        self._committed = offset
+
+    async def close(self) -> None:
+        self._exhausted = True
+
+    def _pump(self, loop: asyncio.AbstractEventLoop, buffer: "asyncio.Queue[QueueMessage | None]") -> None:
+        offset = 0
+        try:
+            for line in self._stream:
+                offset += len(line)
+                if line.strip():
+                    asyncio.run_coroutine_threadsafe(buffer.put((offset, line)), loop).result()
+            asyncio.run_coroutine_threadsafe(buffer.put(None), loop).result()
+        except RuntimeError:
+            return
@@ -0,0 +1,200 @@
+import asyncio
+from collections import deque
+from typing import Any, TypedDict
+
+from app.adapters.inbound.http.fast_codec import decision_payload
+from app.adapters.inbound.http.models.fraud_assessment_request import FraudAssessmentRequest
+from app.adapters.inbound.stream.decision_sink import NdjsonDecisionSink
+from app.adapters.outbound.logging.logger import LoggerPort
+from app.application.dtos import FraudAssessmentCommand, FraudAssessmentOutcome
+from app.composition.dependency_registry import DependencyRegistry
+from app.domain.exceptions import DomainException
+from app.domain.ports.transaction_queue_port import QueueMessage, TransactionQueuePort
+from app.domain.value_objects.merchant_id import MerchantId
+from app.domain.value_objects.transaction_amount import TransactionAmount
+from app.domain.value_objects.transaction_id import TransactionId
+from app.domain.value_objects.user_id import UserId
+
+BatchResult = tuple[int, list[dict[str, Any]]]
+
+
+class StreamConsumerStats(TypedDict):
+    stream: str
+    received: int
+    assessed: int
+    replayed: int
+    rejected: int
+    batches: int
+    in_flight: int
+    retries: int
+    committed_offset: int
+
+
+class StreamConsumer:
+    def __init__(
+        self,
+        queue: TransactionQueuePort,
+        registry: DependencyRegistry,
+        sink: NdjsonDecisionSink,
+        logger: LoggerPort,
+        stream_name: str,
+        batch_size: int = 500,
+        max_in_flight: int = 4,
+        linger_ms: float = 50.0,
+        max_retries: int = 3,
+        retry_backoff_seconds: float = 0.5,
+    ) -> None:
+        self._queue = queue
+        self._registry = registry
+        self._sink = sink
+        self._logger = logger
+        self._stream_name = stream_name
+        self._batch_size = batch_size
+        self._max_in_flight = max_in_flight
+        self._linger = linger_ms / 1000
+        self._max_retries = max_retries
+        self._retry_backoff = retry_backoff_seconds
+        self._stopping = asyncio.Event()
+        self._pending: deque[asyncio.Task[BatchResult]] = deque()
+        self._received = 0
+        self._assessed = 0
+        self._replayed = 0
+        self._rejected = 0
+        self._batches = 0
+        self._retries = 0
+        self._committed_offset = queue.committed_offset
+
+    def stop(self) -> None:
+        self._stopping.set()
+
+    def stats(self) -> StreamConsumerStats:
+        return StreamConsumerStats(
+            stream=self._stream_name,
+            received=self._received,
+            assessed=self._assessed,
+            replayed=self._replayed,
+            rejected=self._rejected,
+            batches=self._batches,
+            in_flight=len(self._pending),
+            retries=self._retries,
+            committed_offset=self._committed_offset,
+        )
+
+    async def run(self) -> StreamConsumerStats:
+        pending = self._pending
+        try:
+            while not self._stopping.is_set():
+                messages = await self._queue.receive(self._batch_size, self._linger)
+                if messages is None:
+                    break
+                if messages:
+                    self._received += len(messages)
+                    while len(pending) >= self._max_in_flight:
+                        await self._complete(pending.popleft())
+                    pending.append(asyncio.create_task(self._process(messages)))
+                while pending and pending[0].done():
+                    await self._complete(pending.popleft())
+            while pending:
+                await self._complete(pending.popleft())
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            pending.clear()
+        self._logger.info("Stream consumer stopped", **self.stats())
+        return self.stats()
+
+    async def _complete(self, task: "asyncio.Task[BatchResult]") -> None:
+        offset, records = await task
+        await asyncio.to_thread(self._sink.write, records)
+        await self._queue.commit(offset)
+        self._committed_offset = offset
+        self._batches += 1
+        for record in records:
+            if "error" in record:
+                self._rejected += 1
+            elif record["replayed"]:
+                self._replayed += 1
+            else:
+                self._assessed += 1
+
+    async def _process(self, messages: list[QueueMessage]) -> BatchResult:
+        records: list[dict[str, Any]] = [{} for _ in messages]
+        commands: list[FraudAssessmentCommand] = []
+        indices: list[int] = []
+        for index, (offset, payload) in enumerate(messages):
+            try:
+                commands.append(self._command(offset, payload))
+                indices.append(index)
+            except (DomainException, ValueError) as e:
+                records[index] = _rejection(offset, e)
+        outcomes = await self._assess_with_retries(commands)
+        for index, outcome in zip(indices, outcomes):
+            offset = messages[index][0]
+            if isinstance(outcome, DomainException):
+                records[index] = _rejection(offset, outcome)
+            else:
+                records[index] = {**decision_payload(outcome.fraud_decision, outcome.replayed), "offset": offset}
+        return messages[-1][0], records
+
+    def _command(self, offset: int, payload: bytes) -> FraudAssessmentCommand:
+        request = FraudAssessmentRequest.model_validate_json(payload)
+        if request.transaction_id:
+            transaction_id = TransactionId.create(request.transaction_id)
+        else:
+            transaction_id = TransactionId.from_idempotency_key(
+                f"{self._stream_name}:{offset}", scope=request.user_id
+            )
+        return FraudAssessmentCommand(
+            transaction_id=transaction_id,
+            user_id=UserId.create(request.user_id),
+            merchant_id=MerchantId.create(request.merchant_id),
+            amount=TransactionAmount.create(request.amount),
+            timestamp=request.timestamp,
+            metadata=request.metadata,
+        )
+
+    async def _assess_with_retries(
+        self, commands: list[FraudAssessmentCommand]
+    ) -> list[FraudAssessmentOutcome | DomainException]:
+        if not commands:
+            return []
+        attempt = 0
+        while True:
+            try:
+                return await self._assess(commands)
+            except Exception as e:
+                if attempt >= self._max_retries:
+                    raise
+                attempt += 1
+                self._retries += 1
+                self._logger.error(
+                    "Stream batch failed, retrying", attempt=attempt, rows=len(commands), error=str(e)
+                )
+                await asyncio.sleep(self._retry_backoff * 2 ** (attempt - 1))
+
+    async def _assess(self, commands: list[FraudAssessmentCommand]) -> list[FraudAssessmentOutcome | DomainException]:
+        try:
+            return list(await self._execute(commands))
+        except DomainException as e:
+            if len(commands) == 1:
+                return [e]
+        results: list[FraudAssessmentOutcome | DomainException] = []
+        for command in commands:
+            try:
+                results.extend(await self._execute([command]))
+            except DomainException as e:
+                results.append(e)
+        return results
+
+    async def _execute(self, commands: list[FraudAssessmentCommand]) -> list[FraudAssessmentOutcome]:
+        session = self._registry.get_database_session()
+        try:
+            use_case = self._registry.get_assess_fraud_risk_use_case(session)
+            return await use_case.execute_many_idempotent(commands)
+        finally:
+            await session.close()
+
+
+def _rejection(offset: int, error: Exception) -> dict[str, Any]:
+    return {"offset": offset, "error": type(error).__name__, "message": str(error)}
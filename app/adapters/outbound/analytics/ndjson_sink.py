@@ -0,0 +1,44 @@
+import json
+import threading
+from pathlib import Path
+from typing import Any, TextIO
+
+
+class NdjsonAnalyticsSink:
+    def __init__(self, path: str, flush_every: int = 1000) -> None:
+        self._path = Path(path)
+        self._flush_every = flush_every
+        self._lock = threading.Lock()
+        self._file: TextIO | None = None
+        self._unflushed = 0
+        self._written = 0
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @property
+    def written(self) -> int:
+        return self._written
+
+    def write_many(self, records: list[dict[str, Any]]) -> None:
+        if not records:
+            return
+        payload = "".join(json.dumps(record, separators=(",", ":")) + "\n" for record in records)
+        with self._lock:
+            if self._file is None:
+                self._path.parent.mkdir(parents=True, exist_ok=True)
+                self._file = open(self._path, "a", encoding="utf-8")
+            self._file.write(payload)
+            self._written += len(records)
+            self._unflushed += len(records)
+            if self._unflushed >= self._flush_every:
+                self._file.flush()
+                self._unflushed = 0
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+                self._unflushed = 0
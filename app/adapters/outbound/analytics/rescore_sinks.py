@@ -0,0 +1,173 @@
+import asyncio
+import csv
+import io
+import os
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, BinaryIO, Protocol
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.adapters.outbound.persistence.repositories.rescored_decision_repository import RescoredDecisionRepository
+
+try:
+    import pyarrow  # type: ignore[import-untyped]
+    import pyarrow.parquet  # type: ignore[import-untyped]
+except ImportError:
+    pyarrow = None
+
+RESCORE_COLUMNS = (
+    "run_id",
+    "transaction_id",
+    "risk_score",
+    "decision",
+    "model_version",
+    "matched_rules",
+    "previous_risk_score",
+    "previous_decision",
+    "previous_model_version",
+    "scored_at",
+)
+
+
+class RescoreSink(Protocol):
+    def position(self) -> int:
+        ...
+
+    async def restore(self, position: int) -> None:
+        ...
+
+    async def write(self, rows: list[dict[str, Any]]) -> None:
+        ...
+
+    async def close(self) -> None:
+        ...
+
+
+class CsvRescoreSink:
+    def __init__(self, path: str) -> None:
+        self._path = Path(path)
+        self._file: BinaryIO | None = None
+
+    def position(self) -> int:
+        return self._file.tell() if self._file is not None else 0
+
+    async def restore(self, position: int) -> None:
+        await asyncio.to_thread(self._open, position)
+
+    async def write(self, rows: list[dict[str, Any]]) -> None:
+        if rows:
+            await asyncio.to_thread(self._write, rows)
+
+    async def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _open(self, position: int) -> BinaryIO:
+        if self._file is None:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self._path, "a+b")
+        self._file.truncate(position)
+        self._file.seek(position)
+        if position == 0:
+            self._file.write(_csv_lines([dict(zip(RESCORE_COLUMNS, RESCORE_COLUMNS))]))
+        return self._file
+
+    def _write(self, rows: list[dict[str, Any]]) -> None:
+        file = self._file if self._file is not None else self._open(0)
+        file.write(_csv_lines([{**row, "matched_rules": ";".join(row["matched_rules"] or ())} for row in rows]))
+        file.flush()
+        os.fsync(file.fileno())
+
+
+class ParquetRescoreSink:
+    def __init__(self, directory: str) -> None:
+        if pyarrow is None:
+            raise RuntimeError("Parquet output needs the pyarrow package")
+        self._directory = Path(directory)
+        self._parts = 0
+
+    def position(self) -> int:
+        return self._parts
+
+    async def restore(self, position: int) -> None:
+        await asyncio.to_thread(self._restore, position)
+
+    async def write(self, rows: list[dict[str, Any]]) -> None:
+        if rows:
+            await asyncio.to_thread(self._write, rows)
+
+    async def close(self) -> None:
+        pass
+
+    def _restore(self, position: int) -> None:
+        self._directory.mkdir(parents=True, exist_ok=True)
+        for part in self._directory.glob("part-*.parquet"):
+            if int(part.stem.split("-", 1)[1]) >= position:
+                part.unlink()
+        self._parts = position
+
+    def _write(self, rows: list[dict[str, Any]]) -> None:
+        self._directory.mkdir(parents=True, exist_ok=True)
+        table = pyarrow.Table.from_pylist(rows, schema=_parquet_schema())
+        path = self._directory / f"part-{self._parts:06d}.parquet"
+        staging = path.with_name(f".{path.name}.tmp")
+        pyarrow.parquet.write_table(table, staging)
+        os.replace(staging, path)
+        self._parts += 1
+
+
+class TableRescoreSink:
+    def __init__(self, session_factory: Callable[[], AsyncSession]) -> None:
+        self._session_factory = session_factory
+
+    def position(self) -> int:
+        return 0
+
+    async def restore(self, position: int) -> None:
+        pass
+
+    async def write(self, rows: list[dict[str, Any]]) -> None:
+        session = self._session_factory()
+        try:
+            await RescoredDecisionRepository(session).save_many(rows)
+        finally:
+            await session.close()
+
+    async def close(self) -> None:
+        pass
+
+
+def create_rescore_sink(output: str, session_factory: Callable[[], AsyncSession]) -> RescoreSink:
+    if output == "table":
+        return TableRescoreSink(session_factory)
+    if output.endswith(".csv"):
+        return CsvRescoreSink(output)
+    if output.endswith(".parquet"):
+        return ParquetRescoreSink(output)
+    raise ValueError(f"Unknown rescore output {output!r}: use 'table', a .csv file or a .parquet directory")
+
+
+def _csv_lines(rows: list[dict[str, Any]]) -> bytes:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=RESCORE_COLUMNS, lineterminator="\n")
+    writer.writerows(rows)
+    return buffer.getvalue().encode()
+
+
+def _parquet_schema() -> Any:
+    return pyarrow.schema(
+        [
+            ("run_id", pyarrow.string()),
+            ("transaction_id", pyarrow.string()),
+            ("risk_score", pyarrow.float64()),
+            ("decision", pyarrow.string()),
+            ("model_version", pyarrow.string()),
+            ("matched_rules", pyarrow.list_(pyarrow.string())),
+            ("previous_risk_score", pyarrow.float64()),
+            ("previous_decision", pyarrow.string()),
+            ("previous_model_version", pyarrow.string()),
+            ("scored_at", pyarrow.timestamp("us")),
+        ]
+    )
@@ -0,0 +1,97 @@
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import TypedDict
+
+from app.domain.entities.fraud_decision import FraudDecision
+from app.domain.exceptions import IdempotencyConflictError
+from app.domain.ports.idempotency_index_port import IdempotencyIndexPort
+from app.domain.value_objects.transaction_id import TransactionId
+
+Fingerprint = tuple[Hashable, ...]
+
+
+class IdempotencyIndexStats(TypedDict):
+    size: int
+    max_entries: int
+    in_flight: int
+    replayed: int
+    coalesced: int
+    conflicts: int
+    evictions: int
+
+
+class InMemoryIdempotencyIndex:
+    def __init__(self, max_entries: int, ttl_seconds: float) -> None:
+        self._max_entries = max_entries
+        self._ttl = ttl_seconds
+        self._completed: OrderedDict[TransactionId, tuple[float, Fingerprint, FraudDecision]] = OrderedDict()
+        self._in_flight: dict[TransactionId, tuple[Fingerprint, asyncio.Future[FraudDecision]]] = {}
+        self._replayed = 0
+        self._coalesced = 0
+        self._conflicts = 0
+        self._evictions = 0
+
+    def claim(self, transaction_id: TransactionId, fingerprint: Fingerprint) -> "asyncio.Future[FraudDecision] | None":
+        completed = self._completed.get(transaction_id)
+        if completed is not None:
+            expires_at, stored, fraud_decision = completed
+            if expires_at >= time.monotonic():
+                self._check(transaction_id, stored, fingerprint)
+                self._completed.move_to_end(transaction_id)
+                self._replayed += 1
+                future: asyncio.Future[FraudDecision] = asyncio.get_running_loop().create_future()
+                future.set_result(fraud_decision)
+                return future
+            del self._completed[transaction_id]
+        in_flight = self._in_flight.get(transaction_id)
+        if in_flight is not None:
+            self._check(transaction_id, in_flight[0], fingerprint)
+            self._coalesced += 1
+            return in_flight[1]
+        self._in_flight[transaction_id] = (fingerprint, asyncio.get_running_loop().create_future())
+        return None
+
+    def resolve(self, transaction_id: TransactionId, fraud_decision: FraudDecision) -> None:
+        in_flight = self._in_flight.pop(transaction_id, None)
+        if in_flight is None:
+            return
+        fingerprint, future = in_flight
+        self._completed[transaction_id] = (time.monotonic() + self._ttl, fingerprint, fraud_decision)
+        self._completed.move_to_end(transaction_id)
+        while len(self._completed) > self._max_entries:
+            self._completed.popitem(last=False)
+            self._evictions += 1
+        if not future.done():
+            future.set_result(fraud_decision)
+
+    def fail(self, transaction_id: TransactionId, error: BaseException) -> None:
+        in_flight = self._in_flight.pop(transaction_id, None)
+        if in_flight is None or in_flight[1].done():
+            return
+        future = in_flight[1]
+        if isinstance(error, asyncio.CancelledError):
+            future.cancel()
+            return
+        future.set_exception(error)
+        future.exception()
+
+    def stats(self) -> IdempotencyIndexStats:
+        return IdempotencyIndexStats(
+            size=len(self._completed),
+            max_entries=self._max_entries,
+            in_flight=len(self._in_flight),
+            replayed=self._replayed,
+            coalesced=self._coalesced,
+            conflicts=self._conflicts,
+            evictions=self._evictions,
+        )
+
+    def _check(self, transaction_id: TransactionId, stored: Fingerprint, fingerprint: Fingerprint) -> None:
+        if stored != fingerprint:
+            self._conflicts += 1
+            raise IdempotencyConflictError(
+                f"Transaction {transaction_id} was already submitted with a different payload"
+            )
+
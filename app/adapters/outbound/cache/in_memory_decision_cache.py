@@ -0,0 +1,60 @@
+import time
+from collections import OrderedDict
+from typing import TypedDict
+
+from app.domain.entities.fraud_decision import FraudDecision
+from app.domain.ports.decision_cache_port import DecisionCachePort
+from app.domain.value_objects.transaction_id import TransactionId
+
+
+class DecisionCacheStats(TypedDict):
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    max_entries: int
+
+
+class InMemoryDecisionCache:
+    def __init__(self, max_entries: int, ttl_seconds: float) -> None:
+        self._max_entries = max_entries
+        self._ttl = ttl_seconds
+        self._entries: OrderedDict[TransactionId, tuple[float, FraudDecision]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    async def get(self, transaction_id: TransactionId) -> FraudDecision | None:
+        entry = self._entries.get(transaction_id)
+        if entry is None or entry[0] < time.monotonic():
+            if entry is not None:
+                del self._entries[transaction_id]
+            self._misses += 1
+            return None
+        self._entries.move_to_end(transaction_id)
+        self._hits += 1
+        return entry[1]
+
+    async def put(self, fraud_decision: FraudDecision) -> None:
+        self._store(fraud_decision, time.monotonic() + self._ttl)
+
+    async def put_many(self, fraud_decisions: list[FraudDecision]) -> None:
+        expires_at = time.monotonic() + self._ttl
+        for fraud_decision in fraud_decisions:
+            self._store(fraud_decision, expires_at)
+
+    def stats(self) -> DecisionCacheStats:
+        return DecisionCacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            size=len(self._entries),
+            max_entries=self._max_entries,
+        )
+
+    def _store(self, fraud_decision: FraudDecision, expires_at: float) -> None:
+        self._entries[fraud_decision.transaction_id] = (expires_at, fraud_decision)
+        self._entries.move_to_end(fraud_decision.transaction_id)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self._evictions += 1
@@ -11,4 +11,57 @@ class Settings(BaseSettings):
     database_url: str
     model_path: str = "app/adapters/outbound/ml/models/model.pkl"
     log_level: str = "INFO"
+    database_pool_size: int = 10
+    database_max_overflow: int = 20
+    database_pool_timeout_seconds: float = 30.0
+    database_pool_pre_ping: bool = True
+    database_pool_recycle_seconds: int = 1800
+    database_statement_cache_size: int = 500
+    database_prepared_statements: bool = True
+    database_prepare_threshold: int = 5
+    database_replica_urls: list[str] = []
+    database_read_your_writes_seconds: float = 5.0
+    database_read_your_writes_max_keys: int = 100000
+    database_replica_health_interval_seconds: float = 10.0
+    model_compiled_inference: bool = True
+    model_registry_path: str | None = None
+    model_registry_poll_seconds: float = 5.0
+    model_shadow_versions: list[str] = []
+    model_shadow_workers: int = 1
+    model_shadow_queue_size: int = 10000
+    model_shadow_batch_size: int = 256
+    model_shadow_sink_path: str = "data/shadow_scores.ndjson"
+    model_canary_version: str | None = None
+    model_canary_percent: float = 0.0
+    risk_rules_path: str | None = None
+    risk_rules_poll_seconds: float = 5.0
+    admin_token: str | None = None
+    feature_store_cache_size: int = 100000
+    feature_store_cache_ttl_seconds: float = 60.0
+    velocity_features_enabled: bool = False
+    velocity_index_max_keys: int = 200000
+    decision_cache_size: int = 100000
+    decision_cache_ttl_seconds: float = 300.0
+    idempotency_index_size: int = 100000
+    idempotency_ttl_seconds: float = 86400.0
+    scoring_max_batch_size: int = 32
+    scoring_max_wait_us: int = 500
+    inference_executor: str = "thread"
+    inference_workers: int = 4
+    inference_max_pending: int = 1024
+    inference_sla_ms: float = 0.0
+    inference_fallback_score: float = 0.5
+    inference_shared_memory_rows: int = 1024
+    write_behind_enabled: bool = False
+    write_behind_queue_size: int = 10000
+    write_behind_batch_size: int = 500
+    write_behind_flush_interval_ms: int = 50
+    write_behind_spill_path: str = "data/write_behind_spill.ndjson"
+    write_behind_dead_letter_path: str = "data/write_behind_dead_letter.ndjson"
+    write_behind_max_attempts: int = 3
+    write_behind_max_retry_delay_seconds: float = 30.0
+    stream_batch_size: int = 500
+    stream_max_in_flight: int = 4
+    stream_linger_ms: float = 50.0
+    stream_max_retries: int = 3
 
@@ -0,0 +1,72 @@
+import time
+from collections import OrderedDict
+from typing import TypedDict
+
+from app.domain.entities.transaction import Transaction
+from app.domain.ports.feature_store_port import FeatureStorePort
+
+
+class FeatureCacheStats(TypedDict):
+    hits: int
+    misses: int
+    size: int
+
+
+class CachedFeatureStore:
+    def __init__(self, inner: FeatureStorePort, max_entries: int, ttl_seconds: float) -> None:
+        self._inner = inner
+        self._max_entries = max_entries
+        self._ttl = ttl_seconds
+        self._entries: OrderedDict[tuple[str, str], tuple[float, dict[str, float]]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    async def get_features(self, transaction: Transaction) -> dict[str, float]:
+        key = _cache_key(transaction)
+        cached = self._lookup(key)
+        if cached is not None:
+            return cached
+        features = await self._inner.get_features(transaction)
+        self._store(key, features)
+        return features
+
+    async def get_features_many(self, transactions: list[Transaction]) -> list[dict[str, float]]:
+        results: list[dict[str, float] | None] = []
+        missing: list[Transaction] = []
+        for transaction in transactions:
+            cached = self._lookup(_cache_key(transaction))
+            results.append(cached)
+            if cached is None:
+                missing.append(transaction)
+        if missing:
+            fetched = iter(await self._inner.get_features_many(missing))
+            for index, transaction in enumerate(transactions):
+                if results[index] is None:
+                    features = next(fetched)
+                    self._store(_cache_key(transaction), features)
+                    results[index] = features
+        return [features or {} for features in results]
+
+    def stats(self) -> FeatureCacheStats:
+        return FeatureCacheStats(hits=self._hits, misses=self._misses, size=len(self._entries))
+
+    def _lookup(self, key: tuple[str, str]) -> dict[str, float] | None:
+        entry = self._entries.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+            self._misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return entry[1]
+
+    def _store(self, key: tuple[str, str], features: dict[str, float]) -> None:
+        self._entries[key] = (time.monotonic() + self._ttl, features)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+
+def _cache_key(transaction: Transaction) -> tuple[str, str]:
+    return (transaction.user_id.value, transaction.merchant_id.value)
@@ -0,0 +1,20 @@
+from app.domain.entities.transaction import Transaction
+from app.domain.ports.feature_store_port import FeatureStorePort
+
+
+class CompositeFeatureStore:
+    def __init__(self, stores: list[FeatureStorePort]) -> None:
+        self._stores = stores
+
+    async def get_features(self, transaction: Transaction) -> dict[str, float]:
+        features: dict[str, float] = {}
+        for store in self._stores:
+            features.update(await store.get_features(transaction))
+        return features
+
+    async def get_features_many(self, transactions: list[Transaction]) -> list[dict[str, float]]:
+        merged: list[dict[str, float]] = [{} for _ in transactions]
+        for store in self._stores:
+            for features, fetched in zip(merged, await store.get_features_many(transactions)):
+                features.update(fetched)
+        return merged
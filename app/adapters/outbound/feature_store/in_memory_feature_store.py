@@ -0,0 +1,24 @@
+from app.domain.entities.transaction import Transaction
+from app.domain.ports.feature_store_port import FeatureStorePort
+from app.domain.value_objects.merchant_id import MerchantId
+from app.domain.value_objects.user_id import UserId
+
+
+class InMemoryFeatureStore:
+    def __init__(self) -> None:
+        self._user_features: dict[str, dict[str, float]] = {}
+        self._merchant_features: dict[str, dict[str, float]] = {}
+
+    def put_user_features(self, user_id: UserId, features: dict[str, float]) -> None:
+        self._user_features[user_id.value] = dict(features)
+
+    def put_merchant_features(self, merchant_id: MerchantId, features: dict[str, float]) -> None:
+        self._merchant_features[merchant_id.value] = dict(features)
+
+    async def get_features(self, transaction: Transaction) -> dict[str, float]:
+        features = dict(self._merchant_features.get(transaction.merchant_id.value, {}))
+        features.update(self._user_features.get(transaction.user_id.value, {}))
+        return features
+
+    async def get_features_many(self, transactions: list[Transaction]) -> list[dict[str, float]]:
+        return [await self.get_features(transaction) for transaction in transactions]
@@ -0,0 +1,131 @@
+from array import array
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import TypedDict
+
+from app.adapters.outbound.ml.feature_pipeline import STORE, FeatureDefinition
+from app.domain.entities.transaction import Transaction
+from app.domain.ports.feature_store_port import FeatureStorePort
+from app.domain.ports.velocity_index_port import VelocityIndexPort
+
+WINDOWS: tuple[tuple[str, int, int], ...] = (
+    ("1m", 5, 12),
+    ("1h", 300, 12),
+    ("24h", 3600, 24),
+)
+SCOPES = ("user", "merchant")
+
+VELOCITY_FEATURES: tuple[FeatureDefinition, ...] = tuple(
+    FeatureDefinition(name=f"{scope}_{metric}_{window}", source=STORE, key=f"{scope}_{metric}_{window}")
+    for scope in SCOPES
+    for window, _, _ in WINDOWS
+    for metric in ("count", "sum")
+)
+
+
+class VelocityIndexStats(TypedDict):
+    keys: int
+    max_keys: int
+    evictions: int
+    recorded: int
+
+
+class _Window:
+    __slots__ = ("_width", "_size", "_buckets", "_counts", "_sums")
+
+    def __init__(self, width: int, size: int) -> None:
+        self._width = width
+        self._size = size
+        self._buckets = array("q", [-1] * size)
+        self._counts = array("l", [0] * size)
+        self._sums = array("d", [0.0] * size)
+
+    def add(self, epoch: float, amount: float) -> None:
+        bucket = int(epoch // self._width)
+        slot = bucket % self._size
+        current = self._buckets[slot]
+        if current == bucket:
+            self._counts[slot] += 1
+            self._sums[slot] += amount
+        elif current < bucket:
+            self._buckets[slot] = bucket
+            self._counts[slot] = 1
+            self._sums[slot] = amount
+
+    def totals(self, epoch: float) -> tuple[int, float]:
+        newest = int(epoch // self._width)
+        oldest = newest - self._size
+        count = 0
+        total = 0.0
+        for slot in range(self._size):
+            if oldest < self._buckets[slot] <= newest:
+                count += self._counts[slot]
+                total += self._sums[slot]
+        return count, total
+
+
+class SlidingWindowIndex:
+    def __init__(self, max_keys: int) -> None:
+        self._max_keys = max_keys
+        self._entries: OrderedDict[tuple[str, str], tuple[_Window, ...]] = OrderedDict()
+        self._evictions = 0
+        self._recorded = 0
+
+    def record(self, transaction: Transaction) -> None:
+        epoch = _epoch(transaction.timestamp)
+        amount = float(transaction.amount.value)
+        for key in _keys(transaction):
+            for window in self._windows(key):
+                window.add(epoch, amount)
+        self._recorded += 1
+
+    def record_many(self, transactions: list[Transaction]) -> None:
+        for transaction in transactions:
+            self.record(transaction)
+
+    def snapshot(self, transaction: Transaction) -> dict[str, float]:
+        epoch = _epoch(transaction.timestamp)
+        features: dict[str, float] = {}
+        for scope, value in _keys(transaction):
+            windows = self._entries.get((scope, value))
+            for (name, _, _), window in zip(WINDOWS, windows or (None,) * len(WINDOWS)):
+                count, total = window.totals(epoch) if window is not None else (0, 0.0)
+                features[f"{scope}_count_{name}"] = float(count)
+                features[f"{scope}_sum_{name}"] = total
+        return features
+
+    async def get_features(self, transaction: Transaction) -> dict[str, float]:
+        return self.snapshot(transaction)
+
+    async def get_features_many(self, transactions: list[Transaction]) -> list[dict[str, float]]:
+        return [self.snapshot(transaction) for transaction in transactions]
+
+    def stats(self) -> VelocityIndexStats:
+        return VelocityIndexStats(
+            keys=len(self._entries),
+            max_keys=self._max_keys,
+            evictions=self._evictions,
+            recorded=self._recorded,
+        )
+
+    def _windows(self, key: tuple[str, str]) -> tuple[_Window, ...]:
+        windows = self._entries.get(key)
+        if windows is None:
+            windows = tuple(_Window(width, size) for _, width, size in WINDOWS)
+            self._entries[key] = windows
+            if len(self._entries) > self._max_keys:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+        else:
+            self._entries.move_to_end(key)
+        return windows
+
+
+def _keys(transaction: Transaction) -> tuple[tuple[str, str], tuple[str, str]]:
+    return (("user", transaction.user_id.value), ("merchant", transaction.merchant_id.value))
+
+
+def _epoch(timestamp: datetime) -> float:
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    return timestamp.timestamp()
@@ -0,0 +1,90 @@
+import threading
+from bisect import bisect_left
+from collections.abc import Sequence
+from typing import TypedDict
+
+LATENCY_BUCKETS_SECONDS: tuple[float, ...] = (
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+class HistogramSnapshot(TypedDict):
+    count: int
+    sum: float
+    buckets: list[tuple[float, int]]
+    p50: float | None
+    p95: float | None
+    p99: float | None
+
+
+class Histogram:
+    def __init__(self, buckets: Sequence[float] = LATENCY_BUCKETS_SECONDS) -> None:
+        bounds = tuple(sorted(buckets))
+        if not bounds:
+            raise ValueError("Histogram requires at least one bucket")
+        self._bounds = bounds
+        self._counts = [0] * (len(bounds) + 1)
+        self._count = 0
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def bounds(self) -> tuple[float, ...]:
+        return self._bounds
+
+    def observe(self, value: float) -> None:
+        index = bisect_left(self._bounds, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._count += 1
+            self._sum += value
+
+    def snapshot(self) -> HistogramSnapshot:
+        with self._lock:
+            counts = list(self._counts)
+            count = self._count
+            total = self._sum
+        cumulative: list[tuple[float, int]] = []
+        running = 0
+        for bound, bucket_count in zip(self._bounds, counts):
+            running += bucket_count
+            cumulative.append((bound, running))
+        return HistogramSnapshot(
+            count=count,
+            sum=total,
+            buckets=cumulative,
+            p50=_quantile(cumulative, count, 0.50),
+            p95=_quantile(cumulative, count, 0.95),
+            p99=_quantile(cumulative, count, 0.99),
+        )
+
+
+def _quantile(cumulative: list[tuple[float, int]], count: int, quantile: float) -> float | None:
+    if count == 0:
+        return None
+    rank = quantile * count
+    lower_bound = 0.0
+    lower_count = 0
+    for bound, running in cumulative:
+        if running >= rank:
+            in_bucket = running - lower_count
+            fraction = (rank - lower_count) / in_bucket if in_bucket else 1.0
+            return lower_bound + (bound - lower_bound) * fraction
+        lower_bound = bound
+        lower_count = running
+    return lower_bound
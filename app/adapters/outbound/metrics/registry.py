@@ -0,0 +1,135 @@
+from collections.abc import Callable, Iterable, Sequence
+
+from app.adapters.outbound.metrics.histogram import LATENCY_BUCKETS_SECONDS, Histogram
+
+Labels = tuple[str, ...]
+Sample = tuple[Labels, float]
+Collector = Callable[[], Iterable[Sample]]
+
+SIZE_BUCKETS: tuple[float, ...] = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024, 4096, 10000)
+SCORE_DELTA_BUCKETS: tuple[float, ...] = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.2, 0.3, 0.5, 0.75, 1.0)
+
+
+class CounterFamily:
+    def __init__(self, name: str, description: str, label_names: Labels) -> None:
+        self.name = name
+        self.description = description
+        self.label_names = label_names
+        self._values: dict[Labels, float] = {}
+
+    def inc(self, labels: Labels = (), amount: float = 1.0) -> None:
+        self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def samples(self) -> list[Sample]:
+        return list(self._values.items())
+
+
+class HistogramFamily:
+    def __init__(self, name: str, description: str, label_names: Labels, buckets: Sequence[float]) -> None:
+        self.name = name
+        self.description = description
+        self.label_names = label_names
+        self._buckets = tuple(buckets)
+        self._children: dict[Labels, Histogram] = {}
+
+    def labels(self, *values: str) -> Histogram:
+        child = self._children.get(values)
+        if child is None:
+            child = self._children.setdefault(values, Histogram(self._buckets))
+        return child
+
+    def attach(self, labels: Labels, histogram: Histogram) -> None:
+        self._children[labels] = histogram
+
+    def observe(self, value: float, labels: Labels = ()) -> None:
+        self.labels(*labels).observe(value)
+
+    def children(self) -> list[tuple[Labels, Histogram]]:
+        return list(self._children.items())
+
+
+class GaugeFamily:
+    def __init__(self, name: str, description: str, label_names: Labels, collect: Collector) -> None:
+        self.name = name
+        self.description = description
+        self.label_names = label_names
+        self.collect = collect
+
+
+class MetricsRegistry:
+    def __init__(self, namespace: str = "securetransaction") -> None:
+        self._namespace = namespace
+        self._counters: list[CounterFamily] = []
+        self._histograms: list[HistogramFamily] = []
+        self._gauges: list[GaugeFamily] = []
+
+    def counter(self, name: str, description: str, label_names: Labels = ()) -> CounterFamily:
+        family = CounterFamily(self._qualify(name), description, label_names)
+        self._counters.append(family)
+        return family
+
+    def histogram(
+        self,
+        name: str,
+        description: str,
+        label_names: Labels = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS_SECONDS,
+    ) -> HistogramFamily:
+        family = HistogramFamily(self._qualify(name), description, label_names, buckets)
+        self._histograms.append(family)
+        return family
+
+    def gauge(self, name: str, description: str, collect: Collector, label_names: Labels = ()) -> GaugeFamily:
+        family = GaugeFamily(self._qualify(name), description, label_names, collect)
+        self._gauges.append(family)
+        return family
+
+    def render(self) -> str:
+        lines: list[str] = []
+        for counter in self._counters:
+            lines.append(f"# HELP {counter.name} {counter.description}")
+            lines.append(f"# TYPE {counter.name} counter")
+            for labels, value in counter.samples():
+                lines.append(f"{counter.name}{_labels(counter.label_names, labels)} {_number(value)}")
+        for family in self._histograms:
+            lines.append(f"# HELP {family.name} {family.description}")
+            lines.append(f"# TYPE {family.name} histogram")
+            for labels, histogram in family.children():
+                snapshot = histogram.snapshot()
+                for bound, cumulative in snapshot["buckets"]:
+                    lines.append(
+                        f"{family.name}_bucket"
+                        f"{_labels(family.label_names + ('le',), labels + (_number(bound),))} {cumulative}"
+                    )
+                lines.append(
+                    f"{family.name}_bucket{_labels(family.label_names + ('le',), labels + ('+Inf',))} "
+                    f"{snapshot['count']}"
+                )
+                lines.append(f"{family.name}_sum{_labels(family.label_names, labels)} {_number(snapshot['sum'])}")
+                lines.append(f"{family.name}_count{_labels(family.label_names, labels)} {snapshot['count']}")
+        for gauge in self._gauges:
+            lines.append(f"# HELP {gauge.name} {gauge.description}")
+            lines.append(f"# TYPE {gauge.name} gauge")
+            for labels, value in gauge.collect():
+                lines.append(f"{gauge.name}{_labels(gauge.label_names, labels)} {_number(value)}")
+        return "\n".join(lines) + "\n"
+
+    def _qualify(self, name: str) -> str:
+        return f"{self._namespace}_{name}" if self._namespace else name
+
+
+def _labels(names: Labels, values: Labels) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+    return "{" + pairs + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _number(value: float) -> str:
+    if value == int(value) and abs(value) < 1e15:
+        return str(int(value))
+    return repr(float(value))
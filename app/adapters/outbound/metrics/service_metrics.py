@@ -0,0 +1,41 @@
+from app.adapters.outbound.metrics.registry import SCORE_DELTA_BUCKETS, SIZE_BUCKETS, MetricsRegistry
+from app.adapters.outbound.metrics.stage_metrics import StageMetrics
+
+
+class ServiceMetrics:
+    def __init__(self, registry: MetricsRegistry) -> None:
+        self.registry = registry
+        self.http_requests = registry.counter(
+            "http_requests_total",
+            "HTTP requests by method, route and status code",
+            ("method", "route", "status"),
+        )
+        self.http_request_duration = registry.histogram(
+            "http_request_duration_seconds",
+            "HTTP request latency by method and route",
+            ("method", "route"),
+        )
+        self.assessment_stage_duration = registry.histogram(
+            "assessment_stage_duration_seconds",
+            "Time spent in each stage of a fraud assessment",
+            ("stage",),
+        )
+        self.model_inference_duration = registry.histogram(
+            "model_inference_duration_seconds",
+            "Time spent in a single model predict_proba call",
+        ).labels()
+        self.scoring_batch_size = registry.histogram(
+            "scoring_batch_size",
+            "Rows scored per model call",
+            buckets=SIZE_BUCKETS,
+        ).labels()
+        self.shadow_inference_duration = registry.histogram(
+            "shadow_inference_duration_seconds",
+            "Time spent scoring a batch with a shadow candidate model",
+        ).labels()
+        self.shadow_score_delta = registry.histogram(
+            "shadow_score_delta",
+            "Absolute difference between shadow candidate and served model scores",
+            buckets=SCORE_DELTA_BUCKETS,
+        ).labels()
+        self.stages = StageMetrics(self.assessment_stage_duration)
@@ -0,0 +1,9 @@
+from app.adapters.outbound.metrics.registry import HistogramFamily
+
+
+class StageMetrics:
+    def __init__(self, histogram: HistogramFamily) -> None:
+        self._histogram = histogram
+
+    def observe_stage(self, stage: str, seconds: float) -> None:
+        self._histogram.labels(stage).observe(seconds)
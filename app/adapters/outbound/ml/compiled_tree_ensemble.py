@@ -0,0 +1,313 @@
+import json
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+from sklearn.ensemble import GradientBoostingClassifier
+
+_LEAF = -1
+_MAGIC = b"STCTE001"
+_HEADER_SIZE = 8
+_ALIGNMENT = 64
+_ARRAYS = ("feature", "threshold", "left", "right", "missing", "value", "roots")
+
+IndexArray = npt.NDArray[np.integer[Any]]
+FloatArray = npt.NDArray[np.floating[Any]]
+
+
+class CompiledTreeEnsemble:
+    def __init__(
+        self,
+        feature: IndexArray,
+        threshold: FloatArray,
+        left: IndexArray,
+        right: IndexArray,
+        missing: IndexArray,
+        value: FloatArray,
+        roots: IndexArray,
+        max_depth: int,
+        base_score: float,
+        strict: bool,
+        n_features: int,
+    ) -> None:
+        self._feature = np.ascontiguousarray(feature, dtype=np.int32)
+        self._threshold = np.ascontiguousarray(threshold, dtype=np.float64)
+        self._left = np.ascontiguousarray(left, dtype=np.int32)
+        self._right = np.ascontiguousarray(right, dtype=np.int32)
+        self._missing = np.ascontiguousarray(missing, dtype=np.int32)
+        self._value = np.ascontiguousarray(value, dtype=np.float64)
+        self._roots = np.ascontiguousarray(roots, dtype=np.int32)
+        self._max_depth = max_depth
+        self._base_score = base_score
+        self._strict = strict
+        self._n_features = n_features
+
+    @classmethod
+    def from_model(cls, model: Any) -> "CompiledTreeEnsemble":
+        if isinstance(model, GradientBoostingClassifier):
+            return cls._from_sklearn(model)
+        if hasattr(model, "get_booster"):
+            return cls._from_xgboost(model)
+        raise ValueError(f"Unsupported model type for compilation: {type(model).__name__}")
+
+    @property
+    def n_features(self) -> int:
+        return self._n_features
+
+    @property
+    def n_trees(self) -> int:
+        return len(self._roots)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(getattr(self, f"_{name}").nbytes for name in _ARRAYS)
+
+    def save(self, path: str | Path) -> None:
+        arrays = {name: getattr(self, f"_{name}") for name in _ARRAYS}
+        layout: dict[str, dict[str, Any]] = {}
+        offset = 0
+        for name, array in arrays.items():
+            layout[name] = {"dtype": array.dtype.str, "shape": list(array.shape), "offset": offset}
+            offset = _align(offset + array.nbytes)
+        header = json.dumps(
+            {
+                "max_depth": self._max_depth,
+                "base_score": self._base_score,
+                "strict": self._strict,
+                "n_features": self._n_features,
+                "arrays": layout,
+            }
+        ).encode()
+        data_start = _align(len(_MAGIC) + _HEADER_SIZE + len(header))
+        target = Path(path)
+        staging = target.with_name(f".{target.name}.tmp")
+        with open(staging, "wb") as f:
+            f.write(_MAGIC)
+            f.write(len(header).to_bytes(_HEADER_SIZE, "little"))
+            f.write(header)
+            for name, array in arrays.items():
+                f.seek(data_start + layout[name]["offset"])
+                f.write(np.ascontiguousarray(array).tobytes())
+        staging.replace(target)
+
+    @classmethod
+    def load(cls, path: str | Path, mmap: bool = True) -> "CompiledTreeEnsemble":
+        buffer: Any = np.memmap(path, dtype=np.uint8, mode="r") if mmap else np.fromfile(path, dtype=np.uint8)
+        if bytes(buffer[: len(_MAGIC)]) != _MAGIC:
+            raise ValueError(f"Not a compiled tree ensemble file: {path}")
+        header_end = len(_MAGIC) + _HEADER_SIZE
+        header_length = int.from_bytes(bytes(buffer[len(_MAGIC) : header_end]), "little")
+        header = json.loads(bytes(buffer[header_end : header_end + header_length]))
+        data_start = _align(header_end + header_length)
+        arrays = {}
+        for name in _ARRAYS:
+            spec = header["arrays"][name]
+            dtype = np.dtype(spec["dtype"])
+            count = int(np.prod(spec["shape"]))
+            arrays[name] = np.frombuffer(
+                buffer, dtype=dtype, count=count, offset=data_start + spec["offset"]
+            ).reshape(spec["shape"])
+        return cls(
+            **arrays,
+            max_depth=header["max_depth"],
+            base_score=header["base_score"],
+            strict=header["strict"],
+            n_features=header["n_features"],
+        )
+
+    def predict_proba(self, X: Any) -> npt.NDArray[np.float64]:
+        margin = self.decision_function(X)
+        positive = 1.0 / (1.0 + np.exp(-margin))
+        return np.column_stack([1.0 - positive, positive])
+
+    def decision_function(self, X: Any) -> npt.NDArray[np.float64]:
+        features = np.asarray(X, dtype=np.float32).astype(np.float64)
+        if features.ndim == 1:
+            features = features.reshape(1, -1)
+        if features.shape[1] != self._n_features:
+            raise ValueError(
+                f"Expected {self._n_features} features, got {features.shape[1]}"
+            )
+        nodes = np.broadcast_to(self._roots, (features.shape[0], len(self._roots))).copy()
+        rows = np.arange(features.shape[0])[:, None]
+        for _ in range(self._max_depth):
+            x = features[rows, self._feature[nodes]]
+            threshold = self._threshold[nodes]
+            go_left = x < threshold if self._strict else x <= threshold
+            nodes = np.where(
+                np.isnan(x),
+                self._missing[nodes],
+                np.where(go_left, self._left[nodes], self._right[nodes]),
+            )
+        margin: npt.NDArray[np.float64] = self._base_score + self._value[nodes].sum(axis=1)
+        return margin
+
+    def max_abs_error(self, model: Any, X: npt.NDArray[np.float64]) -> float:
+        expected = np.asarray(model.predict_proba(X))[:, 1]
+        actual = self.predict_proba(X)[:, 1]
+        return float(np.max(np.abs(expected - actual)))
+
+    def parity_probe(self, n_rows: int = 512, seed: int = 0) -> npt.NDArray[np.float64]:
+        rng = np.random.default_rng(seed)
+        probe = np.zeros((n_rows, self._n_features), dtype=np.float64)
+        split_nodes = self._left != np.arange(len(self._left))
+        for column in range(self._n_features):
+            thresholds = self._threshold[split_nodes & (self._feature == column)]
+            if len(thresholds) == 0:
+                probe[:, column] = rng.normal(size=n_rows)
+                continue
+            picked = rng.choice(thresholds, size=n_rows)
+            jitter = rng.choice([-1e-3, 0.0, 1e-3], size=n_rows)
+            probe[:, column] = picked + jitter * np.maximum(np.abs(picked), 1.0)
+        return probe
+
+    @classmethod
+    def _from_sklearn(cls, model: GradientBoostingClassifier) -> "CompiledTreeEnsemble":
+        if getattr(model, "n_classes_", 0) != 2 or model.estimators_.shape[1] != 1:
+            raise ValueError("Only binary GradientBoostingClassifier models can be compiled")
+        if getattr(model, "loss", "log_loss") not in ("log_loss", "deviance"):
+            raise ValueError(f"Unsupported GradientBoostingClassifier loss: {model.loss}")
+        n_features = int(model.n_features_in_)
+        base_score = float(model._raw_predict_init(np.zeros((1, n_features)))[0, 0])
+        builder = _ArrayBuilder()
+        for estimator in model.estimators_[:, 0]:
+            tree = estimator.tree_
+            is_leaf = tree.children_left == _LEAF
+            missing_left = getattr(tree, "missing_go_to_left", None)
+            local = np.arange(tree.node_count)
+            builder.add_tree(
+                feature=np.where(is_leaf, 0, tree.feature),
+                threshold=np.where(is_leaf, 0.0, tree.threshold),
+                left=np.where(is_leaf, local, tree.children_left),
+                right=np.where(is_leaf, local, tree.children_right),
+                missing=np.where(
+                    is_leaf,
+                    local,
+                    np.where(missing_left.astype(bool), tree.children_left, tree.children_right)
+                    if missing_left is not None
+                    else tree.children_right,
+                ),
+                value=np.where(is_leaf, tree.value[:, 0, 0] * model.learning_rate, 0.0),
+                depth=int(tree.max_depth),
+            )
+        return builder.build(base_score=base_score, strict=False, n_features=n_features)
+
+    @classmethod
+    def _from_xgboost(cls, model: Any) -> "CompiledTreeEnsemble":
+        booster = model.get_booster()
+        config = json.loads(booster.save_config())
+        learner = config["learner"]
+        if learner["objective"]["name"] != "binary:logistic":
+            raise ValueError(f"Unsupported XGBoost objective: {learner['objective']['name']}")
+        if learner["gradient_booster"]["name"] != "gbtree":
+            raise ValueError(f"Unsupported XGBoost booster: {learner['gradient_booster']['name']}")
+        base_probability = float(str(learner["learner_model_param"]["base_score"]).strip("[]"))
+        base_score = float(np.log(base_probability / (1.0 - base_probability)))
+        n_features = int(learner["learner_model_param"]["num_feature"])
+        feature_names = booster.feature_names
+        feature_index = {name: i for i, name in enumerate(feature_names)} if feature_names else None
+
+        dumps = booster.get_dump(dump_format="json")
+        best_iteration = booster.attr("best_iteration")
+        if best_iteration is not None:
+            trees_per_round = int(
+                learner["gradient_booster"]["gbtree_model_param"].get("num_parallel_tree", 1)
+            )
+            dumps = dumps[: (int(best_iteration) + 1) * trees_per_round]
+
+        builder = _ArrayBuilder()
+        for dump in dumps:
+            nodes: dict[int, tuple[dict[str, Any], int]] = {}
+            _collect_xgboost_nodes(json.loads(dump), nodes, 0)
+            size = max(nodes) + 1
+            feature = np.zeros(size, dtype=np.int64)
+            threshold = np.zeros(size, dtype=np.float64)
+            left = np.arange(size)
+            right = np.arange(size)
+            missing = np.arange(size)
+            value = np.zeros(size, dtype=np.float64)
+            depth = 0
+            for node_id, (node, node_depth) in nodes.items():
+                depth = max(depth, node_depth)
+                if "leaf" in node:
+                    value[node_id] = float(np.float32(node["leaf"]))
+                    continue
+                if "split_condition" not in node:
+                    raise ValueError("Categorical XGBoost splits cannot be compiled")
+                split = node["split"]
+                feature[node_id] = feature_index[split] if feature_index else int(str(split).lstrip("f"))
+                threshold[node_id] = float(np.float32(node["split_condition"]))
+                left[node_id] = node["yes"]
+                right[node_id] = node["no"]
+                missing[node_id] = node["missing"]
+            builder.add_tree(
+                feature=feature,
+                threshold=threshold,
+                left=left,
+                right=right,
+                missing=missing,
+                value=value,
+                depth=depth,
+            )
+        return builder.build(base_score=base_score, strict=True, n_features=n_features)
+
+
+class _ArrayBuilder:
+    def __init__(self) -> None:
+        self._feature: list[IndexArray] = []
+        self._threshold: list[FloatArray] = []
+        self._left: list[IndexArray] = []
+        self._right: list[IndexArray] = []
+        self._missing: list[IndexArray] = []
+        self._value: list[FloatArray] = []
+        self._roots: list[int] = []
+        self._offset = 0
+        self._max_depth = 0
+
+    def add_tree(
+        self,
+        feature: IndexArray,
+        threshold: FloatArray,
+        left: IndexArray,
+        right: IndexArray,
+        missing: IndexArray,
+        value: FloatArray,
+        depth: int,
+    ) -> None:
+        self._roots.append(self._offset)
+        self._feature.append(np.asarray(feature))
+        self._threshold.append(np.asarray(threshold))
+        self._left.append(np.asarray(left) + self._offset)
+        self._right.append(np.asarray(right) + self._offset)
+        self._missing.append(np.asarray(missing) + self._offset)
+        self._value.append(np.asarray(value))
+        self._offset += len(feature)
+        self._max_depth = max(self._max_depth, depth)
+
+    def build(self, base_score: float, strict: bool, n_features: int) -> CompiledTreeEnsemble:
+        if not self._roots:
+            raise ValueError("Model has no trees to compile")
+        return CompiledTreeEnsemble(
+            feature=np.concatenate(self._feature),
+            threshold=np.concatenate(self._threshold),
+            left=np.concatenate(self._left),
+            right=np.concatenate(self._right),
+            missing=np.concatenate(self._missing),
+            value=np.concatenate(self._value),
+            roots=np.array(self._roots),
+            max_depth=self._max_depth,
+            base_score=base_score,
+            strict=strict,
+            n_features=n_features,
+        )
+
+
+def _align(offset: int) -> int:
+    return (offset + _ALIGNMENT - 1) // _ALIGNMENT * _ALIGNMENT
+
+
+def _collect_xgboost_nodes(node: dict[str, Any], nodes: dict[int, tuple[dict[str, Any], int]], depth: int) -> None:
+    nodes[int(node["nodeid"])] = (node, depth)
+    for child in node.get("children", []):
+        _collect_xgboost_nodes(child, nodes, depth + 1)
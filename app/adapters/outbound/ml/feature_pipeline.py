@@ -0,0 +1,123 @@
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+from app.domain.entities.transaction import Transaction
+
+Extractor = Callable[[Transaction, Mapping[str, float]], float]
+
+AMOUNT = "amount"
+HOUR = "hour"
+DAY_OF_WEEK = "day_of_week"
+METADATA_PRESENT = "metadata_present"
+STORE = "store"
+
+_NO_ENRICHMENT: Mapping[str, float] = {}
+
+
+@dataclass(frozen=True)
+class FeatureDefinition:
+    name: str
+    source: str
+    key: str | None = None
+    default: float = 0.0
+
+
+DEFAULT_FEATURES: tuple[FeatureDefinition, ...] = (
+    FeatureDefinition(name="amount", source=AMOUNT),
+    FeatureDefinition(name="hour", source=HOUR),
+    FeatureDefinition(name="day_of_week", source=DAY_OF_WEEK),
+    FeatureDefinition(name="has_ip_address", source=METADATA_PRESENT, key="ip_address"),
+    FeatureDefinition(name="has_device_id", source=METADATA_PRESENT, key="device_id"),
+)
+
+
+class FeaturePipeline:
+    def __init__(self, definitions: Sequence[FeatureDefinition]) -> None:
+        names = [definition.name for definition in definitions]
+        if len(set(names)) != len(names):
+            raise ValueError("Feature names must be unique")
+        self._definitions = tuple(definitions)
+        self._extractors = tuple(_compile(definition) for definition in self._definitions)
+        self._store_keys = tuple(
+            definition.key for definition in self._definitions if definition.source == STORE and definition.key
+        )
+
+    @property
+    def definitions(self) -> tuple[FeatureDefinition, ...]:
+        return self._definitions
+
+    @property
+    def feature_names(self) -> list[str]:
+        return [definition.name for definition in self._definitions]
+
+    @property
+    def store_keys(self) -> tuple[str, ...]:
+        return self._store_keys
+
+    def extract(self, transaction: Transaction, enrichment: Mapping[str, float] | None = None) -> list[float]:
+        values = enrichment if enrichment is not None else _NO_ENRICHMENT
+        return [extractor(transaction, values) for extractor in self._extractors]
+
+    def extract_batch(
+        self,
+        transactions: Sequence[Transaction],
+        enrichments: Sequence[Mapping[str, float]] | None = None,
+    ) -> npt.NDArray[np.float64]:
+        n_rows = len(transactions)
+        matrix = np.empty((n_rows, len(self._extractors)), dtype=np.float64)
+        if enrichments is None:
+            enrichments = [_NO_ENRICHMENT] * n_rows
+        for column, extractor in enumerate(self._extractors):
+            matrix[:, column] = np.fromiter(
+                (extractor(transaction, values) for transaction, values in zip(transactions, enrichments)),
+                dtype=np.float64,
+                count=n_rows,
+            )
+        return matrix
+
+    def transform_columns(self, columns: Mapping[str, npt.NDArray[Any]]) -> npt.NDArray[np.float64]:
+        n_rows = len(next(iter(columns.values())))
+        matrix = np.empty((n_rows, len(self._definitions)), dtype=np.float64)
+        for index, definition in enumerate(self._definitions):
+            matrix[:, index] = _column(definition, columns, n_rows)
+        return matrix
+
+
+def _compile(definition: FeatureDefinition) -> Extractor:
+    key = definition.key
+    default = definition.default
+    if definition.source == AMOUNT:
+        return lambda transaction, _: float(transaction.amount.value)
+    if definition.source == HOUR:
+        return lambda transaction, _: float(transaction.timestamp.hour)
+    if definition.source == DAY_OF_WEEK:
+        return lambda transaction, _: float(transaction.timestamp.weekday())
+    if definition.source == METADATA_PRESENT and key:
+        return lambda transaction, _: 1.0 if transaction.metadata.get(key) else 0.0
+    if definition.source == STORE and key:
+        return lambda _, enrichment: float(enrichment.get(key, default))
+    raise ValueError(f"Invalid feature definition: {definition}")
+
+
+def _column(
+    definition: FeatureDefinition, columns: Mapping[str, npt.NDArray[Any]], n_rows: int
+) -> npt.NDArray[np.float64]:
+    source = definition.source
+    if source == AMOUNT:
+        return np.asarray(columns[AMOUNT], dtype=np.float64)
+    if source == HOUR:
+        return np.asarray(columns[HOUR], dtype=np.float64)
+    if source == DAY_OF_WEEK:
+        return np.asarray(columns[DAY_OF_WEEK], dtype=np.float64)
+    if source == METADATA_PRESENT:
+        return np.asarray(columns[f"metadata.{definition.key}"], dtype=bool).astype(np.float64)
+    if source == STORE and definition.key is not None and definition.key in columns:
+        return np.asarray(columns[definition.key], dtype=np.float64)
+    return np.full(n_rows, definition.default, dtype=np.float64)
+
+
+DEFAULT_FEATURE_PIPELINE = FeaturePipeline(DEFAULT_FEATURES)
@@ -1,29 +1,211 @@
 import asyncio
+import time
+import zlib
 from typing import Any
 
+import numpy as np
+import numpy.typing as npt
+
+from app.adapters.outbound.metrics.histogram import Histogram
+from app.adapters.outbound.ml.feature_pipeline import DEFAULT_FEATURE_PIPELINE, FeaturePipeline
+from app.adapters.outbound.ml.inference_executor import (
+    FeatureMatrix,
+    InferenceExecutor,
+    InferenceExecutorStats,
+    InferenceOverloadedError,
+    Scores,
+    ThreadInferenceExecutor,
+)
+from app.adapters.outbound.ml.micro_batcher import MicroBatcher, MicroBatcherStats
+from app.adapters.outbound.ml.shadow_scorer import CandidateModel, ShadowScorer, ShadowStats
 from app.domain.entities.transaction import Transaction
+from app.domain.ports.feature_store_port import FeatureStorePort
 from app.domain.ports.fraud_scoring_port import FraudScoringPort
+from app.domain.value_objects.model_score import ModelScore
+
+FALLBACK_MODEL_VERSION = "fallback"
+
+
+class _ActiveModel:
+    __slots__ = ("model", "version")
+
+    def __init__(self, model: Any, version: str | None) -> None:
+        self.model = model
+        self.version = version
 
 
 class FraudScoringService:
-    def __init__(self, model: Any) -> None:
-        self._model = model
-
-    async def score_transaction(self, transaction: Transaction) -> float:
-        features = self._extract_features(transaction)
-        score = await asyncio.to_thread(self._model.predict_proba, [features])
-        return float(score[0][1])
-
-    def _extract_features(self, transaction: Transaction) -> list[float]:
-        amount = float(transaction.amount.value)
-        hour = transaction.timestamp.hour
-        day_of_week = transaction.timestamp.weekday()
-        metadata = transaction.metadata
-        return [
-            amount,
-            hour,
-            day_of_week,
-            float(len(metadata.get("ip_address", "")) > 0),
-            float(len(metadata.get("device_id", "")) > 0),
-        ]
+    def __init__(
+        self,
+        model: Any,
+        feature_pipeline: FeaturePipeline = DEFAULT_FEATURE_PIPELINE,
+        feature_store: FeatureStorePort | None = None,
+        max_batch_size: int = 1,
+        max_wait_us: int = 0,
+        inference_histogram: Histogram | None = None,
+        batch_size_histogram: Histogram | None = None,
+        model_version: str | None = None,
+        canary: CandidateModel | None = None,
+        canary_percent: float = 0.0,
+        shadow: ShadowScorer | None = None,
+        executor: InferenceExecutor | None = None,
+        fallback_score: float = 0.5,
+    ) -> None:
+        if not 0.0 <= canary_percent <= 100.0:
+            raise ValueError("Canary percent must be between 0 and 100")
+        self._active = _ActiveModel(model, model_version)
+        self._canary = _ActiveModel(canary.model, canary.version) if canary is not None else None
+        self._canary_threshold = int(canary_percent * 100) if canary is not None else 0
+        self._shadow = shadow
+        self._executor = executor if executor is not None else ThreadInferenceExecutor(workers=1)
+        self._fallback_score = fallback_score
+        self._inference_histogram = inference_histogram
+        self._batch_size_histogram = batch_size_histogram
+        self._feature_pipeline = feature_pipeline
+        self._feature_store = feature_store if feature_pipeline.store_keys else None
+        self._batcher: MicroBatcher | None = None
+        self._canary_batcher: MicroBatcher | None = None
+        if max_batch_size > 1:
+            self._batcher = MicroBatcher(
+                predict=self._predict,
+                max_batch_size=max_batch_size,
+                max_wait_us=max_wait_us,
+            )
+            if self._canary is not None:
+                self._canary_batcher = MicroBatcher(
+                    predict=self._predict_canary,
+                    max_batch_size=max_batch_size,
+                    max_wait_us=max_wait_us,
+                )
+
+    @property
+    def feature_pipeline(self) -> FeaturePipeline:
+        return self._feature_pipeline
+
+    @property
+    def model(self) -> Any:
+        return self._active.model
+
+    @property
+    def model_version(self) -> str | None:
+        return self._active.version
+
+    @property
+    def canary_version(self) -> str | None:
+        return self._canary.version if self._canary is not None else None
+
+    @property
+    def canary_percent(self) -> float:
+        return self._canary_threshold / 100
+
+    @property
+    def shadow_versions(self) -> list[str]:
+        if self._shadow is None:
+            return []
+        return [candidate.version for candidate in self._shadow.candidates]
+
+    def swap_model(self, model: Any, version: str | None) -> None:
+        self._active = _ActiveModel(model, version)
+
+    async def score_transaction(self, transaction: Transaction) -> ModelScore:
+        enrichment = None
+        if self._feature_store is not None:
+            enrichment = await self._feature_store.get_features(transaction)
+        features = self._extract_features(transaction, enrichment)
+        canary = self._routes_to_canary(transaction)
+        batcher = self._canary_batcher if canary else self._batcher
+        try:
+            if batcher is not None:
+                score = await batcher.submit(features)
+            else:
+                predict = self._predict_canary if canary else self._predict
+                scores, model_version = await predict(np.asarray([features], dtype=np.float64))
+                score = ModelScore(float(scores[0]), model_version)
+        except InferenceOverloadedError:
+            return ModelScore(self._fallback_score, FALLBACK_MODEL_VERSION)
+        if self._shadow is not None:
+            self._shadow.submit([transaction], np.asarray([features], dtype=np.float64), [score])
+        return score
+
+    async def score_transactions(self, transactions: list[Transaction]) -> list[ModelScore]:
+        if not transactions:
+            return []
+        enrichments = None
+        if self._feature_store is not None:
+            enrichments = await self._feature_store.get_features_many(transactions)
+        features = self._feature_pipeline.extract_batch(transactions, enrichments)
+        canary_rows = [self._routes_to_canary(transaction) for transaction in transactions]
+        try:
+            if any(canary_rows):
+                scores = await self._predict_split(features, np.asarray(canary_rows))
+            else:
+                values, model_version = await self._predict(features)
+                scores = [ModelScore(value, model_version) for value in values.astype(float).tolist()]
+        except InferenceOverloadedError:
+            return [ModelScore(self._fallback_score, FALLBACK_MODEL_VERSION)] * len(transactions)
+        if self._shadow is not None:
+            self._shadow.submit(transactions, features, scores)
+        return scores
+
+    def _routes_to_canary(self, transaction: Transaction) -> bool:
+        if self._canary_threshold <= 0:
+            return False
+        return zlib.crc32(transaction.user_id.value.encode()) % 10000 < self._canary_threshold
+
+    async def _predict(self, features: FeatureMatrix) -> tuple[Scores, str | None]:
+        return await self._run(self._active, features)
+
+    async def _predict_canary(self, features: FeatureMatrix) -> tuple[Scores, str | None]:
+        assert self._canary is not None
+        return await self._run(self._canary, features)
+
+    async def _predict_split(self, features: FeatureMatrix, canary_rows: npt.NDArray[np.bool_]) -> list[ModelScore]:
+        assert self._canary is not None
+        scores: dict[int, ModelScore] = {}
+        for target, rows in ((self._active, ~canary_rows), (self._canary, canary_rows)):
+            if not rows.any():
+                continue
+            indices = np.flatnonzero(rows)
+            values, model_version = await self._run(target, features[indices])
+            for index, value in zip(indices.tolist(), values.astype(float).tolist()):
+                scores[index] = ModelScore(value, model_version)
+        return [scores[index] for index in range(len(features))]
+
+    async def _run(self, active: _ActiveModel, features: FeatureMatrix) -> tuple[Scores, str | None]:
+        started = time.perf_counter()
+        scores = await self._executor.predict(active.model, features)
+        if self._inference_histogram is not None:
+            self._inference_histogram.observe(time.perf_counter() - started)
+        if self._batch_size_histogram is not None:
+            self._batch_size_histogram.observe(len(features))
+        return scores, active.version
+
+    def _extract_features(
+        self, transaction: Transaction, enrichment: dict[str, float] | None = None
+    ) -> list[float]:
+        return self._feature_pipeline.extract(transaction, enrichment)
+
+    def batching_stats(self) -> MicroBatcherStats | None:
+        if self._batcher is None:
+            return None
+        return self._batcher.stats()
+
+    def inference_stats(self) -> InferenceExecutorStats:
+        return self._executor.stats()
+
+    async def start(self) -> None:
+        await self._executor.start()
+
+    def shadow_stats(self) -> ShadowStats | None:
+        if self._shadow is None:
+            return None
+        return self._shadow.stats()
 
+    async def close(self) -> None:
+        if self._batcher is not None:
+            await self._batcher.close()
+        if self._canary_batcher is not None:
+            await self._canary_batcher.close()
+        if self._shadow is not None:
+            await asyncio.to_thread(self._shadow.close)
+        await self._executor.close()
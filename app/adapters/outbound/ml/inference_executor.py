@@ -0,0 +1,273 @@
+import asyncio
+import multiprocessing
+import pickle
+import shutil
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from pathlib import Path
+from typing import Any, TypedDict
+
+import numpy as np
+import numpy.typing as npt
+
+from app.adapters.outbound.ml.compiled_tree_ensemble import CompiledTreeEnsemble
+from app.adapters.outbound.ml.model_loader import COMPILED_SUFFIX, ModelLoader
+
+THREAD = "thread"
+PROCESS = "process"
+
+_EWMA_WEIGHT = 0.2
+_PUBLISHED_MODELS = 4
+_WORKER_MODELS = 4
+
+FeatureMatrix = npt.NDArray[np.float64]
+Scores = npt.NDArray[np.float64]
+
+
+class InferenceOverloadedError(RuntimeError):
+    pass
+
+
+class InferenceExecutorStats(TypedDict):
+    kind: str
+    workers: int
+    pending: int
+    max_pending: int
+    sla_ms: float
+    completed: int
+    shed: int
+    mean_service_ms: float
+    estimated_wait_ms: float
+
+
+class InferenceExecutor:
+    def __init__(self, kind: str, workers: int, max_pending: int, sla_ms: float) -> None:
+        self._kind = kind
+        self._workers = workers
+        self._max_pending = max_pending
+        self._sla = sla_ms / 1000
+        self._pending = 0
+        self._completed = 0
+        self._shed = 0
+        self._service_time = 0.0
+
+    async def predict(self, model: Any, features: FeatureMatrix) -> Scores:
+        self._admit()
+        self._pending += 1
+        try:
+            scores, elapsed = await self._predict(model, features)
+        finally:
+            self._pending -= 1
+        self._completed += 1
+        self._service_time += _EWMA_WEIGHT * (elapsed - self._service_time)
+        return scores
+
+    def stats(self) -> InferenceExecutorStats:
+        return InferenceExecutorStats(
+            kind=self._kind,
+            workers=self._workers,
+            pending=self._pending,
+            max_pending=self._max_pending,
+            sla_ms=self._sla * 1000,
+            completed=self._completed,
+            shed=self._shed,
+            mean_service_ms=self._service_time * 1000,
+            estimated_wait_ms=self._estimated_wait() * 1000,
+        )
+
+    async def start(self) -> None:
+        pass
+
+    async def close(self) -> None:
+        pass
+
+    async def _predict(self, model: Any, features: FeatureMatrix) -> tuple[Scores, float]:
+        raise NotImplementedError
+
+    def _admit(self) -> None:
+        if self._pending >= self._max_pending:
+            self._shed += 1
+            raise InferenceOverloadedError(f"Inference queue is full ({self._pending} pending)")
+        if self._sla > 0 and self._estimated_wait() > self._sla:
+            self._shed += 1
+            raise InferenceOverloadedError(
+                f"Estimated inference wait {self._estimated_wait() * 1000:.1f}ms exceeds the {self._sla * 1000:.0f}ms SLA"
+            )
+
+    def _estimated_wait(self) -> float:
+        return (self._pending // self._workers + 1) * self._service_time
+
+
+class ThreadInferenceExecutor(InferenceExecutor):
+    def __init__(self, workers: int, max_pending: int = 1024, sla_ms: float = 0.0) -> None:
+        super().__init__(THREAD, workers, max_pending, sla_ms)
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="inference")
+
+    async def _predict(self, model: Any, features: FeatureMatrix) -> tuple[Scores, float]:
+        return await asyncio.get_running_loop().run_in_executor(self._pool, _timed_predict, model, features)
+
+    async def close(self) -> None:
+        await asyncio.to_thread(self._pool.shutdown, True)
+
+
+class ProcessInferenceExecutor(InferenceExecutor):
+    def __init__(
+        self,
+        workers: int,
+        model: Any,
+        n_features: int,
+        max_pending: int = 1024,
+        sla_ms: float = 0.0,
+        slot_rows: int = 1024,
+    ) -> None:
+        super().__init__(PROCESS, workers, max_pending, sla_ms)
+        self._n_features = n_features
+        self._slot_rows = slot_rows
+        self._artifact_dir = Path(tempfile.mkdtemp(prefix="securetransaction-models-"))
+        self._published: OrderedDict[int, tuple[Any, str]] = OrderedDict()
+        self._publish_lock = threading.Lock()
+        self._publish_count = 0
+        initial = self._publish(model)
+        self._segments = [
+            SharedMemory(create=True, size=max(slot_rows * n_features * 8, 8)) for _ in range(workers * 2)
+        ]
+        self._free: asyncio.Queue[SharedMemory] | None = None
+        self._pool: Executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_initialize_worker,
+            initargs=(initial,),
+        )
+
+    async def _predict(self, model: Any, features: FeatureMatrix) -> tuple[Scores, float]:
+        features = np.ascontiguousarray(features, dtype=np.float64)
+        if features.ndim != 2 or features.shape[1] != self._n_features:
+            raise ValueError(f"Expected a feature matrix with {self._n_features} columns")
+        path = self._published_path(model)
+        if path is None:
+            path = await asyncio.to_thread(self._publish, model)
+        chunks = [
+            self._predict_chunk(path, features[start : start + self._slot_rows])
+            for start in range(0, len(features), self._slot_rows)
+        ]
+        if len(chunks) == 1:
+            return await chunks[0]
+        results = await asyncio.gather(*chunks)
+        return np.concatenate([scores for scores, _ in results]), sum(elapsed for _, elapsed in results)
+
+    async def _predict_chunk(self, path: str, features: FeatureMatrix) -> tuple[Scores, float]:
+        if self._free is None:
+            self._free = asyncio.Queue()
+            for segment in self._segments:
+                self._free.put_nowait(segment)
+        free = self._free
+        segment = await free.get()
+        rows = len(features)
+        np.ndarray((rows, self._n_features), dtype=np.float64, buffer=segment.buf)[:] = features
+        try:
+            future = self._pool.submit(_predict_shared, path, segment.name, rows, self._n_features)
+        except BaseException:
+            free.put_nowait(segment)
+            raise
+        loop = asyncio.get_running_loop()
+        future.add_done_callback(lambda _: loop.call_soon_threadsafe(free.put_nowait, segment))
+        return await asyncio.wrap_future(future)
+
+    def _published_path(self, model: Any) -> str | None:
+        published = self._published.get(id(model))
+        if published is None or published[0] is not model:
+            return None
+        return published[1]
+
+    def _publish(self, model: Any) -> str:
+        with self._publish_lock:
+            path_name = self._published_path(model)
+            if path_name is not None:
+                return path_name
+            self._publish_count += 1
+            if isinstance(model, CompiledTreeEnsemble):
+                path = self._artifact_dir / f"model-{self._publish_count}{COMPILED_SUFFIX}"
+                model.save(path)
+            else:
+                path = self._artifact_dir / f"model-{self._publish_count}.pkl"
+                with open(path, "wb") as f:
+                    pickle.dump(model, f)
+            self._published[id(model)] = (model, str(path))
+            while len(self._published) > _PUBLISHED_MODELS:
+                _, (_, stale) = self._published.popitem(last=False)
+                Path(stale).unlink(missing_ok=True)
+            return str(path)
+
+    async def start(self) -> None:
+        await asyncio.gather(
+            *(asyncio.wrap_future(self._pool.submit(_worker_ready)) for _ in range(self._workers))
+        )
+
+    async def close(self) -> None:
+        await asyncio.to_thread(self._pool.shutdown, True)
+        for segment in self._segments:
+            segment.close()
+            segment.unlink()
+        shutil.rmtree(self._artifact_dir, ignore_errors=True)
+
+
+def create_inference_executor(
+    kind: str,
+    workers: int,
+    model: Any,
+    n_features: int,
+    max_pending: int,
+    sla_ms: float,
+    slot_rows: int,
+) -> InferenceExecutor:
+    if kind == THREAD:
+        return ThreadInferenceExecutor(workers, max_pending=max_pending, sla_ms=sla_ms)
+    if kind == PROCESS:
+        return ProcessInferenceExecutor(
+            workers, model, n_features, max_pending=max_pending, sla_ms=sla_ms, slot_rows=slot_rows
+        )
+    raise ValueError(f"Unknown inference executor: {kind}")
+
+
+def _timed_predict(model: Any, features: FeatureMatrix) -> tuple[Scores, float]:
+    started = time.perf_counter()
+    scores = np.asarray(model.predict_proba(features))[:, 1]
+    return scores, time.perf_counter() - started
+
+
+_worker_models: OrderedDict[str, Any] = OrderedDict()
+_worker_segments: dict[str, SharedMemory] = {}
+
+
+def _initialize_worker(path: str) -> None:
+    _worker_model(path)
+
+
+def _worker_ready() -> int:
+    time.sleep(0.05)
+    return len(_worker_models)
+
+
+def _worker_model(path: str) -> Any:
+    model = _worker_models.get(path)
+    if model is None:
+        model = ModelLoader.load_model(path)
+        _worker_models[path] = model
+        while len(_worker_models) > _WORKER_MODELS:
+            _worker_models.popitem(last=False)
+    else:
+        _worker_models.move_to_end(path)
+    return model
+
+
+def _predict_shared(path: str, segment_name: str, rows: int, n_features: int) -> tuple[Scores, float]:
+    segment = _worker_segments.get(segment_name)
+    if segment is None:
+        segment = SharedMemory(name=segment_name)
+        _worker_segments[segment_name] = segment
+    features: FeatureMatrix = np.ndarray((rows, n_features), dtype=np.float64, buffer=segment.buf)
+    return _timed_predict(_worker_model(path), features)
@@ -0,0 +1,131 @@
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from typing import TypedDict
+
+import numpy as np
+
+from app.adapters.outbound.ml.inference_executor import FeatureMatrix, Scores
+from app.domain.value_objects.model_score import ModelScore
+
+
+class MicroBatcherStats(TypedDict):
+    batches: int
+    rows: int
+    max_batch_size: int
+    mean_batch_size: float
+    mean_queue_delay_us: float
+    max_queue_delay_us: float
+    pending: int
+
+
+class MicroBatcher:
+    def __init__(
+        self,
+        predict: Callable[[FeatureMatrix], Awaitable[tuple[Scores, str | None]]],
+        max_batch_size: int,
+        max_wait_us: int,
+    ) -> None:
+        self._predict = predict
+        self._max_batch_size = max_batch_size
+        self._max_wait = max_wait_us / 1_000_000
+        self._queue: asyncio.Queue[tuple[list[float], float, asyncio.Future[ModelScore]]] | None = None
+        self._worker: asyncio.Task[None] | None = None
+        self._in_flight: list[tuple[list[float], float, asyncio.Future[ModelScore]]] = []
+        self._batches = 0
+        self._rows = 0
+        self._largest_batch = 0
+        self._queue_delay_total = 0.0
+        self._queue_delay_max = 0.0
+
+    async def submit(self, features: list[float]) -> ModelScore:
+        queue = self._queue
+        if queue is None or self._worker is None or self._worker.done():
+            queue = self._restart()
+        future: asyncio.Future[ModelScore] = asyncio.get_running_loop().create_future()
+        queue.put_nowait((features, time.perf_counter(), future))
+        return await future
+
+    def stats(self) -> MicroBatcherStats:
+        return MicroBatcherStats(
+            batches=self._batches,
+            rows=self._rows,
+            max_batch_size=self._largest_batch,
+            mean_batch_size=self._rows / self._batches if self._batches else 0.0,
+            mean_queue_delay_us=self._queue_delay_total / self._rows * 1_000_000 if self._rows else 0.0,
+            max_queue_delay_us=self._queue_delay_max * 1_000_000,
+            pending=self._queue.qsize() if self._queue is not None else 0,
+        )
+
+    async def close(self) -> None:
+        if self._worker is None:
+            return
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+        pending = list(self._in_flight)
+        while self._queue is not None and not self._queue.empty():
+            pending.append(self._queue.get_nowait())
+        for _, _, future in pending:
+            if not future.done():
+                future.set_exception(RuntimeError("Scoring batcher is shut down"))
+        self._in_flight = []
+        self._worker = None
+
+    def _restart(self) -> asyncio.Queue[tuple[list[float], float, asyncio.Future[ModelScore]]]:
+        error: BaseException = RuntimeError("Scoring batcher worker stopped")
+        if self._worker is not None and self._worker.done() and not self._worker.cancelled():
+            error = self._worker.exception() or error
+        for _, _, future in self._in_flight:
+            if not future.done():
+                future.set_exception(error)
+        self._in_flight = []
+        queue: asyncio.Queue[tuple[list[float], float, asyncio.Future[ModelScore]]] = asyncio.Queue()
+        while self._queue is not None and not self._queue.empty():
+            queue.put_nowait(self._queue.get_nowait())
+        self._queue = queue
+        self._worker = asyncio.create_task(self._run())
+        return queue
+
+    async def _run(self) -> None:
+        assert self._queue is not None
+        queue = self._queue
+        while True:
+            batch = self._in_flight = [await queue.get()]
+            deadline = time.perf_counter() + self._max_wait
+            while len(batch) < self._max_batch_size:
+                if not queue.empty():
+                    batch.append(queue.get_nowait())
+                    continue
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            await self._score(batch)
+            self._in_flight = []
+
+    async def _score(self, batch: list[tuple[list[float], float, asyncio.Future[ModelScore]]]) -> None:
+        dispatched_at = time.perf_counter()
+        for _, enqueued_at, _ in batch:
+            delay = dispatched_at - enqueued_at
+            self._queue_delay_total += delay
+            self._queue_delay_max = max(self._queue_delay_max, delay)
+        self._batches += 1
+        self._rows += len(batch)
+        self._largest_batch = max(self._largest_batch, len(batch))
+        try:
+            features = np.array([features for features, _, _ in batch], dtype=np.float64)
+            scores, model_version = await self._predict(features)
+        except Exception as e:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, _, future), score in zip(batch, scores):
+            if not future.done():
+                future.set_result(ModelScore(float(score), model_version))
@@ -6,11 +6,21 @@ import joblib
 import numpy as np
 from sklearn.ensemble import GradientBoostingClassifier
 
+from app.adapters.outbound.logging.logger import StructuredLogger
+from app.adapters.outbound.ml.compiled_tree_ensemble import CompiledTreeEnsemble
+
+PARITY_TOLERANCE = 1e-5
+COMPILED_SUFFIX = ".cte"
+
+_loaded: dict[tuple[str, bool], Any] = {}
+
 
 class ModelLoader:
     @staticmethod
     def load_model(model_path: str) -> Any:
         path = Path(model_path)
+        if not path.exists() and path.suffix == COMPILED_SUFFIX:
+            raise FileNotFoundError(f"Compiled model not found: {model_path}")
         if not path.exists():
             path.parent.mkdir(parents=True, exist_ok=True)
             model = GradientBoostingClassifier(n_estimators=10, random_state=42)
@@ -25,6 +35,42 @@ class ModelLoader:
                 return pickle.load(f)
         elif path.suffix == ".joblib":
             return joblib.load(path)
+        elif path.suffix == COMPILED_SUFFIX:
+            return CompiledTreeEnsemble.load(path, mmap=True)
         else:
             raise ValueError(f"Unsupported model format: {path.suffix}")
 
+    @staticmethod
+    def compile_model(model: Any, logger: StructuredLogger) -> Any:
+        if isinstance(model, CompiledTreeEnsemble):
+            return model
+        try:
+            compiled = CompiledTreeEnsemble.from_model(model)
+        except Exception as e:
+            logger.info("Model not compiled, using native predict_proba", reason=str(e))
+            return model
+        error = compiled.max_abs_error(model, compiled.parity_probe())
+        if error > PARITY_TOLERANCE:
+            logger.error("Compiled model failed parity check, using native predict_proba", max_abs_error=error)
+            return model
+        logger.info("Compiled model for inference", trees=compiled.n_trees, max_abs_error=error)
+        return compiled
+
+    @staticmethod
+    def load_inference_model(model_path: str, compiled: bool, logger: StructuredLogger) -> Any:
+        key = (str(Path(model_path).resolve()), compiled)
+        model = _loaded.get(key)
+        if model is None:
+            model = ModelLoader.load_model(model_path)
+            if compiled:
+                model = ModelLoader.compile_model(model, logger)
+            _loaded[key] = model
+        return model
+
+    @staticmethod
+    def export_compiled(model: Any, output_path: str, logger: StructuredLogger) -> CompiledTreeEnsemble:
+        compiled = ModelLoader.compile_model(model, logger)
+        if not isinstance(compiled, CompiledTreeEnsemble):
+            raise ValueError(f"Model cannot be compiled: {type(model).__name__}")
+        compiled.save(output_path)
+        return compiled
@@ -0,0 +1,211 @@
+import asyncio
+import time
+from pathlib import Path
+from typing import Any, TypedDict
+
+from app.adapters.outbound.logging.logger import StructuredLogger
+from app.adapters.outbound.ml.fraud_scoring_service import FraudScoringService
+from app.adapters.outbound.ml.model_loader import ModelLoader
+from app.adapters.outbound.ml.model_registry import (
+    ModelRegistry,
+    ModelRegistryError,
+    ModelVersionMetadata,
+)
+from app.adapters.outbound.ml.shadow_scorer import CandidateModel
+
+
+class ModelStatus(TypedDict):
+    active_version: str | None
+    source: str
+    loaded_at: float
+    previous_version: str | None
+    metadata: ModelVersionMetadata | None
+    canary_version: str | None
+    canary_percent: float
+    shadow_versions: list[str]
+
+
+class ModelManager:
+    def __init__(
+        self,
+        scoring_service: FraudScoringService,
+        logger: StructuredLogger,
+        model_path: str,
+        compiled: bool,
+        registry: ModelRegistry | None = None,
+        poll_interval_seconds: float = 0.0,
+    ) -> None:
+        self._scoring_service = scoring_service
+        self._logger = logger
+        self._model_path = model_path
+        self._compiled = compiled
+        self._registry = registry
+        self._poll_interval = poll_interval_seconds
+        self._lock = asyncio.Lock()
+        self._loaded_at = time.time()
+        self._previous: tuple[Any, str | None] | None = None
+        self._poller: asyncio.Task[None] | None = None
+
+    @staticmethod
+    def load_initial(
+        model_path: str,
+        feature_names: list[str],
+        compiled: bool,
+        logger: StructuredLogger,
+        registry: ModelRegistry | None = None,
+    ) -> tuple[Any, str]:
+        if registry is not None:
+            version = registry.active_version()
+            if version is not None:
+                metadata = registry.metadata(version)
+                model = registry.load(version, compiled)
+                if compiled:
+                    model = ModelLoader.compile_model(model, logger)
+                _check_schema(model, metadata, feature_names)
+                return model, version
+        model = ModelLoader.load_inference_model(model_path, compiled, logger)
+        _check_schema(model, None, feature_names)
+        return model, _file_version(model_path)
+
+    @staticmethod
+    def load_candidate(
+        reference: str,
+        feature_names: list[str],
+        compiled: bool,
+        logger: StructuredLogger,
+        registry: ModelRegistry | None = None,
+    ) -> CandidateModel:
+        if registry is not None and "/" not in reference and not Path(reference).suffix:
+            metadata = registry.metadata(reference)
+            model = registry.load(reference, compiled)
+            version = reference
+        else:
+            metadata = None
+            model = ModelLoader.load_model(reference)
+            version = _file_version(reference)
+        if compiled:
+            model = ModelLoader.compile_model(model, logger)
+        _check_schema(model, metadata, feature_names)
+        return CandidateModel(model, version)
+
+    @property
+    def registry(self) -> ModelRegistry | None:
+        return self._registry
+
+    def status(self) -> ModelStatus:
+        version = self._scoring_service.model_version
+        metadata = None
+        if self._registry is not None and version is not None:
+            try:
+                metadata = self._registry.metadata(version)
+            except ModelRegistryError:
+                metadata = None
+        return ModelStatus(
+            active_version=version,
+            source=str(self._registry.root) if self._registry is not None else self._model_path,
+            loaded_at=self._loaded_at,
+            previous_version=self._previous[1] if self._previous is not None else None,
+            metadata=metadata,
+            canary_version=self._scoring_service.canary_version,
+            canary_percent=self._scoring_service.canary_percent,
+            shadow_versions=self._scoring_service.shadow_versions,
+        )
+
+    async def reload(self, version: str | None = None) -> ModelStatus:
+        async with self._lock:
+            if self._registry is None:
+                if version is not None:
+                    raise ModelRegistryError("Selecting a model version requires MODEL_REGISTRY_PATH")
+                model, loaded_version = await asyncio.to_thread(self._load_file)
+            else:
+                target = version or await asyncio.to_thread(self._registry.active_version)
+                if target is None:
+                    raise ModelRegistryError("Model registry has no active version")
+                model, loaded_version = await asyncio.to_thread(self._load_version, target)
+                if version is not None:
+                    await asyncio.to_thread(self._registry.activate, version)
+            self._swap(model, loaded_version)
+        return self.status()
+
+    async def rollback(self) -> ModelStatus:
+        async with self._lock:
+            if self._registry is not None:
+                history = (await asyncio.to_thread(self._registry.state))["history"]
+                if len(history) < 2:
+                    raise ModelRegistryError("No previous model version to roll back to")
+                model, loaded_version = await asyncio.to_thread(self._load_version, history[-2])
+                await asyncio.to_thread(self._registry.rollback)
+                self._swap(model, loaded_version)
+            elif self._previous is not None:
+                self._swap(*self._previous)
+            else:
+                raise ModelRegistryError("No previous model version to roll back to")
+        return self.status()
+
+    async def start(self) -> None:
+        if self._registry is not None and self._poll_interval > 0 and self._poller is None:
+            self._poller = asyncio.create_task(self._poll())
+
+    async def close(self) -> None:
+        if self._poller is None:
+            return
+        self._poller.cancel()
+        try:
+            await self._poller
+        except asyncio.CancelledError:
+            pass
+        self._poller = None
+
+    def _swap(self, model: Any, version: str | None) -> None:
+        previous_version = self._scoring_service.model_version
+        if version == previous_version and self._registry is not None:
+            return
+        self._previous = (self._scoring_service.model, previous_version)
+        self._scoring_service.swap_model(model, version)
+        self._loaded_at = time.time()
+        self._logger.info("Swapped scoring model", version=version or "", previous_version=previous_version or "")
+
+    def _load_file(self) -> tuple[Any, str]:
+        model = ModelLoader.load_model(self._model_path)
+        if self._compiled:
+            model = ModelLoader.compile_model(model, self._logger)
+        _check_schema(model, None, self._scoring_service.feature_pipeline.feature_names)
+        return model, _file_version(self._model_path)
+
+    def _load_version(self, version: str) -> tuple[Any, str]:
+        assert self._registry is not None
+        metadata = self._registry.metadata(version)
+        model = self._registry.load(version, self._compiled)
+        if self._compiled:
+            model = ModelLoader.compile_model(model, self._logger)
+        _check_schema(model, metadata, self._scoring_service.feature_pipeline.feature_names)
+        return model, version
+
+    async def _poll(self) -> None:
+        assert self._registry is not None
+        while True:
+            await asyncio.sleep(self._poll_interval)
+            try:
+                active = await asyncio.to_thread(self._registry.active_version)
+                if active is not None and active != self._scoring_service.model_version:
+                    await self.reload()
+            except Exception as e:
+                self._logger.error("Model registry poll failed", error=str(e))
+
+
+def _check_schema(model: Any, metadata: ModelVersionMetadata | None, expected: list[str]) -> None:
+    if metadata is not None and metadata["feature_names"] != expected:
+        raise ModelRegistryError(
+            f"Model {metadata['version']} expects features {metadata['feature_names']}, "
+            f"the scoring pipeline produces {expected}"
+        )
+    n_features = getattr(model, "n_features_in_", None) or getattr(model, "n_features", None)
+    if n_features is not None and int(n_features) != len(expected):
+        raise ModelRegistryError(f"Model expects {n_features} features, the scoring pipeline produces {len(expected)}")
+
+
+def _file_version(model_path: str) -> str:
+    path = Path(model_path)
+    if not path.exists():
+        return path.name
+    return f"{path.name}@{int(path.stat().st_mtime)}"
@@ -0,0 +1,171 @@
+import json
+import os
+import pickle
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, TypedDict
+
+from app.adapters.outbound.ml.compiled_tree_ensemble import CompiledTreeEnsemble
+from app.adapters.outbound.ml.feature_pipeline import FeaturePipeline
+from app.adapters.outbound.ml.model_loader import COMPILED_SUFFIX, PARITY_TOLERANCE, ModelLoader
+
+_MODEL_FILE = "model.pkl"
+_COMPILED_FILE = f"model{COMPILED_SUFFIX}"
+_METADATA_FILE = "metadata.json"
+_STATE_FILE = "registry.json"
+
+
+class FeatureSchemaEntry(TypedDict):
+    name: str
+    source: str
+    key: str | None
+    default: float
+
+
+class ModelVersionMetadata(TypedDict):
+    version: str
+    created_at: str
+    model_type: str
+    feature_names: list[str]
+    feature_schema: list[FeatureSchemaEntry]
+    metrics: dict[str, float]
+    params: dict[str, Any]
+    training_rows: int
+    compiled: bool
+
+
+class RegistryState(TypedDict):
+    active: str | None
+    history: list[str]
+
+
+class ModelRegistryError(ValueError):
+    pass
+
+
+class ModelRegistry:
+    def __init__(self, root: str | Path) -> None:
+        self._root = Path(root)
+
+    @property
+    def root(self) -> Path:
+        return self._root
+
+    def versions(self) -> list[ModelVersionMetadata]:
+        if not self._root.exists():
+            return []
+        found = [
+            self.metadata(path.name)
+            for path in self._root.iterdir()
+            if path.is_dir() and (path / _METADATA_FILE).exists()
+        ]
+        return sorted(found, key=lambda metadata: _version_number(metadata["version"]))
+
+    def metadata(self, version: str) -> ModelVersionMetadata:
+        path = self._version_dir(version) / _METADATA_FILE
+        if not path.exists():
+            raise ModelRegistryError(f"Unknown model version: {version}")
+        metadata: ModelVersionMetadata = json.loads(path.read_text())
+        metadata.setdefault("params", {})
+        return metadata
+
+    def state(self) -> RegistryState:
+        path = self._root / _STATE_FILE
+        if not path.exists():
+            return RegistryState(active=None, history=[])
+        state: RegistryState = json.loads(path.read_text())
+        return state
+
+    def active_version(self) -> str | None:
+        return self.state()["active"]
+
+    def register(
+        self,
+        model: Any,
+        feature_pipeline: FeaturePipeline,
+        metrics: dict[str, float],
+        training_rows: int,
+        compile_model: bool = True,
+        params: dict[str, Any] | None = None,
+    ) -> ModelVersionMetadata:
+        self._root.mkdir(parents=True, exist_ok=True)
+        existing = [_version_number(metadata["version"]) for metadata in self.versions()]
+        version = f"v{max(existing, default=0) + 1}"
+        directory = self._version_dir(version)
+        staging = self._root / f".{version}.tmp"
+        staging.mkdir()
+        with open(staging / _MODEL_FILE, "wb") as f:
+            pickle.dump(model, f)
+        compiled = False
+        if compile_model:
+            try:
+                ensemble = CompiledTreeEnsemble.from_model(model)
+            except ValueError:
+                ensemble = None
+            if ensemble is not None and ensemble.max_abs_error(model, ensemble.parity_probe()) <= PARITY_TOLERANCE:
+                ensemble.save(staging / _COMPILED_FILE)
+                compiled = True
+        metadata = ModelVersionMetadata(
+            version=version,
+            created_at=datetime.now(timezone.utc).isoformat(),
+            model_type=type(model).__name__,
+            feature_names=feature_pipeline.feature_names,
+            feature_schema=[
+                FeatureSchemaEntry(
+                    name=definition.name,
+                    source=definition.source,
+                    key=definition.key,
+                    default=definition.default,
+                )
+                for definition in feature_pipeline.definitions
+            ],
+            metrics=metrics,
+            params=params or {},
+            training_rows=training_rows,
+            compiled=compiled,
+        )
+        (staging / _METADATA_FILE).write_text(json.dumps(metadata, indent=2))
+        staging.rename(directory)
+        return metadata
+
+    def activate(self, version: str) -> RegistryState:
+        self.metadata(version)
+        state = self.state()
+        if state["active"] == version:
+            return state
+        history = [v for v in state["history"] if v != version] + [version]
+        return self._write_state(RegistryState(active=version, history=history))
+
+    def rollback(self) -> RegistryState:
+        state = self.state()
+        if len(state["history"]) < 2:
+            raise ModelRegistryError("No previous model version to roll back to")
+        history = state["history"][:-1]
+        return self._write_state(RegistryState(active=history[-1], history=history))
+
+    def load(self, version: str, compiled: bool) -> Any:
+        directory = self._version_dir(version)
+        self.metadata(version)
+        compiled_path = directory / _COMPILED_FILE
+        if compiled and compiled_path.exists():
+            return CompiledTreeEnsemble.load(compiled_path, mmap=True)
+        return ModelLoader.load_model(str(directory / _MODEL_FILE))
+
+    def _version_dir(self, version: str) -> Path:
+        if not version or "/" in version or version.startswith("."):
+            raise ModelRegistryError(f"Invalid model version: {version!r}")
+        return self._root / version
+
+    def _write_state(self, state: RegistryState) -> RegistryState:
+        path = self._root / _STATE_FILE
+        staging = path.with_name(f".{_STATE_FILE}.tmp")
+        staging.write_text(json.dumps(state, indent=2))
+        os.replace(staging, path)
+        return state
+
+
+def _version_number(version: str) -> int:
+    try:
+        return int(version.lstrip("v"))
+    except ValueError:
+        return 0
@@ -0,0 +1,219 @@
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from collections.abc import Callable
+from datetime import datetime, timezone
+from typing import Any, TypedDict
+
+import numpy as np
+import numpy.typing as npt
+
+from app.adapters.outbound.analytics.ndjson_sink import NdjsonAnalyticsSink
+from app.adapters.outbound.logging.logger import StructuredLogger
+from app.adapters.outbound.metrics.histogram import Histogram
+from app.domain.entities.transaction import Transaction
+from app.domain.services.rule_engine import DEFAULT_RULE_ENGINE, RuleEngine
+from app.domain.value_objects.model_score import ModelScore
+
+
+class CandidateModel:
+    __slots__ = ("model", "version")
+
+    def __init__(self, model: Any, version: str) -> None:
+        self.model = model
+        self.version = version
+
+
+class CandidateStats(TypedDict):
+    version: str
+    rows: int
+    errors: int
+    decision_flips: int
+    flip_rate: float
+    mean_delta: float
+    mean_abs_delta: float
+    max_abs_delta: float
+    flips: dict[str, int]
+
+
+class ShadowStats(TypedDict):
+    submitted: int
+    dropped: int
+    pending: int
+    candidates: list[CandidateStats]
+
+
+class _CandidateTotals:
+    __slots__ = ("rows", "errors", "flips", "delta_sum", "abs_delta_sum", "max_abs_delta", "transitions")
+
+    def __init__(self) -> None:
+        self.rows = 0
+        self.errors = 0
+        self.flips = 0
+        self.delta_sum = 0.0
+        self.abs_delta_sum = 0.0
+        self.max_abs_delta = 0.0
+        self.transitions: dict[str, int] = {}
+
+
+_Row = tuple[Transaction, npt.NDArray[np.float64], ModelScore]
+
+
+class ShadowScorer:
+    def __init__(
+        self,
+        candidates: list[CandidateModel],
+        sink: NdjsonAnalyticsSink,
+        logger: StructuredLogger,
+        max_workers: int = 1,
+        max_pending_rows: int = 10000,
+        max_batch_rows: int = 256,
+        inference_histogram: Histogram | None = None,
+        delta_histogram: Histogram | None = None,
+        rule_engine: Callable[[], RuleEngine] = lambda: DEFAULT_RULE_ENGINE,
+    ) -> None:
+        self._candidates = candidates
+        self._sink = sink
+        self._logger = logger
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="shadow-scoring")
+        self._max_workers = max_workers
+        self._max_pending_rows = max_pending_rows
+        self._max_batch_rows = max_batch_rows
+        self._inference_histogram = inference_histogram
+        self._delta_histogram = delta_histogram
+        self._rule_engine = rule_engine
+        self._lock = threading.Lock()
+        self._pending: deque[_Row] = deque()
+        self._active_drains = 0
+        self._submitted = 0
+        self._dropped = 0
+        self._totals = {candidate.version: _CandidateTotals() for candidate in candidates}
+        self._closed = False
+
+    @property
+    def candidates(self) -> list[CandidateModel]:
+        return self._candidates
+
+    def submit(
+        self, transactions: list[Transaction], features: npt.NDArray[np.float64], scores: list[ModelScore]
+    ) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._submitted += len(transactions)
+            if len(self._pending) + len(transactions) > self._max_pending_rows:
+                self._dropped += len(transactions)
+                return
+            self._pending.extend(zip(transactions, features, scores))
+            if self._active_drains >= self._max_workers:
+                return
+            self._active_drains += 1
+        self._executor.submit(self._drain)
+
+    def stats(self) -> ShadowStats:
+        with self._lock:
+            return ShadowStats(
+                submitted=self._submitted,
+                dropped=self._dropped,
+                pending=len(self._pending),
+                candidates=[_candidate_stats(version, totals) for version, totals in self._totals.items()],
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+        self._executor.shutdown(wait=True)
+        self._sink.close()
+
+    def _drain(self) -> None:
+        while True:
+            with self._lock:
+                if not self._pending:
+                    self._active_drains -= 1
+                    return
+                batch = [self._pending.popleft() for _ in range(min(self._max_batch_rows, len(self._pending)))]
+            try:
+                self._score(batch)
+            except Exception as e:
+                self._logger.error("Shadow scoring failed", rows=len(batch), error=str(e))
+
+    def _score(self, batch: list[_Row]) -> None:
+        features = np.vstack([row[1] for row in batch])
+        served = [row[2] for row in batch]
+        engine = self._rule_engine()
+        served_decisions = [
+            engine.assess(transaction, score.value).decision.value for (transaction, _, _), score in zip(batch, served)
+        ]
+        scored_at = datetime.now(timezone.utc).isoformat()
+        records: list[dict[str, Any]] = []
+        for candidate in self._candidates:
+            totals = self._totals[candidate.version]
+            started = time.perf_counter()
+            try:
+                candidate_scores = np.asarray(candidate.model.predict_proba(features))[:, 1].astype(float).tolist()
+            except Exception as e:
+                with self._lock:
+                    totals.errors += len(batch)
+                self._logger.error("Shadow model failed", version=candidate.version, error=str(e))
+                continue
+            if self._inference_histogram is not None:
+                self._inference_histogram.observe(time.perf_counter() - started)
+            flips = 0
+            delta_sum = 0.0
+            abs_delta_sum = 0.0
+            max_abs_delta = 0.0
+            transitions: dict[str, int] = {}
+            for (transaction, _, _), score, served_decision, candidate_score in zip(
+                batch, served, served_decisions, candidate_scores
+            ):
+                delta = candidate_score - score.value
+                candidate_decision = engine.assess(transaction, candidate_score).decision.value
+                flipped = candidate_decision != served_decision
+                if flipped:
+                    flips += 1
+                    key = f"{served_decision}->{candidate_decision}"
+                    transitions[key] = transitions.get(key, 0) + 1
+                delta_sum += delta
+                abs_delta_sum += abs(delta)
+                max_abs_delta = max(max_abs_delta, abs(delta))
+                if self._delta_histogram is not None:
+                    self._delta_histogram.observe(abs(delta))
+                records.append(
+                    {
+                        "scored_at": scored_at,
+                        "transaction_id": str(transaction.transaction_id.value),
+                        "served_version": score.model_version,
+                        "candidate_version": candidate.version,
+                        "served_score": score.value,
+                        "candidate_score": candidate_score,
+                        "delta": delta,
+                        "served_decision": served_decision,
+                        "candidate_decision": candidate_decision,
+                        "decision_flip": flipped,
+                    }
+                )
+            with self._lock:
+                totals.rows += len(batch)
+                totals.flips += flips
+                totals.delta_sum += delta_sum
+                totals.abs_delta_sum += abs_delta_sum
+                totals.max_abs_delta = max(totals.max_abs_delta, max_abs_delta)
+                for key, count in transitions.items():
+                    totals.transitions[key] = totals.transitions.get(key, 0) + count
+        self._sink.write_many(records)
+
+
+def _candidate_stats(version: str, totals: _CandidateTotals) -> CandidateStats:
+    rows = totals.rows
+    return CandidateStats(
+        version=version,
+        rows=rows,
+        errors=totals.errors,
+        decision_flips=totals.flips,
+        flip_rate=totals.flips / rows if rows else 0.0,
+        mean_delta=totals.delta_sum / rows if rows else 0.0,
+        mean_abs_delta=totals.abs_delta_sum / rows if rows else 0.0,
+        max_abs_delta=totals.max_abs_delta,
+        flips=dict(totals.transitions),
+    )
@@ -1,14 +1,51 @@
-from sqlalchemy import text
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+import time
+from typing import Any, TypedDict
+
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.adapters.outbound.metrics.histogram import Histogram, HistogramSnapshot
 
 
 class Base(DeclarativeBase):
     pass
 
 
+class DatabasePoolStats(TypedDict):
+    size: int
+    checked_out: int
+    overflow: int
+    checked_in: int
+    wait_seconds: HistogramSnapshot
+    checkout_seconds: HistogramSnapshot
+
+
+class _InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    wait_histogram: Histogram | None = None
+
+    def _do_get(self) -> Any:
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            if self.wait_histogram is not None:
+                self.wait_histogram.observe(time.perf_counter() - started)
+
+
 class Database:
-    def __init__(self, database_url: str) -> None:
+    def __init__(
+        self,
+        database_url: str,
+        pool_size: int = 5,
+        max_overflow: int = 10,
+        pool_timeout_seconds: float = 30.0,
+        pool_pre_ping: bool = False,
+        pool_recycle_seconds: int = -1,
+        statement_cache_size: int = 500,
+        prepare_threshold: int | None = 5,
+    ) -> None:
         if database_url.startswith("postgresql://"):
             database_url = database_url.replace("postgresql://", "postgresql+psycopg://", 1)
         elif not database_url.startswith("postgresql+psycopg://"):
@@ -16,13 +53,38 @@ class Database:
         if "supabase.co" in database_url and "sslmode" not in database_url:
             separator = "&" if "?" in database_url else "?"
             database_url = f"{database_url}{separator}sslmode=require"
-        self._engine = create_async_engine(database_url, echo=False)
+        self._wait_histogram = Histogram()
+        self._checkout_histogram = Histogram()
+        engine_options: dict[str, Any] = {
+            "echo": False,
+            "pool_pre_ping": pool_pre_ping,
+            "pool_recycle": pool_recycle_seconds,
+            "query_cache_size": statement_cache_size,
+        }
+        if database_url.startswith("postgresql+psycopg://"):
+            engine_options.update(
+                poolclass=_InstrumentedQueuePool,
+                pool_size=pool_size,
+                max_overflow=max_overflow,
+                pool_timeout=pool_timeout_seconds,
+                connect_args={"prepare_threshold": prepare_threshold},
+            )
+        self._engine = create_async_engine(database_url, **engine_options)
+        pool = self._engine.sync_engine.pool
+        if isinstance(pool, _InstrumentedQueuePool):
+            pool.wait_histogram = self._wait_histogram
+        event.listen(pool, "checkout", self._on_checkout)
+        event.listen(pool, "checkin", self._on_checkin)
         self._session_factory = async_sessionmaker(
             self._engine,
             class_=AsyncSession,
             expire_on_commit=False,
         )
 
+    @property
+    def engine(self) -> AsyncEngine:
+        return self._engine
+
     async def get_session(self) -> AsyncSession:
         async with self._session_factory() as session:
             yield session
@@ -38,6 +100,41 @@ class Database:
             logger.error(f"Database connection test failed: {e}", exc_info=True)
             return False
 
+    @property
+    def wait_histogram(self) -> Histogram:
+        return self._wait_histogram
+
+    @property
+    def checkout_histogram(self) -> Histogram:
+        return self._checkout_histogram
+
+    def pool_stats(self) -> DatabasePoolStats:
+        pool = self._engine.sync_engine.pool
+        if not isinstance(pool, AsyncAdaptedQueuePool):
+            return DatabasePoolStats(
+                size=0,
+                checked_out=0,
+                overflow=0,
+                checked_in=0,
+                wait_seconds=self._wait_histogram.snapshot(),
+                checkout_seconds=self._checkout_histogram.snapshot(),
+            )
+        return DatabasePoolStats(
+            size=pool.size(),
+            checked_out=pool.checkedout(),
+            overflow=pool.overflow(),
+            checked_in=pool.checkedin(),
+            wait_seconds=self._wait_histogram.snapshot(),
+            checkout_seconds=self._checkout_histogram.snapshot(),
+        )
+
     async def close(self) -> None:
         await self._engine.dispose()
 
+    def _on_checkout(self, dbapi_connection: Any, connection_record: Any, connection_proxy: Any) -> None:
+        connection_record.info["checked_out_at"] = time.perf_counter()
+
+    def _on_checkin(self, dbapi_connection: Any, connection_record: Any) -> None:
+        checked_out_at = connection_record.info.pop("checked_out_at", None)
+        if checked_out_at is not None:
+            self._checkout_histogram.observe(time.perf_counter() - checked_out_at)
@@ -0,0 +1,45 @@
+import asyncio
+import time
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.adapters.outbound.logging.logger import StructuredLogger
+
+_MAX_ID = "SELECT COALESCE(MAX(id), 0) FROM transactions"
+
+_BACKFILL_CHUNK = """
+UPDATE transactions
+SET amount_numeric = amount::numeric, metadata_jsonb = metadata::jsonb
+WHERE id > :start AND id <= :end AND amount_numeric IS NULL
+"""
+
+
+class TypedColumnBackfill:
+    def __init__(self, engine: AsyncEngine, logger: StructuredLogger) -> None:
+        self._engine = engine
+        self._logger = logger
+
+    async def run(self, chunk_size: int, start_id: int = 0, pause_seconds: float = 0.0) -> int:
+        async with self._engine.connect() as connection:
+            max_id = (await connection.execute(text(_MAX_ID))).scalar_one()
+        updated = 0
+        started_at = time.perf_counter()
+        cursor = start_id
+        while cursor < max_id:
+            end = cursor + chunk_size
+            async with self._engine.begin() as connection:
+                result = await connection.execute(text(_BACKFILL_CHUNK), {"start": cursor, "end": end})
+                updated += result.rowcount
+            cursor = end
+            elapsed = time.perf_counter() - started_at
+            self._logger.info(
+                "Backfilled chunk",
+                last_id=min(cursor, max_id),
+                max_id=max_id,
+                rows=updated,
+                rows_per_second=round(updated / elapsed, 1) if elapsed else 0.0,
+            )
+            if pause_seconds:
+                await asyncio.sleep(pause_seconds)
+        return updated
@@ -0,0 +1,26 @@
+from dataclasses import dataclass
+
+
+class MigrationError(RuntimeError):
+    pass
+
+
+@dataclass(frozen=True)
+class ConcurrentIndex:
+    name: str
+    table: str
+    columns: tuple[str, ...]
+    unique: bool = False
+
+    def create_statement(self) -> str:
+        unique = "UNIQUE " if self.unique else ""
+        columns = ", ".join(self.columns)
+        return f"CREATE {unique}INDEX CONCURRENTLY IF NOT EXISTS {self.name} ON {self.table} ({columns})"
+
+
+@dataclass(frozen=True)
+class Migration:
+    version: int
+    description: str
+    statements: tuple[str | ConcurrentIndex, ...]
+    transactional: bool = True
@@ -0,0 +1,89 @@
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from app.adapters.outbound.logging.logger import StructuredLogger
+from app.adapters.outbound.persistence.migrations.migration import ConcurrentIndex, Migration, MigrationError
+from app.adapters.outbound.persistence.migrations.versions import MIGRATIONS
+
+_CREATE_VERSION_TABLE = """
+CREATE TABLE IF NOT EXISTS schema_migrations (
+    version INTEGER PRIMARY KEY,
+    description VARCHAR NOT NULL,
+    applied_at TIMESTAMP WITHOUT TIME ZONE NOT NULL DEFAULT (now() AT TIME ZONE 'utc')
+)
+"""
+
+_RECORD_VERSION = "INSERT INTO schema_migrations (version, description) VALUES (:version, :description)"
+
+_INDEX_VALID = """
+SELECT i.indisvalid
+FROM pg_index i
+JOIN pg_class c ON c.oid = i.indexrelid
+JOIN pg_namespace n ON n.oid = c.relnamespace
+WHERE c.relname = :name AND n.nspname = current_schema()
+"""
+
+
+class MigrationRunner:
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        logger: StructuredLogger,
+        migrations: tuple[Migration, ...] = MIGRATIONS,
+    ) -> None:
+        self._engine = engine
+        self._logger = logger
+        self._migrations = tuple(sorted(migrations, key=lambda m: m.version))
+
+    async def applied_versions(self) -> set[int]:
+        async with self._engine.begin() as connection:
+            await connection.execute(text(_CREATE_VERSION_TABLE))
+            result = await connection.execute(text("SELECT version FROM schema_migrations"))
+            return {row[0] for row in result}
+
+    async def pending(self) -> list[Migration]:
+        applied = await self.applied_versions()
+        return [m for m in self._migrations if m.version not in applied]
+
+    async def upgrade(self, target: int | None = None) -> list[Migration]:
+        applied: list[Migration] = []
+        for migration in await self.pending():
+            if target is not None and migration.version > target:
+                break
+            self._logger.info("Applying migration", version=migration.version, description=migration.description)
+            if migration.transactional:
+                async with self._engine.begin() as connection:
+                    for statement in migration.statements:
+                        if isinstance(statement, ConcurrentIndex):
+                            raise MigrationError(f"Migration {migration.version} builds {statement.name} concurrently")
+                        await connection.execute(text(statement))
+                    await connection.execute(text(_RECORD_VERSION), _version_params(migration))
+            else:
+                async with self._engine.connect() as connection:
+                    autocommit = await connection.execution_options(isolation_level="AUTOCOMMIT")
+                    for statement in migration.statements:
+                        if isinstance(statement, ConcurrentIndex):
+                            await self._create_index_concurrently(autocommit, statement)
+                        else:
+                            await autocommit.execute(text(statement))
+                    await autocommit.execute(text(_RECORD_VERSION), _version_params(migration))
+            applied.append(migration)
+        return applied
+
+    async def _create_index_concurrently(self, connection: AsyncConnection, index: ConcurrentIndex) -> None:
+        if await _index_valid(connection, index.name) is False:
+            self._logger.error("Dropping invalid index left by a failed build", index=index.name)
+            await connection.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {index.name}"))
+        await connection.execute(text(index.create_statement()))
+        if not await _index_valid(connection, index.name):
+            raise MigrationError(f"Index {index.name} was not built or is invalid")
+
+
+async def _index_valid(connection: AsyncConnection, name: str) -> bool | None:
+    result = await connection.execute(text(_INDEX_VALID), {"name": name})
+    valid = result.scalar_one_or_none()
+    return None if valid is None else bool(valid)
+
+
+def _version_params(migration: Migration) -> dict[str, int | str]:
+    return {"version": migration.version, "description": migration.description}
@@ -0,0 +1,136 @@
+from app.adapters.outbound.persistence.migrations.migration import ConcurrentIndex, Migration
+
+MIGRATIONS: tuple[Migration, ...] = (
+    Migration(
+        version=1,
+        description="Initial schema",
+        statements=(
+            """
+            CREATE TABLE IF NOT EXISTS transactions (
+                id SERIAL PRIMARY KEY,
+                transaction_id VARCHAR NOT NULL,
+                user_id VARCHAR NOT NULL,
+                merchant_id VARCHAR NOT NULL,
+                amount VARCHAR NOT NULL,
+                timestamp TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+                metadata VARCHAR
+            )
+            """,
+            "CREATE INDEX IF NOT EXISTS ix_transactions_id ON transactions (id)",
+            "CREATE UNIQUE INDEX IF NOT EXISTS ix_transactions_transaction_id ON transactions (transaction_id)",
+            "CREATE INDEX IF NOT EXISTS ix_transactions_user_id ON transactions (user_id)",
+            """
+            CREATE TABLE IF NOT EXISTS fraud_decisions (
+                id SERIAL PRIMARY KEY,
+                transaction_id VARCHAR NOT NULL REFERENCES transactions (transaction_id),
+                risk_score DOUBLE PRECISION NOT NULL,
+                decision VARCHAR NOT NULL,
+                timestamp TIMESTAMP WITHOUT TIME ZONE NOT NULL
+            )
+            """,
+            "CREATE INDEX IF NOT EXISTS ix_fraud_decisions_id ON fraud_decisions (id)",
+            "CREATE INDEX IF NOT EXISTS ix_fraud_decisions_transaction_id ON fraud_decisions (transaction_id)",
+        ),
+    ),
+    Migration(
+        version=2,
+        description="Add typed amount and metadata columns for backfill",
+        statements=(
+            "ALTER TABLE transactions ADD COLUMN IF NOT EXISTS amount_numeric NUMERIC",
+            "ALTER TABLE transactions ADD COLUMN IF NOT EXISTS metadata_jsonb JSONB",
+        ),
+    ),
+    Migration(
+        version=3,
+        description="Add composite indexes for history and analytics queries",
+        statements=(
+            ConcurrentIndex("ix_transactions_user_id_timestamp", "transactions", ("user_id", "timestamp")),
+            ConcurrentIndex("ix_transactions_merchant_id_timestamp", "transactions", ("merchant_id", "timestamp")),
+            ConcurrentIndex(
+                "ix_fraud_decisions_transaction_id_timestamp", "fraud_decisions", ("transaction_id", "timestamp")
+            ),
+            ConcurrentIndex("ix_fraud_decisions_timestamp_id", "fraud_decisions", ("timestamp", "id")),
+        ),
+        transactional=False,
+    ),
+    Migration(
+        version=4,
+        description="Swap typed amount and metadata columns into place",
+        statements=(
+            """
+            UPDATE transactions
+            SET amount_numeric = amount::numeric, metadata_jsonb = metadata::jsonb
+            WHERE amount_numeric IS NULL
+            """,
+            "ALTER TABLE transactions DROP COLUMN amount",
+            "ALTER TABLE transactions DROP COLUMN metadata",
+            "ALTER TABLE transactions RENAME COLUMN amount_numeric TO amount",
+            "ALTER TABLE transactions RENAME COLUMN metadata_jsonb TO metadata",
+            "ALTER TABLE transactions ALTER COLUMN amount SET NOT NULL",
+        ),
+    ),
+    Migration(
+        version=5,
+        description="Index numeric amount for range queries",
+        statements=(
+            ConcurrentIndex("ix_transactions_amount", "transactions", ("amount",)),
+        ),
+        transactional=False,
+    ),
+    Migration(
+        version=6,
+        description="Record the model version that produced each fraud decision",
+        statements=("ALTER TABLE fraud_decisions ADD COLUMN IF NOT EXISTS model_version VARCHAR",),
+    ),
+    Migration(
+        version=7,
+        description="Record the risk rules that matched each fraud decision",
+        statements=("ALTER TABLE fraud_decisions ADD COLUMN IF NOT EXISTS matched_rules JSONB",),
+    ),
+    Migration(
+        version=8,
+        description="Allow one fraud decision per transaction for idempotent assessment",
+        statements=(
+            """
+            DELETE FROM fraud_decisions duplicate
+            USING fraud_decisions original
+            WHERE duplicate.transaction_id = original.transaction_id AND duplicate.id > original.id
+            """,
+            ConcurrentIndex(
+                "ix_fraud_decisions_transaction_id_unique", "fraud_decisions", ("transaction_id",), unique=True
+            ),
+            "DROP INDEX CONCURRENTLY IF EXISTS ix_fraud_decisions_transaction_id",
+            "ALTER INDEX ix_fraud_decisions_transaction_id_unique RENAME TO ix_fraud_decisions_transaction_id",
+        ),
+        transactional=False,
+    ),
+    Migration(
+        version=9,
+        description="Add rescored_decisions for offline rescoring runs",
+        statements=(
+            """
+            CREATE TABLE IF NOT EXISTS rescored_decisions (
+                id SERIAL PRIMARY KEY,
+                run_id VARCHAR NOT NULL,
+                transaction_id VARCHAR NOT NULL,
+                risk_score DOUBLE PRECISION NOT NULL,
+                decision VARCHAR NOT NULL,
+                model_version VARCHAR,
+                matched_rules JSONB,
+                previous_risk_score DOUBLE PRECISION,
+                previous_decision VARCHAR,
+                previous_model_version VARCHAR,
+                scored_at TIMESTAMP WITHOUT TIME ZONE NOT NULL
+            )
+            """,
+            "CREATE UNIQUE INDEX IF NOT EXISTS ix_rescored_decisions_run_id_transaction_id "
+            "ON rescored_decisions (run_id, transaction_id)",
+        ),
+    ),
+    Migration(
+        version=10,
+        description="Index transactions by time for rescoring windows",
+        statements=(ConcurrentIndex("ix_transactions_timestamp_id", "transactions", ("timestamp", "id")),),
+        transactional=False,
+    ),
+)
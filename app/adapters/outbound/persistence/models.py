@@ -1,6 +1,7 @@
 from datetime import datetime
 
-from sqlalchemy import Column, DateTime, Float, ForeignKey, Integer, String
+from sqlalchemy import JSON, Column, DateTime, Float, ForeignKey, Index, Integer, Numeric, String
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 
 from app.adapters.outbound.persistence.database import Base
@@ -8,26 +9,58 @@ from app.adapters.outbound.persistence.database import Base
 
 class TransactionModel(Base):
     __tablename__ = "transactions"
+    __table_args__ = (
+        Index("ix_transactions_user_id_timestamp", "user_id", "timestamp"),
+        Index("ix_transactions_merchant_id_timestamp", "merchant_id", "timestamp"),
+        Index("ix_transactions_amount", "amount"),
+        Index("ix_transactions_timestamp_id", "timestamp", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     transaction_id = Column(String, unique=True, index=True, nullable=False)
     user_id = Column(String, nullable=False, index=True)
     merchant_id = Column(String, nullable=False)
-    amount = Column(String, nullable=False)
+    amount = Column(Numeric, nullable=False)
     timestamp = Column(DateTime, nullable=False)
-    transaction_metadata = Column("metadata", String, nullable=True)
+    transaction_metadata = Column("metadata", JSON().with_variant(JSONB, "postgresql"), nullable=True)
 
     fraud_decisions = relationship("FraudDecisionModel", back_populates="transaction")
 
 
 class FraudDecisionModel(Base):
     __tablename__ = "fraud_decisions"
+    __table_args__ = (
+        Index("ix_fraud_decisions_transaction_id_timestamp", "transaction_id", "timestamp"),
+        Index("ix_fraud_decisions_timestamp_id", "timestamp", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    transaction_id = Column(String, ForeignKey("transactions.transaction_id"), nullable=False, index=True)
+    transaction_id = Column(
+        String, ForeignKey("transactions.transaction_id"), unique=True, index=True, nullable=False
+    )
     risk_score = Column(Float, nullable=False)
     decision = Column(String, nullable=False)
     timestamp = Column(DateTime, nullable=False)
+    model_version = Column(String, nullable=True)
+    matched_rules = Column(JSON().with_variant(JSONB, "postgresql"), nullable=True)
 
     transaction = relationship("TransactionModel", back_populates="fraud_decisions")
 
+
+class RescoredDecisionModel(Base):
+    __tablename__ = "rescored_decisions"
+    __table_args__ = (
+        Index("ix_rescored_decisions_run_id_transaction_id", "run_id", "transaction_id", unique=True),
+    )
+
+    id = Column(Integer, primary_key=True)
+    run_id = Column(String, nullable=False)
+    transaction_id = Column(String, nullable=False)
+    risk_score = Column(Float, nullable=False)
+    decision = Column(String, nullable=False)
+    model_version = Column(String, nullable=True)
+    matched_rules = Column(JSON().with_variant(JSONB, "postgresql"), nullable=True)
+    previous_risk_score = Column(Float, nullable=True)
+    previous_decision = Column(String, nullable=True)
+    previous_model_version = Column(String, nullable=True)
+    scored_at = Column(DateTime, nullable=False)
@@ -0,0 +1,138 @@
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from itertools import count
+from typing import TypedDict
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.adapters.outbound.logging.logger import StructuredLogger
+from app.adapters.outbound.persistence.database import Database
+
+
+class ReplicaHealth(TypedDict):
+    name: str
+    status: str
+    latency_ms: float | None
+    last_checked_seconds_ago: float | None
+
+
+class RecentWrites:
+    def __init__(self, window_seconds: float, max_entries: int) -> None:
+        self._window = window_seconds
+        self._max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, str], float] = OrderedDict()
+
+    def mark(self, transaction_ids: Iterable[str], user_ids: Iterable[str]) -> None:
+        expires_at = time.monotonic() + self._window
+        for key in [("transaction", t) for t in transaction_ids] + [("user", u) for u in user_ids]:
+            self._entries[key] = expires_at
+            self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def contains(self, transaction_id: str | None = None, user_id: str | None = None) -> bool:
+        now = time.monotonic()
+        for kind, value in (("transaction", transaction_id), ("user", user_id)):
+            if value is None:
+                continue
+            key = (kind, value)
+            expires_at = self._entries.get(key)
+            if expires_at is None:
+                continue
+            if expires_at >= now:
+                return True
+            del self._entries[key]
+        return False
+
+
+class _Replica:
+    __slots__ = ("name", "database", "healthy", "latency_ms", "checked_at")
+
+    def __init__(self, name: str, database: Database) -> None:
+        self.name = name
+        self.database = database
+        self.healthy = True
+        self.latency_ms: float | None = None
+        self.checked_at: float | None = None
+
+
+class ReadRouter:
+    def __init__(
+        self,
+        primary: Database,
+        replicas: list[Database],
+        recent_writes: RecentWrites,
+        logger: StructuredLogger,
+        health_interval_seconds: float,
+    ) -> None:
+        self._primary = primary
+        self._replicas = [
+            _Replica(database.engine.url.render_as_string(hide_password=True), database)
+            for database in replicas
+        ]
+        self._recent_writes = recent_writes
+        self._logger = logger
+        self._health_interval = health_interval_seconds
+        self._next = count()
+        self._monitor: asyncio.Task[None] | None = None
+
+    @property
+    def recent_writes(self) -> RecentWrites:
+        return self._recent_writes
+
+    def read_session(self, transaction_id: str | None = None, user_id: str | None = None) -> AsyncSession:
+        if self._recent_writes.contains(transaction_id=transaction_id, user_id=user_id):
+            return self._primary._session_factory()
+        healthy = [replica for replica in self._replicas if replica.healthy]
+        if not healthy:
+            return self._primary._session_factory()
+        replica = healthy[next(self._next) % len(healthy)]
+        return replica.database._session_factory()
+
+    async def start(self) -> None:
+        if self._replicas and self._monitor is None:
+            await self.check_health()
+            self._monitor = asyncio.create_task(self._monitor_health())
+
+    async def check_health(self) -> list[ReplicaHealth]:
+        for replica in self._replicas:
+            started = time.perf_counter()
+            healthy = await replica.database.test_connection()
+            replica.checked_at = time.monotonic()
+            replica.latency_ms = (time.perf_counter() - started) * 1000 if healthy else None
+            if healthy and not replica.healthy:
+                self._logger.info("Read replica recovered", replica=replica.name)
+            elif not healthy and replica.healthy:
+                self._logger.error("Read replica unhealthy", replica=replica.name)
+            replica.healthy = healthy
+        return self.health()
+
+    def health(self) -> list[ReplicaHealth]:
+        now = time.monotonic()
+        return [
+            ReplicaHealth(
+                name=replica.name,
+                status="healthy" if replica.healthy else "unhealthy",
+                latency_ms=replica.latency_ms,
+                last_checked_seconds_ago=now - replica.checked_at if replica.checked_at is not None else None,
+            )
+            for replica in self._replicas
+        ]
+
+    async def close(self) -> None:
+        if self._monitor is not None:
+            self._monitor.cancel()
+            try:
+                await self._monitor
+            except asyncio.CancelledError:
+                pass
+            self._monitor = None
+        for replica in self._replicas:
+            await replica.database.close()
+
+    async def _monitor_health(self) -> None:
+        while True:
+            await asyncio.sleep(self._health_interval)
+            await self.check_health()
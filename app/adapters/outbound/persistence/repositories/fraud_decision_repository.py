@@ -1,27 +1,38 @@
+from collections.abc import AsyncIterator, Sequence
 from datetime import datetime
+from typing import cast
 
-from sqlalchemy import select
+from sqlalchemy import Row, Select, literal, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.adapters.outbound.persistence.models import FraudDecisionModel, TransactionModel
 from app.domain.entities.fraud_decision import Decision, FraudDecision
+from app.domain.entities.fraud_decision_batch import FraudDecisionBatch
 from app.domain.ports.fraud_decision_repository_port import FraudDecisionRepositoryPort
+from app.domain.value_objects.fraud_history_filter import FraudHistoryFilter
+from app.domain.value_objects.history_cursor import HistoryCursor
 from app.domain.value_objects.transaction_id import TransactionId
 from app.domain.value_objects.user_id import UserId
 
+HistoryRow = tuple[str, float, str, datetime, str | None, list[str] | None, int]
+
 
 class FraudDecisionRepository:
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
 
+    def add(self, fraud_decision: FraudDecision) -> None:
+        self._session.add(self._to_model(fraud_decision))
+
+    def add_many(self, fraud_decisions: list[FraudDecision]) -> None:
+        self._session.add_all([self._to_model(d) for d in fraud_decisions])
+
     async def save(self, fraud_decision: FraudDecision) -> None:
-        model = FraudDecisionModel(
-            transaction_id=str(fraud_decision.transaction_id.value),
-            risk_score=fraud_decision.risk_score,
-            decision=fraud_decision.decision.value,
-            timestamp=fraud_decision.timestamp,
-        )
-        self._session.add(model)
+        self.add(fraud_decision)
+        await self._session.commit()
+
+    async def save_many(self, fraud_decisions: list[FraudDecision]) -> None:
+        self.add_many(fraud_decisions)
         await self._session.commit()
 
     async def find_by_transaction_id(self, transaction_id: TransactionId) -> FraudDecision | None:
@@ -34,6 +45,15 @@ class FraudDecisionRepository:
             return None
         return self._to_domain(model)
 
+    async def find_by_transaction_ids(self, transaction_ids: list[TransactionId]) -> list[FraudDecision]:
+        if not transaction_ids:
+            return []
+        stmt = select(FraudDecisionModel).where(
+            FraudDecisionModel.transaction_id.in_([str(t.value) for t in transaction_ids])
+        )
+        result = await self._session.execute(stmt)
+        return [self._to_domain(model) for model in result.scalars().all()]
+
     async def find_by_user_id(self, user_id: UserId) -> list[FraudDecision]:
         stmt = select(FraudDecisionModel).join(
             TransactionModel, FraudDecisionModel.transaction_id == TransactionModel.transaction_id
@@ -42,11 +62,85 @@ class FraudDecisionRepository:
         models = result.scalars().all()
         return [self._to_domain(model) for model in models]
 
+    async def find_page_by_user_id(
+        self,
+        user_id: UserId,
+        limit: int,
+        cursor: HistoryCursor | None = None,
+        history_filter: FraudHistoryFilter = FraudHistoryFilter(),
+    ) -> tuple[FraudDecisionBatch, HistoryCursor | None]:
+        stmt = self._history_query(user_id, history_filter)
+        if cursor is not None:
+            stmt = stmt.where(
+                tuple_(FraudDecisionModel.timestamp, FraudDecisionModel.id)
+                < tuple_(literal(cursor.timestamp), literal(cursor.id))
+            )
+        result = await self._session.execute(stmt.limit(limit + 1))
+        rows = result.all()
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = HistoryCursor(timestamp=rows[-1].timestamp, id=rows[-1].id)
+        return self._to_batch(rows), next_cursor
+
+    async def stream_batches_by_user_id(
+        self,
+        user_id: UserId,
+        history_filter: FraudHistoryFilter = FraudHistoryFilter(),
+        chunk_size: int = 1000,
+    ) -> AsyncIterator[FraudDecisionBatch]:
+        stmt = self._history_query(user_id, history_filter).execution_options(yield_per=chunk_size)
+        result = await self._session.stream(stmt)
+        async for rows in result.partitions(chunk_size):
+            yield self._to_batch(rows)
+
+    def _history_query(self, user_id: UserId, history_filter: FraudHistoryFilter) -> Select[HistoryRow]:
+        stmt = (
+            select(
+                FraudDecisionModel.transaction_id,
+                FraudDecisionModel.risk_score,
+                FraudDecisionModel.decision,
+                FraudDecisionModel.timestamp,
+                FraudDecisionModel.model_version,
+                FraudDecisionModel.matched_rules,
+                FraudDecisionModel.id,
+            )
+            .join(TransactionModel, FraudDecisionModel.transaction_id == TransactionModel.transaction_id)
+            .where(TransactionModel.user_id == user_id.value)
+            .order_by(FraudDecisionModel.timestamp.desc(), FraudDecisionModel.id.desc())
+        )
+        if history_filter.start is not None:
+            stmt = stmt.where(FraudDecisionModel.timestamp >= history_filter.start)
+        if history_filter.end is not None:
+            stmt = stmt.where(FraudDecisionModel.timestamp < history_filter.end)
+        if history_filter.decision is not None:
+            stmt = stmt.where(FraudDecisionModel.decision == history_filter.decision.value)
+        return stmt
+
+    def _to_batch(self, rows: Sequence[Row[HistoryRow]]) -> FraudDecisionBatch:
+        batch = FraudDecisionBatch()
+        append = batch.append
+        for transaction_id, risk_score, decision, timestamp, model_version, matched_rules, _ in rows:
+            append(transaction_id, risk_score, decision, timestamp, model_version, matched_rules)
+        return batch
+
+    def _to_model(self, fraud_decision: FraudDecision) -> FraudDecisionModel:
+        return FraudDecisionModel(
+            transaction_id=str(fraud_decision.transaction_id.value),
+            risk_score=fraud_decision.risk_score,
+            decision=fraud_decision.decision.value,
+            timestamp=fraud_decision.timestamp,
+            model_version=fraud_decision.model_version,
+            matched_rules=list(fraud_decision.matched_rules) or None,
+        )
+
     def _to_domain(self, model: FraudDecisionModel) -> FraudDecision:
         return FraudDecision(
             transaction_id=TransactionId.create(model.transaction_id),
             risk_score=model.risk_score,
             decision=Decision(model.decision),
             timestamp=model.timestamp,
+            model_version=cast(str | None, model.model_version),
+            matched_rules=tuple(model.matched_rules or ()),
         )
 
@@ -0,0 +1,29 @@
+from typing import Any
+
+from sqlalchemy import insert
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.adapters.outbound.persistence.database import Base
+from app.adapters.outbound.persistence.models import RescoredDecisionModel
+
+_CONFLICT_COLUMNS = ["run_id", "transaction_id"]
+
+
+class RescoredDecisionRepository:
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def save_many(self, rows: list[dict[str, Any]]) -> None:
+        if not rows:
+            return
+        table = Base.metadata.tables[RescoredDecisionModel.__tablename__]
+        dialect = self._session.get_bind().dialect.name
+        if dialect == "postgresql":
+            stmt: Any = postgresql.insert(table).on_conflict_do_nothing(index_elements=_CONFLICT_COLUMNS)
+        elif dialect == "sqlite":
+            stmt = sqlite.insert(table).on_conflict_do_nothing(index_elements=_CONFLICT_COLUMNS)
+        else:
+            stmt = insert(table)
+        await self._session.execute(stmt, rows)
+        await self._session.commit()
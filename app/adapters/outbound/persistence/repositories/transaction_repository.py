@@ -1,7 +1,8 @@
+from collections.abc import AsyncIterator
 from datetime import datetime
-from typing import Any
+from typing import Any, cast
 
-from sqlalchemy import select
+from sqlalchemy import Select, func, literal, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.adapters.outbound.persistence.models import TransactionModel
@@ -17,18 +18,18 @@ class TransactionRepository:
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
 
+    def add(self, transaction: Transaction) -> None:
+        self._session.add(self._to_model(transaction))
+
+    def add_many(self, transactions: list[Transaction]) -> None:
+        self._session.add_all([self._to_model(t) for t in transactions])
+
     async def save(self, transaction: Transaction) -> None:
-        import json
+        self.add(transaction)
+        await self._session.commit()
 
-        model = TransactionModel(
-            transaction_id=str(transaction.transaction_id.value),
-            user_id=transaction.user_id.value,
-            merchant_id=transaction.merchant_id.value,
-            amount=str(transaction.amount.value),
-            timestamp=transaction.timestamp,
-            transaction_metadata=json.dumps(transaction.metadata) if transaction.metadata else None,
-        )
-        self._session.add(model)
+    async def save_many(self, transactions: list[Transaction]) -> None:
+        self.add_many(transactions)
         await self._session.commit()
 
     async def find_by_id(self, transaction_id: TransactionId) -> Transaction | None:
@@ -41,12 +42,97 @@ class TransactionRepository:
             return None
         return self._to_domain(model)
 
-    def _to_domain(self, model: TransactionModel) -> Transaction:
-        import json
+    async def find_by_ids(self, transaction_ids: list[TransactionId]) -> list[Transaction]:
+        if not transaction_ids:
+            return []
+        stmt = select(TransactionModel).where(
+            TransactionModel.transaction_id.in_([str(t.value) for t in transaction_ids])
+        )
+        result = await self._session.execute(stmt)
+        return [self._to_domain(model) for model in result.scalars().all()]
 
+    async def iter_since(self, since: datetime, chunk_size: int = 10000) -> AsyncIterator[Transaction]:
+        stmt = (
+            select(TransactionModel)
+            .where(TransactionModel.timestamp >= since)
+            .order_by(TransactionModel.timestamp)
+            .execution_options(yield_per=chunk_size)
+        )
+        result = await self._session.stream_scalars(stmt)
+        async for model in result:
+            yield self._to_domain(model)
+
+    async def count_in_range(self, start: datetime | None = None, end: datetime | None = None) -> int:
+        stmt = self._window(select(func.count()).select_from(TransactionModel), start, end)
+        result = await self._session.execute(stmt)
+        return int(result.scalar_one())
+
+    async def find_id_range(
+        self, start: datetime | None = None, end: datetime | None = None
+    ) -> tuple[int, int] | None:
+        stmt = self._window(select(func.min(TransactionModel.id), func.max(TransactionModel.id)), start, end)
+        first_id, last_id = (await self._session.execute(stmt)).one()
+        if first_id is None or last_id is None:
+            return None
+        return int(first_id), int(last_id)
+
+    async def find_chunk_after(
+        self,
+        after_id: int = 0,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        limit: int = 10000,
+        max_id: int | None = None,
+    ) -> tuple[int, list[Transaction]]:
+        stmt = self._window(select(TransactionModel), start, end).where(TransactionModel.id > after_id)
+        if max_id is not None:
+            stmt = stmt.where(TransactionModel.id <= max_id)
+        result = await self._session.execute(stmt.order_by(TransactionModel.id).limit(limit))
+        models = result.scalars().all()
+        if not models:
+            return after_id, []
+        return models[-1].id, [self._to_domain(model) for model in models]
+
+    async def find_chunk_after_timestamp(
+        self,
+        after: tuple[datetime, int] | None = None,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        limit: int = 10000,
+    ) -> tuple[tuple[datetime, int] | None, list[Transaction]]:
+        stmt = self._window(select(TransactionModel), start, end)
+        if after is not None:
+            stmt = stmt.where(
+                tuple_(TransactionModel.timestamp, TransactionModel.id) > tuple_(literal(after[0]), literal(after[1]))
+            )
+        stmt = stmt.order_by(TransactionModel.timestamp, TransactionModel.id).limit(limit)
+        result = await self._session.execute(stmt)
+        models = result.scalars().all()
+        if not models:
+            return after, []
+        return (models[-1].timestamp, models[-1].id), [self._to_domain(model) for model in models]
+
+    def _window(self, stmt: Select[Any], start: datetime | None, end: datetime | None) -> Select[Any]:
+        if start is not None:
+            stmt = stmt.where(TransactionModel.timestamp >= start)
+        if end is not None:
+            stmt = stmt.where(TransactionModel.timestamp < end)
+        return stmt
+
+    def _to_model(self, transaction: Transaction) -> TransactionModel:
+        return TransactionModel(
+            transaction_id=str(transaction.transaction_id.value),
+            user_id=transaction.user_id.value,
+            merchant_id=transaction.merchant_id.value,
+            amount=transaction.amount.value,
+            timestamp=transaction.timestamp,
+            transaction_metadata=dict(transaction.metadata) if transaction.metadata else None,
+        )
+
+    def _to_domain(self, model: TransactionModel) -> Transaction:
         metadata: TransactionMetadata | None = None
         if model.transaction_metadata:
-            metadata = json.loads(model.transaction_metadata)
+            metadata = cast(TransactionMetadata, dict(model.transaction_metadata))
         return Transaction(
             transaction_id=TransactionId.create(model.transaction_id),
             user_id=UserId.create(model.user_id),
@@ -0,0 +1,70 @@
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.adapters.outbound.persistence.read_routing import RecentWrites
+from app.adapters.outbound.persistence.repositories.fraud_decision_repository import (
+    FraudDecisionRepository,
+)
+from app.adapters.outbound.persistence.repositories.transaction_repository import (
+    TransactionRepository,
+)
+from app.domain.entities.fraud_decision import FraudDecision
+from app.domain.entities.transaction import Transaction
+from app.domain.exceptions import DuplicateTransactionError
+from app.domain.ports.unit_of_work_port import UnitOfWorkPort
+
+UNIQUE_VIOLATION = "23505"
+TRANSACTION_ID_CONSTRAINTS = frozenset({"ix_transactions_transaction_id", "ix_fraud_decisions_transaction_id"})
+SQLITE_TRANSACTION_ID_COLUMNS = ("transactions.transaction_id", "fraud_decisions.transaction_id")
+
+
+class SqlAlchemyUnitOfWork:
+    def __init__(self, session: AsyncSession, recent_writes: RecentWrites | None = None) -> None:
+        self._session = session
+        self._recent_writes = recent_writes
+        self._transactions: list[Transaction] = []
+        self._transaction_repository = TransactionRepository(session)
+        self._fraud_decision_repository = FraudDecisionRepository(session)
+
+    def add_transaction(self, transaction: Transaction) -> None:
+        self._transaction_repository.add(transaction)
+        self._transactions.append(transaction)
+
+    def add_transactions(self, transactions: list[Transaction]) -> None:
+        self._transaction_repository.add_many(transactions)
+        self._transactions.extend(transactions)
+
+    def add_fraud_decision(self, fraud_decision: FraudDecision) -> None:
+        self._fraud_decision_repository.add(fraud_decision)
+
+    def add_fraud_decisions(self, fraud_decisions: list[FraudDecision]) -> None:
+        self._fraud_decision_repository.add_many(fraud_decisions)
+
+    async def commit(self) -> None:
+        try:
+            await self._session.commit()
+        except IntegrityError as e:
+            if not _is_duplicate_transaction(e):
+                raise
+            raise DuplicateTransactionError(f"Transaction already recorded: {e.orig}") from e
+        transactions, self._transactions = self._transactions, []
+        if self._recent_writes is not None:
+            self._recent_writes.mark(
+                (str(t.transaction_id.value) for t in transactions),
+                (t.user_id.value for t in transactions),
+            )
+
+    async def rollback(self) -> None:
+        await self._session.rollback()
+        self._transactions = []
+
+
+def _is_duplicate_transaction(error: IntegrityError) -> bool:
+    sqlstate = getattr(error.orig, "sqlstate", None)
+    if sqlstate is not None:
+        diag = getattr(error.orig, "diag", None)
+        return sqlstate == UNIQUE_VIOLATION and getattr(diag, "constraint_name", None) in TRANSACTION_ID_CONSTRAINTS
+    message = str(error.orig)
+    return message.startswith("UNIQUE constraint failed:") and any(
+        column in message for column in SQLITE_TRANSACTION_ID_COLUMNS
+    )
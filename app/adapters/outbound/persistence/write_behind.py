@@ -0,0 +1,442 @@
+import asyncio
+import json
+import os
+from collections.abc import Callable
+from datetime import datetime
+from decimal import Decimal
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import Table, insert
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import DBAPIError, InterfaceError, OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.adapters.outbound.logging.logger import StructuredLogger
+from app.adapters.outbound.persistence.database import Base
+from app.adapters.outbound.persistence.models import FraudDecisionModel, TransactionModel
+from app.adapters.outbound.persistence.read_routing import RecentWrites
+from app.adapters.outbound.persistence.repositories.fraud_decision_repository import FraudDecisionRepository
+from app.adapters.outbound.persistence.repositories.transaction_repository import TransactionRepository
+from app.domain.entities.fraud_decision import Decision, FraudDecision
+from app.domain.entities.transaction import Transaction
+from app.domain.ports.unit_of_work_port import UnitOfWorkPort
+from app.domain.value_objects.merchant_id import MerchantId
+from app.domain.value_objects.transaction_amount import TransactionAmount
+from app.domain.value_objects.transaction_id import TransactionId
+from app.domain.value_objects.user_id import UserId
+
+Row = dict[str, Any]
+
+_TRANSACTIONS = "transactions"
+_FRAUD_DECISIONS = "fraud_decisions"
+_ATTEMPTS = "attempts"
+_TABLES = {
+    _TRANSACTIONS: Base.metadata.tables[TransactionModel.__tablename__],
+    _FRAUD_DECISIONS: Base.metadata.tables[FraudDecisionModel.__tablename__],
+}
+
+
+class WriteBehindQueue:
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        logger: StructuredLogger,
+        max_size: int,
+        batch_size: int,
+        flush_interval_ms: int,
+        spill_path: str,
+        dead_letter_path: str | None = None,
+        max_attempts: int = 3,
+        restart_delay_seconds: float = 1.0,
+        max_retry_delay_seconds: float = 30.0,
+    ) -> None:
+        self._session_factory = session_factory
+        self._logger = logger
+        self._queue: asyncio.Queue[Row | None] = asyncio.Queue(maxsize=max_size)
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval_ms / 1000
+        self._spill_path = Path(spill_path)
+        self._dead_letter_path = (
+            Path(dead_letter_path) if dead_letter_path else self._spill_path.with_suffix(".dead.ndjson")
+        )
+        self._max_attempts = max_attempts
+        self._restart_delay = restart_delay_seconds
+        self._max_retry_delay = max_retry_delay_seconds
+        self._retry_delay = 0.0
+        self._retry_at = 0.0
+        self._flusher: asyncio.Task[None] | None = None
+        self._unflushed: dict[tuple[str, str], Row] = {}
+
+    async def start(self) -> None:
+        if self._flusher is None:
+            try:
+                self._track(await asyncio.to_thread(self._read_spill))
+            except OSError as e:
+                self._logger.error("Write-behind spill file unreadable", error=str(e))
+            self._flusher = asyncio.create_task(self._supervise())
+
+    async def put(self, rows: list[Row]) -> None:
+        self._track(rows)
+        for row in rows:
+            await self._queue.put(row)
+
+    def pending(self) -> int:
+        return self._queue.qsize()
+
+    def pending_transactions(self, transaction_ids: list[TransactionId]) -> list[Transaction]:
+        return [_transaction_from_row(row) for row in self._find_unflushed(_TRANSACTIONS, transaction_ids)]
+
+    def pending_fraud_decisions(self, transaction_ids: list[TransactionId]) -> list[FraudDecision]:
+        return [_fraud_decision_from_row(row) for row in self._find_unflushed(_FRAUD_DECISIONS, transaction_ids)]
+
+    async def close(self) -> None:
+        if self._flusher is None:
+            return
+        await self._queue.put(None)
+        await self._flusher
+        self._flusher = None
+
+    def _find_unflushed(self, table: str, transaction_ids: list[TransactionId]) -> list[Row]:
+        rows = (self._unflushed.get((table, str(t.value))) for t in transaction_ids)
+        return [row for row in rows if row is not None]
+
+    def _track(self, rows: list[Row]) -> None:
+        for row in rows:
+            self._unflushed[(row["table"], row["transaction_id"])] = row
+
+    def _untrack(self, rows: list[Row]) -> None:
+        for row in rows:
+            self._unflushed.pop((row["table"], row["transaction_id"]), None)
+
+    async def _supervise(self) -> None:
+        while True:
+            try:
+                await self._run()
+                return
+            except Exception as e:
+                self._logger.error("Write-behind flusher failed, restarting", error=str(e))
+                await asyncio.sleep(self._restart_delay)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                first = await asyncio.wait_for(self._queue.get(), self._flush_interval)
+            except asyncio.TimeoutError:
+                if self._spill_path.exists() and not self._backing_off():
+                    await self._flush([])
+                continue
+            if first is None:
+                await self._flush([])
+                return
+            batch = [first]
+            stop = False
+            while len(batch) < self._batch_size and not self._queue.empty():
+                row = self._queue.get_nowait()
+                if row is None:
+                    stop = True
+                    break
+                batch.append(row)
+            if self._backing_off():
+                await self._spill(batch)
+            else:
+                await self._flush(batch)
+            if stop:
+                await self._flush([])
+                return
+
+    async def _flush(self, rows: list[Row]) -> None:
+        try:
+            spilled = await asyncio.to_thread(self._read_spill)
+        except OSError as e:
+            self._logger.error("Write-behind spill file unreadable", error=str(e))
+            await self._spill(rows)
+            return
+        pending = spilled + rows
+        if not pending:
+            return
+        try:
+            skipped = await self._insert(pending)
+        except Exception as e:
+            if _is_transient(e):
+                self._back_off()
+                self._logger.error(
+                    "Write-behind flush failed, spilling rows",
+                    rows=len(rows),
+                    retry_in_seconds=self._retry_delay,
+                    error=str(e),
+                )
+                await self._spill(rows)
+                return
+            self._logger.error(
+                "Write-behind batch rejected, inserting rows one by one", rows=len(pending), error=str(e)
+            )
+            failed, skipped = await self._insert_each(pending)
+            self._untrack(pending)
+            self._track([row for row in failed if row.get(_ATTEMPTS, 0) < self._max_attempts])
+            await self._dead_letter_skipped(skipped)
+            try:
+                await asyncio.to_thread(self._replace_spill, failed)
+            except OSError as e:
+                self._logger.error("Write-behind rows lost, spill file not writable", rows=len(failed), error=str(e))
+            return
+        self._retry_delay = 0.0
+        self._untrack(pending)
+        await self._dead_letter_skipped(skipped)
+        if spilled:
+            await asyncio.to_thread(self._spill_path.unlink, True)
+            self._logger.info("Replayed write-behind spill file", rows=len(spilled))
+
+    def _backing_off(self) -> bool:
+        return asyncio.get_running_loop().time() < self._retry_at
+
+    def _back_off(self) -> None:
+        self._retry_delay = min(self._max_retry_delay, max(self._flush_interval, self._retry_delay * 2))
+        self._retry_at = asyncio.get_running_loop().time() + self._retry_delay
+
+    async def _insert_each(self, rows: list[Row]) -> tuple[list[Row], list[Row]]:
+        ordered = sorted(rows, key=lambda row: row["table"] != _TRANSACTIONS)
+        failed: list[Row] = []
+        skipped: list[Row] = []
+        for index, row in enumerate(ordered):
+            try:
+                skipped.extend(await self._insert([row]))
+            except Exception as e:
+                if _is_transient(e):
+                    self._back_off()
+                    return failed + ordered[index:], skipped
+                failed.append({**row, _ATTEMPTS: row.get(_ATTEMPTS, 0) + 1, "error": str(e)})
+        return failed, skipped
+
+    async def _dead_letter_skipped(self, rows: list[Row]) -> None:
+        if not rows:
+            return
+        self._logger.error("Write-behind rows skipped, transaction_id already stored", rows=len(rows))
+        try:
+            await asyncio.to_thread(
+                self._append_dead_letters,
+                [{"row": row, "error": "transaction_id already stored"} for row in rows],
+            )
+        except OSError as e:
+            self._logger.error("Write-behind dead-letter file not writable", rows=len(rows), error=str(e))
+
+    async def _spill(self, rows: list[Row]) -> None:
+        try:
+            await asyncio.to_thread(self._append_spill, rows)
+        except OSError as e:
+            self._untrack(rows)
+            self._logger.error("Write-behind rows lost, spill file not writable", rows=len(rows), error=str(e))
+
+    async def _insert(self, rows: list[Row]) -> list[Row]:
+        skipped: list[Row] = []
+        session = self._session_factory()
+        try:
+            dialect = session.get_bind().dialect.name
+            for name, table in _TABLES.items():
+                table_rows = [row for row in rows if row["table"] == name]
+                if not table_rows:
+                    continue
+                result = await session.execute(
+                    _insert_new(table, dialect)
+                    .values([_from_json(row) for row in table_rows])
+                    .returning(table.c.transaction_id)
+                )
+                inserted = set(result.scalars())
+                skipped.extend(row for row in table_rows if row["transaction_id"] not in inserted)
+            await session.commit()
+        finally:
+            await session.close()
+        return skipped
+
+    def _read_spill(self) -> list[Row]:
+        if not self._spill_path.exists():
+            return []
+        rows: list[Row] = []
+        corrupt: list[Row] = []
+        with open(self._spill_path, encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    row = json.loads(line)
+                except ValueError as e:
+                    corrupt.append({"line": line.rstrip("\n"), "error": str(e)})
+                    continue
+                if not isinstance(row, dict) or row.get("table") not in (_TRANSACTIONS, _FRAUD_DECISIONS):
+                    corrupt.append({"line": line.rstrip("\n"), "error": "Not a write-behind row"})
+                    continue
+                rows.append(row)
+        if corrupt:
+            self._append_dead_letters(corrupt)
+            self._write_spill(rows)
+            self._logger.error("Quarantined corrupt write-behind spill lines", lines=len(corrupt))
+        return rows
+
+    def _append_spill(self, rows: list[Row]) -> None:
+        if not rows:
+            return
+        self._spill_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self._spill_path, "a+", encoding="utf-8") as f:
+            if f.tell() > 0:
+                f.seek(f.tell() - 1)
+                if f.read(1) != "\n":
+                    f.write("\n")
+            for row in rows:
+                f.write(json.dumps(row) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _replace_spill(self, failed: list[Row]) -> None:
+        dead = [row for row in failed if row.get(_ATTEMPTS, 0) >= self._max_attempts]
+        retry = [row for row in failed if row.get(_ATTEMPTS, 0) < self._max_attempts]
+        if dead:
+            self._append_dead_letters(
+                [{"row": {k: v for k, v in row.items() if k != "error"}, "error": row.get("error")} for row in dead]
+            )
+            self._logger.error("Moved rejected write-behind rows to dead-letter file", rows=len(dead))
+        self._write_spill(retry)
+
+    def _write_spill(self, rows: list[Row]) -> None:
+        if not rows:
+            self._spill_path.unlink(missing_ok=True)
+            return
+        self._spill_path.parent.mkdir(parents=True, exist_ok=True)
+        staging = self._spill_path.with_name(f".{self._spill_path.name}.tmp")
+        with open(staging, "w", encoding="utf-8") as f:
+            for row in rows:
+                f.write(json.dumps(row) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(staging, self._spill_path)
+
+    def _append_dead_letters(self, entries: list[Row]) -> None:
+        self._dead_letter_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self._dead_letter_path, "a", encoding="utf-8") as f:
+            for entry in entries:
+                f.write(json.dumps(entry) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+
+class WriteBehindTransactionRepository(TransactionRepository):
+    def __init__(self, session: AsyncSession, queue: WriteBehindQueue) -> None:
+        super().__init__(session)
+        self._queue = queue
+
+    async def find_by_ids(self, transaction_ids: list[TransactionId]) -> list[Transaction]:
+        pending = self._queue.pending_transactions(transaction_ids)
+        found = {t.transaction_id for t in pending}
+        return pending + await super().find_by_ids([t for t in transaction_ids if t not in found])
+
+
+class WriteBehindFraudDecisionRepository(FraudDecisionRepository):
+    def __init__(self, session: AsyncSession, queue: WriteBehindQueue) -> None:
+        super().__init__(session)
+        self._queue = queue
+
+    async def find_by_transaction_ids(self, transaction_ids: list[TransactionId]) -> list[FraudDecision]:
+        pending = self._queue.pending_fraud_decisions(transaction_ids)
+        found = {d.transaction_id for d in pending}
+        return pending + await super().find_by_transaction_ids([t for t in transaction_ids if t not in found])
+
+
+class WriteBehindUnitOfWork:
+    def __init__(self, queue: WriteBehindQueue, recent_writes: RecentWrites | None = None) -> None:
+        self._queue = queue
+        self._recent_writes = recent_writes
+        self._rows: list[Row] = []
+
+    def add_transaction(self, transaction: Transaction) -> None:
+        self._rows.append(_transaction_row(transaction))
+
+    def add_transactions(self, transactions: list[Transaction]) -> None:
+        self._rows.extend(_transaction_row(t) for t in transactions)
+
+    def add_fraud_decision(self, fraud_decision: FraudDecision) -> None:
+        self._rows.append(_fraud_decision_row(fraud_decision))
+
+    def add_fraud_decisions(self, fraud_decisions: list[FraudDecision]) -> None:
+        self._rows.extend(_fraud_decision_row(d) for d in fraud_decisions)
+
+    async def commit(self) -> None:
+        rows, self._rows = self._rows, []
+        await self._queue.put(rows)
+        if self._recent_writes is not None:
+            transactions = [row for row in rows if row["table"] == _TRANSACTIONS]
+            self._recent_writes.mark(
+                (row["transaction_id"] for row in transactions),
+                (row["user_id"] for row in transactions),
+            )
+
+    async def rollback(self) -> None:
+        self._rows = []
+
+
+def _transaction_row(transaction: Transaction) -> Row:
+    return {
+        "table": _TRANSACTIONS,
+        "transaction_id": str(transaction.transaction_id.value),
+        "user_id": transaction.user_id.value,
+        "merchant_id": transaction.merchant_id.value,
+        "amount": str(transaction.amount.value),
+        "timestamp": transaction.timestamp.isoformat(),
+        "metadata": dict(transaction.metadata) if transaction.metadata else None,
+    }
+
+
+def _fraud_decision_row(fraud_decision: FraudDecision) -> Row:
+    return {
+        "table": _FRAUD_DECISIONS,
+        "transaction_id": str(fraud_decision.transaction_id.value),
+        "risk_score": fraud_decision.risk_score,
+        "decision": fraud_decision.decision.value,
+        "timestamp": fraud_decision.timestamp.isoformat(),
+        "model_version": fraud_decision.model_version,
+        "matched_rules": list(fraud_decision.matched_rules) or None,
+    }
+
+
+def _transaction_from_row(row: Row) -> Transaction:
+    return Transaction(
+        transaction_id=TransactionId.create(row["transaction_id"]),
+        user_id=UserId.create(row["user_id"]),
+        merchant_id=MerchantId.create(row["merchant_id"]),
+        amount=TransactionAmount.create(Decimal(row["amount"])),
+        timestamp=datetime.fromisoformat(row["timestamp"]),
+        metadata=row["metadata"],
+    )
+
+
+def _fraud_decision_from_row(row: Row) -> FraudDecision:
+    return FraudDecision(
+        transaction_id=TransactionId.create(row["transaction_id"]),
+        risk_score=row["risk_score"],
+        decision=Decision(row["decision"]),
+        timestamp=datetime.fromisoformat(row["timestamp"]),
+        model_version=row["model_version"],
+        matched_rules=tuple(row["matched_rules"] or ()),
+    )
+
+
+def _insert_new(table: Table, dialect: str) -> Any:
+    if dialect == "postgresql":
+        return postgresql.insert(table).on_conflict_do_nothing(index_elements=["transaction_id"])
+    if dialect == "sqlite":
+        return sqlite.insert(table).on_conflict_do_nothing(index_elements=["transaction_id"])
+    return insert(table)
+
+
+def _is_transient(error: Exception) -> bool:
+    if isinstance(error, (OperationalError, InterfaceError)):
+        return True
+    if isinstance(error, DBAPIError) and error.connection_invalidated:
+        return True
+    return isinstance(error, (OSError, asyncio.TimeoutError))
+
+
+def _from_json(row: Row) -> Row:
+    values = {k: v for k, v in row.items() if k not in ("table", _ATTEMPTS, "error")}
+    values["timestamp"] = datetime.fromisoformat(values["timestamp"])
+    if row["table"] == _TRANSACTIONS:
+        values["amount"] = Decimal(values["amount"])
+    return values
@@ -0,0 +1,110 @@
+import asyncio
+import json
+import time
+from pathlib import Path
+from typing import TypedDict
+
+from app.adapters.outbound.logging.logger import StructuredLogger
+from app.domain.exceptions import InvalidRuleSetError
+from app.domain.services.rule_engine import DEFAULT_RULE_SET, RuleEngine, RuleSet
+
+
+class RuleSetStatus(TypedDict):
+    version: str
+    source: str | None
+    rules: int
+    review_threshold: float
+    block_threshold: float
+    loaded_at: float
+
+
+class RuleSetManager:
+    def __init__(
+        self,
+        logger: StructuredLogger,
+        path: str | None = None,
+        poll_interval_seconds: float = 0.0,
+    ) -> None:
+        self._logger = logger
+        self._path = Path(path) if path else None
+        self._poll_interval = poll_interval_seconds
+        self._engine = RuleEngine(DEFAULT_RULE_SET)
+        self._mtime: float | None = None
+        self._loaded_at = time.time()
+        self._lock = asyncio.Lock()
+        self._poller: asyncio.Task[None] | None = None
+        if self._path is not None:
+            self._engine, self._mtime = self._load()
+
+    @property
+    def engine(self) -> RuleEngine:
+        return self._engine
+
+    def status(self) -> RuleSetStatus:
+        rule_set = self._engine.rule_set
+        return RuleSetStatus(
+            version=rule_set.version,
+            source=str(self._path) if self._path is not None else None,
+            rules=len(rule_set.rules),
+            review_threshold=rule_set.thresholds.review,
+            block_threshold=rule_set.thresholds.block,
+            loaded_at=self._loaded_at,
+        )
+
+    async def reload(self) -> RuleSetStatus:
+        if self._path is None:
+            raise InvalidRuleSetError("Reloading rules requires RISK_RULES_PATH")
+        async with self._lock:
+            engine, mtime = await asyncio.to_thread(self._load)
+            previous = self._engine.rule_set.version
+            self._engine = engine
+            self._mtime = mtime
+            self._loaded_at = time.time()
+        self._logger.info(
+            "Loaded risk rules",
+            version=engine.rule_set.version,
+            previous_version=previous,
+            rules=len(engine.rule_set.rules),
+        )
+        return self.status()
+
+    async def start(self) -> None:
+        if self._path is not None and self._poll_interval > 0 and self._poller is None:
+            self._poller = asyncio.create_task(self._poll())
+
+    async def close(self) -> None:
+        if self._poller is None:
+            return
+        self._poller.cancel()
+        try:
+            await self._poller
+        except asyncio.CancelledError:
+            pass
+        self._poller = None
+
+    def _load(self) -> tuple[RuleEngine, float]:
+        assert self._path is not None
+        mtime = self._path.stat().st_mtime
+        try:
+            data = json.loads(self._path.read_text())
+        except json.JSONDecodeError as e:
+            raise InvalidRuleSetError(f"Rule file {self._path} is not valid JSON: {e}") from e
+        return RuleEngine(RuleSet.from_dict(data)), mtime
+
+    async def _poll(self) -> None:
+        assert self._path is not None
+        path = self._path
+        while True:
+            await asyncio.sleep(self._poll_interval)
+            try:
+                mtime = await asyncio.to_thread(lambda: path.stat().st_mtime)
+            except OSError as e:
+                self._logger.error("Risk rule file is unavailable, keeping the current rules", error=str(e))
+                continue
+            if mtime == self._mtime:
+                continue
+            try:
+                await self.reload()
+            except Exception as e:
+                self._mtime = mtime
+                self._logger.error("Risk rule reload failed, keeping the current rules", error=str(e))
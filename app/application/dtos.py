@@ -1,14 +1,40 @@
 from dataclasses import dataclass
 from datetime import datetime
 
-from app.domain.entities.fraud_decision import Decision
+from app.domain.entities.fraud_decision import Decision, FraudDecision
+from app.domain.entities.fraud_decision_batch import FraudDecisionBatch
+from app.domain.value_objects.history_cursor import HistoryCursor
+from app.domain.value_objects.merchant_id import MerchantId
+from app.domain.value_objects.transaction_amount import TransactionAmount
 from app.domain.value_objects.transaction_id import TransactionId
+from app.domain.value_objects.user_id import UserId
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FraudAssessmentResult:
     transaction_id: TransactionId
     risk_score: float
     decision: Decision
     timestamp: datetime
 
+
+@dataclass(frozen=True, slots=True)
+class FraudAssessmentCommand:
+    transaction_id: TransactionId
+    user_id: UserId
+    merchant_id: MerchantId
+    amount: TransactionAmount
+    timestamp: datetime
+    metadata: dict[str, str] | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class FraudAssessmentOutcome:
+    fraud_decision: FraudDecision
+    replayed: bool
+
+
+@dataclass(frozen=True, slots=True)
+class FraudHistoryPage:
+    decisions: FraudDecisionBatch
+    next_cursor: HistoryCursor | None
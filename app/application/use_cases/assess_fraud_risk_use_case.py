@@ -1,29 +1,51 @@
+import asyncio
+import time
+from collections.abc import Mapping
 from datetime import datetime
+from typing import cast
 
+from app.application.dtos import FraudAssessmentCommand, FraudAssessmentOutcome
 from app.domain.entities.fraud_decision import FraudDecision
-from app.domain.entities.transaction import Transaction
+from app.domain.entities.transaction import Transaction, TransactionMetadata
+from app.domain.exceptions import DuplicateTransactionError, IdempotencyConflictError
+from app.domain.ports.decision_cache_port import DecisionCachePort
 from app.domain.ports.fraud_decision_repository_port import FraudDecisionRepositoryPort
 from app.domain.ports.fraud_scoring_port import FraudScoringPort
+from app.domain.ports.idempotency_index_port import IdempotencyIndexPort
+from app.domain.ports.stage_metrics_port import StageMetricsPort
 from app.domain.ports.transaction_repository_port import TransactionRepositoryPort
+from app.domain.ports.unit_of_work_port import UnitOfWorkPort
+from app.domain.ports.velocity_index_port import VelocityIndexPort
+from app.domain.services.rule_engine import DEFAULT_RULE_ENGINE, RuleEngine
 from app.domain.value_objects.merchant_id import MerchantId
+from app.domain.value_objects.model_score import ModelScore
 from app.domain.value_objects.transaction_amount import TransactionAmount
 from app.domain.value_objects.transaction_id import TransactionId
 from app.domain.value_objects.user_id import UserId
 
 
-from app.domain.ports.transaction_repository_port import TransactionRepositoryPort
-
-
 class AssessFraudRiskUseCase:
     def __init__(
         self,
         fraud_scoring_port: FraudScoringPort,
-        fraud_decision_repository: FraudDecisionRepositoryPort,
-        transaction_repository: TransactionRepositoryPort,
+        unit_of_work: UnitOfWorkPort,
+        velocity_index: VelocityIndexPort | None = None,
+        decision_cache: DecisionCachePort | None = None,
+        stage_metrics: StageMetricsPort | None = None,
+        rule_engine: RuleEngine = DEFAULT_RULE_ENGINE,
+        idempotency_index: IdempotencyIndexPort | None = None,
+        transaction_repository: TransactionRepositoryPort | None = None,
+        fraud_decision_repository: FraudDecisionRepositoryPort | None = None,
     ) -> None:
         self._fraud_scoring_port = fraud_scoring_port
-        self._fraud_decision_repository = fraud_decision_repository
+        self._unit_of_work = unit_of_work
+        self._velocity_index = velocity_index
+        self._decision_cache = decision_cache
+        self._stage_metrics = stage_metrics
+        self._rule_engine = rule_engine
+        self._idempotency_index = idempotency_index
         self._transaction_repository = transaction_repository
+        self._fraud_decision_repository = fraud_decision_repository
 
     async def execute(
         self,
@@ -40,16 +62,228 @@ class AssessFraudRiskUseCase:
             merchant_id=merchant_id,
             amount=amount,
             timestamp=timestamp,
-            metadata=metadata,
+            metadata=_metadata(metadata),
         )
-        await self._transaction_repository.save(transaction)
-        ml_score = await self._fraud_scoring_port.score_transaction(transaction)
-        risk_score = transaction.assess_fraud_risk(ml_score)
-        fraud_decision = FraudDecision.create(
+        return await self._assess(transaction)
+
+    async def execute_idempotent(
+        self,
+        transaction_id: TransactionId,
+        user_id: UserId,
+        merchant_id: MerchantId,
+        amount: TransactionAmount,
+        timestamp: datetime,
+        metadata: dict[str, str] | None = None,
+    ) -> FraudAssessmentOutcome:
+        transaction = Transaction(
             transaction_id=transaction_id,
-            risk_score=risk_score,
-            timestamp=datetime.utcnow(),
+            user_id=user_id,
+            merchant_id=merchant_id,
+            amount=amount,
+            timestamp=timestamp,
+            metadata=_metadata(metadata),
         )
-        await self._fraud_decision_repository.save(fraud_decision)
+        return await self._assess_idempotent(transaction)
+
+    async def execute_many(self, commands: list[FraudAssessmentCommand]) -> list[FraudDecision]:
+        return await self._assess_many([_transaction(command) for command in commands])
+
+    async def execute_many_idempotent(self, commands: list[FraudAssessmentCommand]) -> list[FraudAssessmentOutcome]:
+        transactions = [_transaction(command) for command in commands]
+        owners: dict[TransactionId, int] = {}
+        claims: list[tuple[int, asyncio.Future[FraudDecision]]] = []
+        aliases: list[tuple[int, int]] = []
+        outcomes: list[FraudAssessmentOutcome | None] = [None] * len(transactions)
+        try:
+            for index, transaction in enumerate(transactions):
+                owner = owners.get(transaction.transaction_id)
+                if owner is not None:
+                    if transactions[owner].fingerprint() != transaction.fingerprint():
+                        raise IdempotencyConflictError(
+                            f"Transaction {transaction.transaction_id} appears twice with different payloads"
+                        )
+                    aliases.append((index, owner))
+                    continue
+                claim = self._claim(transaction)
+                if claim is None:
+                    owners[transaction.transaction_id] = index
+                else:
+                    claims.append((index, claim))
+            for outcome in await self._assess_new([transactions[index] for index in owners.values()]):
+                outcomes[owners[outcome.fraud_decision.transaction_id]] = outcome
+        except BaseException as e:
+            for index in owners.values():
+                self._fail(transactions[index], e)
+            raise
+        for index in owners.values():
+            owned = outcomes[index]
+            assert owned is not None
+            self._resolve(transactions[index], owned.fraud_decision)
+        for index, claim in claims:
+            outcomes[index] = await self._await_claim(claim, transactions[index])
+        for index, owner in aliases:
+            original = outcomes[owner]
+            assert original is not None
+            outcomes[index] = FraudAssessmentOutcome(fraud_decision=original.fraud_decision, replayed=True)
+        return [outcome for outcome in outcomes if outcome is not None]
+
+    async def _assess_idempotent(self, transaction: Transaction) -> FraudAssessmentOutcome:
+        claim = self._claim(transaction)
+        if claim is not None:
+            return await self._await_claim(claim, transaction)
+        try:
+            outcome = (await self._assess_new([transaction]))[0]
+        except BaseException as e:
+            self._fail(transaction, e)
+            raise
+        self._resolve(transaction, outcome.fraud_decision)
+        return outcome
+
+    async def _await_claim(
+        self, claim: "asyncio.Future[FraudDecision]", transaction: Transaction
+    ) -> FraudAssessmentOutcome:
+        try:
+            fraud_decision = await asyncio.shield(claim)
+        except asyncio.CancelledError:
+            if not claim.cancelled():
+                raise
+            return await self._assess_idempotent(transaction)
+        return FraudAssessmentOutcome(fraud_decision=fraud_decision, replayed=True)
+
+    async def _assess_new(self, transactions: list[Transaction]) -> list[FraudAssessmentOutcome]:
+        if not transactions:
+            return []
+        stored = await self._find_stored(transactions)
+        fresh = [t for t in transactions if t.transaction_id not in stored]
+        try:
+            fraud_decisions = await self._assess_fresh(fresh)
+        except DuplicateTransactionError:
+            recorded = await self._find_stored(fresh)
+            if not recorded:
+                raise
+            stored.update(recorded)
+            fresh = [t for t in fresh if t.transaction_id not in stored]
+            fraud_decisions = await self._assess_fresh(fresh)
+        if stored and self._decision_cache is not None:
+            await self._decision_cache.put_many(list(stored.values()))
+        replayed = [FraudAssessmentOutcome(fraud_decision=d, replayed=True) for d in stored.values()]
+        return replayed + [FraudAssessmentOutcome(fraud_decision=d, replayed=False) for d in fraud_decisions]
+
+    async def _assess_fresh(self, transactions: list[Transaction]) -> list[FraudDecision]:
+        if len(transactions) == 1:
+            return [await self._assess(transactions[0])]
+        return await self._assess_many(transactions) if transactions else []
+
+    async def _find_stored(self, transactions: list[Transaction]) -> dict[TransactionId, FraudDecision]:
+        if self._transaction_repository is None or self._fraud_decision_repository is None:
+            return {}
+        transaction_ids = [t.transaction_id for t in transactions]
+        existing = {t.transaction_id: t for t in await self._transaction_repository.find_by_ids(transaction_ids)}
+        if not existing:
+            return {}
+        for transaction in transactions:
+            previous = existing.get(transaction.transaction_id)
+            if previous is not None and previous.fingerprint() != transaction.fingerprint():
+                raise IdempotencyConflictError(
+                    f"Transaction {transaction.transaction_id} was already submitted with a different payload"
+                )
+        fraud_decisions = await self._fraud_decision_repository.find_by_transaction_ids(list(existing))
+        return {fraud_decision.transaction_id: fraud_decision for fraud_decision in fraud_decisions}
+
+    def _claim(self, transaction: Transaction) -> "asyncio.Future[FraudDecision] | None":
+        if self._idempotency_index is None:
+            return None
+        return self._idempotency_index.claim(transaction.transaction_id, transaction.fingerprint())
+
+    def _resolve(self, transaction: Transaction, fraud_decision: FraudDecision) -> None:
+        if self._idempotency_index is not None:
+            self._idempotency_index.resolve(transaction.transaction_id, fraud_decision)
+
+    def _fail(self, transaction: Transaction, error: BaseException) -> None:
+        if self._idempotency_index is not None:
+            self._idempotency_index.fail(transaction.transaction_id, error)
+
+    async def _assess(self, transaction: Transaction) -> FraudDecision:
+        started = time.perf_counter()
+        ml_score = await self._fraud_scoring_port.score_transaction(transaction)
+        scored = time.perf_counter()
+        fraud_decision = self._decide(transaction, ml_score, datetime.utcnow())
+        assessed = time.perf_counter()
+        self._unit_of_work.add_transaction(transaction)
+        self._unit_of_work.add_fraud_decision(fraud_decision)
+        await self._commit()
+        committed = time.perf_counter()
+        if self._velocity_index is not None:
+            self._velocity_index.record(transaction)
+        if self._decision_cache is not None:
+            await self._decision_cache.put(fraud_decision)
+        self._observe_stages(started, scored, assessed, committed)
         return fraud_decision
 
+    async def _assess_many(self, transactions: list[Transaction]) -> list[FraudDecision]:
+        started = time.perf_counter()
+        ml_scores = await self._fraud_scoring_port.score_transactions(transactions)
+        scored = time.perf_counter()
+        decided_at = datetime.utcnow()
+        fraud_decisions = [
+            self._decide(transaction, ml_score, decided_at) for transaction, ml_score in zip(transactions, ml_scores)
+        ]
+        assessed = time.perf_counter()
+        self._unit_of_work.add_transactions(transactions)
+        self._unit_of_work.add_fraud_decisions(fraud_decisions)
+        await self._commit()
+        committed = time.perf_counter()
+        if self._velocity_index is not None:
+            self._velocity_index.record_many(transactions)
+        if self._decision_cache is not None:
+            await self._decision_cache.put_many(fraud_decisions)
+        self._observe_stages(started, scored, assessed, committed)
+        return fraud_decisions
+
+    def _decide(self, transaction: Transaction, ml_score: ModelScore, decided_at: datetime) -> FraudDecision:
+        return build_fraud_decision(self._rule_engine, transaction, ml_score, decided_at)
+
+    async def _commit(self) -> None:
+        try:
+            await self._unit_of_work.commit()
+        except Exception:
+            await self._unit_of_work.rollback()
+            raise
+
+    def _observe_stages(self, started: float, scored: float, assessed: float, committed: float) -> None:
+        if self._stage_metrics is None:
+            return
+        finished = time.perf_counter()
+        self._stage_metrics.observe_stage("score", scored - started)
+        self._stage_metrics.observe_stage("assess", assessed - scored)
+        self._stage_metrics.observe_stage("commit", committed - assessed)
+        self._stage_metrics.observe_stage("post_commit", finished - committed)
+
+
+def build_fraud_decision(
+    rule_engine: RuleEngine, transaction: Transaction, ml_score: ModelScore, decided_at: datetime
+) -> FraudDecision:
+    assessment = rule_engine.assess(transaction, ml_score.value)
+    return FraudDecision.create(
+        transaction_id=transaction.transaction_id,
+        risk_score=assessment.risk_score,
+        timestamp=decided_at,
+        model_version=ml_score.model_version,
+        matched_rules=assessment.matched_rules,
+        decision=assessment.decision,
+    )
+
+
+def _metadata(metadata: Mapping[str, str] | None) -> TransactionMetadata | None:
+    return cast(TransactionMetadata, dict(metadata)) if metadata else None
+
+
+def _transaction(command: FraudAssessmentCommand) -> Transaction:
+    return Transaction(
+        transaction_id=command.transaction_id,
+        user_id=command.user_id,
+        merchant_id=command.merchant_id,
+        amount=command.amount,
+        timestamp=command.timestamp,
+        metadata=_metadata(command.metadata),
+    )
@@ -0,0 +1,21 @@
+from datetime import datetime
+
+from app.application.use_cases.assess_fraud_risk_use_case import build_fraud_decision
+from app.domain.entities.fraud_decision import FraudDecision
+from app.domain.entities.transaction import Transaction
+from app.domain.ports.fraud_scoring_port import FraudScoringPort
+from app.domain.services.rule_engine import DEFAULT_RULE_ENGINE, RuleEngine
+
+
+class RescoreTransactionsUseCase:
+    def __init__(self, fraud_scoring_port: FraudScoringPort, rule_engine: RuleEngine = DEFAULT_RULE_ENGINE) -> None:
+        self._fraud_scoring_port = fraud_scoring_port
+        self._rule_engine = rule_engine
+
+    async def execute(self, transactions: list[Transaction]) -> list[FraudDecision]:
+        ml_scores = await self._fraud_scoring_port.score_transactions(transactions)
+        decided_at = datetime.utcnow()
+        return [
+            build_fraud_decision(self._rule_engine, transaction, ml_score, decided_at)
+            for transaction, ml_score in zip(transactions, ml_scores)
+        ]
@@ -1,16 +1,27 @@
 from app.domain.entities.fraud_decision import FraudDecision
 from app.domain.exceptions import FraudDecisionNotFoundError
+from app.domain.ports.decision_cache_port import DecisionCachePort
 from app.domain.ports.fraud_decision_repository_port import FraudDecisionRepositoryPort
 from app.domain.value_objects.transaction_id import TransactionId
 
 
 class RetrieveFraudDecisionUseCase:
-    def __init__(self, fraud_decision_repository: FraudDecisionRepositoryPort) -> None:
+    def __init__(
+        self,
+        fraud_decision_repository: FraudDecisionRepositoryPort,
+        decision_cache: DecisionCachePort | None = None,
+    ) -> None:
         self._fraud_decision_repository = fraud_decision_repository
+        self._decision_cache = decision_cache
 
     async def execute(self, transaction_id: TransactionId) -> FraudDecision:
+        if self._decision_cache is not None:
+            cached = await self._decision_cache.get(transaction_id)
+            if cached is not None:
+                return cached
         fraud_decision = await self._fraud_decision_repository.find_by_transaction_id(transaction_id)
         if fraud_decision is None:
             raise FraudDecisionNotFoundError(f"Fraud decision not found for transaction ID: {transaction_id}")
+        if self._decision_cache is not None:
+            await self._decision_cache.put(fraud_decision)
         return fraud_decision
-
@@ -1,5 +1,11 @@
+from collections.abc import AsyncIterator
+
+from app.application.dtos import FraudHistoryPage
 from app.domain.entities.fraud_decision import FraudDecision
+from app.domain.entities.fraud_decision_batch import FraudDecisionBatch
 from app.domain.ports.fraud_decision_repository_port import FraudDecisionRepositoryPort
+from app.domain.value_objects.fraud_history_filter import FraudHistoryFilter
+from app.domain.value_objects.history_cursor import HistoryCursor
 from app.domain.value_objects.user_id import UserId
 
 
@@ -10,3 +16,22 @@ class RetrieveFraudHistoryUseCase:
     async def execute(self, user_id: UserId) -> list[FraudDecision]:
         return await self._fraud_decision_repository.find_by_user_id(user_id)
 
+    async def execute_page(
+        self,
+        user_id: UserId,
+        limit: int,
+        cursor: HistoryCursor | None = None,
+        history_filter: FraudHistoryFilter = FraudHistoryFilter(),
+    ) -> FraudHistoryPage:
+        decisions, next_cursor = await self._fraud_decision_repository.find_page_by_user_id(
+            user_id, limit, cursor, history_filter
+        )
+        return FraudHistoryPage(decisions=decisions, next_cursor=next_cursor)
+
+    def stream(
+        self,
+        user_id: UserId,
+        history_filter: FraudHistoryFilter = FraudHistoryFilter(),
+        chunk_size: int = 1000,
+    ) -> AsyncIterator[FraudDecisionBatch]:
+        return self._fraud_decision_repository.stream_batches_by_user_id(user_id, history_filter, chunk_size)
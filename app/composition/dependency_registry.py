@@ -1,16 +1,47 @@
 from collections.abc import AsyncIterator
+from datetime import datetime, timedelta
 
+from app.adapters.outbound.analytics.ndjson_sink import NdjsonAnalyticsSink
+from app.adapters.outbound.cache.idempotency_index import InMemoryIdempotencyIndex
+from app.adapters.outbound.cache.in_memory_decision_cache import InMemoryDecisionCache
 from app.adapters.outbound.config import Settings
+from app.adapters.outbound.feature_store.cached_feature_store import CachedFeatureStore
+from app.adapters.outbound.feature_store.composite_feature_store import CompositeFeatureStore
+from app.adapters.outbound.feature_store.in_memory_feature_store import InMemoryFeatureStore
+from app.adapters.outbound.feature_store.velocity_index import (
+    VELOCITY_FEATURES,
+    SlidingWindowIndex,
+)
 from app.adapters.outbound.logging.logger import StructuredLogger
+from app.adapters.outbound.metrics.registry import MetricsRegistry
+from app.adapters.outbound.metrics.service_metrics import ServiceMetrics
+from app.adapters.outbound.metrics.stage_metrics import StageMetrics
+from app.adapters.outbound.ml.feature_pipeline import (
+    DEFAULT_FEATURE_PIPELINE,
+    DEFAULT_FEATURES,
+    FeaturePipeline,
+)
 from app.adapters.outbound.ml.fraud_scoring_service import FraudScoringService
-from app.adapters.outbound.ml.model_loader import ModelLoader
-from app.adapters.outbound.persistence.database import Database
+from app.adapters.outbound.ml.inference_executor import create_inference_executor
+from app.adapters.outbound.ml.model_manager import ModelManager
+from app.adapters.outbound.ml.model_registry import ModelRegistry
+from app.adapters.outbound.ml.shadow_scorer import ShadowScorer
+from app.adapters.outbound.persistence.database import Database, DatabasePoolStats
+from app.adapters.outbound.persistence.read_routing import ReadRouter, RecentWrites, ReplicaHealth
 from app.adapters.outbound.persistence.repositories.fraud_decision_repository import (
     FraudDecisionRepository,
 )
 from app.adapters.outbound.persistence.repositories.transaction_repository import (
     TransactionRepository,
 )
+from app.adapters.outbound.persistence.unit_of_work import SqlAlchemyUnitOfWork
+from app.adapters.outbound.persistence.write_behind import (
+    WriteBehindFraudDecisionRepository,
+    WriteBehindQueue,
+    WriteBehindTransactionRepository,
+    WriteBehindUnitOfWork,
+)
+from app.adapters.outbound.rules.rule_set_manager import RuleSetManager
 from app.application.use_cases.assess_fraud_risk_use_case import AssessFraudRiskUseCase
 from app.application.use_cases.retrieve_fraud_decision_use_case import (
     RetrieveFraudDecisionUseCase,
@@ -24,10 +55,272 @@ from sqlalchemy.ext.asyncio import AsyncSession
 class DependencyRegistry:
     def __init__(self, settings: Settings) -> None:
         self._settings = settings
-        self._database = Database(settings.database_url)
+        self._database = self._create_database(settings.database_url)
+        self._replica_databases = [self._create_database(url) for url in settings.database_replica_urls]
         self._logger = StructuredLogger()
-        self._ml_model = ModelLoader.load_model(settings.model_path)
-        self._fraud_scoring_service = FraudScoringService(self._ml_model)
+        self._metrics = ServiceMetrics(MetricsRegistry())
+        self._read_router = ReadRouter(
+            primary=self._database,
+            replicas=self._replica_databases,
+            recent_writes=RecentWrites(
+                window_seconds=settings.database_read_your_writes_seconds,
+                max_entries=settings.database_read_your_writes_max_keys,
+            ),
+            logger=self._logger,
+            health_interval_seconds=settings.database_replica_health_interval_seconds,
+        )
+        self._model_registry = ModelRegistry(settings.model_registry_path) if settings.model_registry_path else None
+        self._feature_store = CachedFeatureStore(
+            InMemoryFeatureStore(),
+            max_entries=settings.feature_store_cache_size,
+            ttl_seconds=settings.feature_store_cache_ttl_seconds,
+        )
+        feature_pipeline = DEFAULT_FEATURE_PIPELINE
+        feature_store: CachedFeatureStore | CompositeFeatureStore = self._feature_store
+        self._velocity_index: SlidingWindowIndex | None = None
+        if settings.velocity_features_enabled:
+            self._velocity_index = SlidingWindowIndex(max_keys=settings.velocity_index_max_keys)
+            feature_pipeline = FeaturePipeline(DEFAULT_FEATURES + VELOCITY_FEATURES)
+            feature_store = CompositeFeatureStore([self._feature_store, self._velocity_index])
+        self._ml_model, model_version = ModelManager.load_initial(
+            settings.model_path,
+            feature_pipeline.feature_names,
+            settings.model_compiled_inference,
+            self._logger,
+            self._model_registry,
+        )
+        canary = None
+        if settings.model_canary_version:
+            canary = ModelManager.load_candidate(
+                settings.model_canary_version,
+                feature_pipeline.feature_names,
+                settings.model_compiled_inference,
+                self._logger,
+                self._model_registry,
+            )
+        self._rule_set_manager = RuleSetManager(
+            self._logger,
+            path=settings.risk_rules_path,
+            poll_interval_seconds=settings.risk_rules_poll_seconds,
+        )
+        shadow = None
+        if settings.model_shadow_versions:
+            shadow = ShadowScorer(
+                [
+                    ModelManager.load_candidate(
+                        reference,
+                        feature_pipeline.feature_names,
+                        settings.model_compiled_inference,
+                        self._logger,
+                        self._model_registry,
+                    )
+                    for reference in settings.model_shadow_versions
+                ],
+                sink=NdjsonAnalyticsSink(settings.model_shadow_sink_path),
+                logger=self._logger,
+                max_workers=settings.model_shadow_workers,
+                max_pending_rows=settings.model_shadow_queue_size,
+                max_batch_rows=settings.model_shadow_batch_size,
+                inference_histogram=self._metrics.shadow_inference_duration,
+                delta_histogram=self._metrics.shadow_score_delta,
+                rule_engine=lambda: self._rule_set_manager.engine,
+            )
+        self._fraud_scoring_service = FraudScoringService(
+            self._ml_model,
+            feature_pipeline=feature_pipeline,
+            feature_store=feature_store,
+            max_batch_size=settings.scoring_max_batch_size,
+            max_wait_us=settings.scoring_max_wait_us,
+            inference_histogram=self._metrics.model_inference_duration,
+            batch_size_histogram=self._metrics.scoring_batch_size,
+            model_version=model_version,
+            canary=canary,
+            canary_percent=settings.model_canary_percent,
+            shadow=shadow,
+            executor=create_inference_executor(
+                settings.inference_executor,
+                workers=settings.inference_workers,
+                model=self._ml_model,
+                n_features=len(feature_pipeline.feature_names),
+                max_pending=settings.inference_max_pending,
+                sla_ms=settings.inference_sla_ms,
+                slot_rows=settings.inference_shared_memory_rows,
+            ),
+            fallback_score=settings.inference_fallback_score,
+        )
+        self._model_manager = ModelManager(
+            self._fraud_scoring_service,
+            self._logger,
+            model_path=settings.model_path,
+            compiled=settings.model_compiled_inference,
+            registry=self._model_registry,
+            poll_interval_seconds=settings.model_registry_poll_seconds,
+        )
+        self._decision_cache = InMemoryDecisionCache(
+            max_entries=settings.decision_cache_size,
+            ttl_seconds=settings.decision_cache_ttl_seconds,
+        )
+        self._idempotency_index = InMemoryIdempotencyIndex(
+            max_entries=settings.idempotency_index_size,
+            ttl_seconds=settings.idempotency_ttl_seconds,
+        )
+        self._write_behind_queue: WriteBehindQueue | None = None
+        if settings.write_behind_enabled:
+            self._write_behind_queue = WriteBehindQueue(
+                session_factory=self.get_database_session,
+                logger=self._logger,
+                max_size=settings.write_behind_queue_size,
+                batch_size=settings.write_behind_batch_size,
+                flush_interval_ms=settings.write_behind_flush_interval_ms,
+                spill_path=settings.write_behind_spill_path,
+                dead_letter_path=settings.write_behind_dead_letter_path,
+                max_attempts=settings.write_behind_max_attempts,
+                max_retry_delay_seconds=settings.write_behind_max_retry_delay_seconds,
+            )
+        self._register_metrics()
+
+    def _register_metrics(self) -> None:
+        registry = self._metrics.registry
+        databases = [("primary", self._database)] + [
+            (f"replica_{index}", database) for index, database in enumerate(self._replica_databases)
+        ]
+        wait = registry.histogram(
+            "db_pool_wait_seconds", "Time spent waiting for a pooled connection", ("database",)
+        )
+        checkout = registry.histogram(
+            "db_pool_checkout_seconds", "Time a pooled connection stays checked out", ("database",)
+        )
+        for name, database in databases:
+            wait.attach((name,), database.wait_histogram)
+            checkout.attach((name,), database.checkout_histogram)
+        registry.gauge(
+            "db_pool_connections",
+            "Pooled connections by state",
+            lambda: [
+                ((name, state), float(database.pool_stats()[state]))
+                for name, database in databases
+                for state in ("size", "checked_out", "checked_in", "overflow")
+            ],
+            ("database", "state"),
+        )
+        registry.gauge(
+            "cache_events",
+            "Cache hits, misses and evictions since startup",
+            self._cache_event_samples,
+            ("cache", "event"),
+        )
+        registry.gauge(
+            "cache_entries",
+            "Entries currently held by each cache",
+            lambda: [
+                (("feature_store",), float(self._feature_store.stats()["size"])),
+                (("decision",), float(self._decision_cache.stats()["size"])),
+                (("idempotency",), float(self._idempotency_index.stats()["size"])),
+            ]
+            + (
+                [(("velocity_index",), float(self._velocity_index.stats()["keys"]))]
+                if self._velocity_index is not None
+                else []
+            ),
+            ("cache",),
+        )
+        registry.gauge(
+            "scoring_queue_pending",
+            "Rows waiting for the scoring micro-batcher",
+            lambda: [((), float((self._fraud_scoring_service.batching_stats() or {"pending": 0})["pending"]))],
+        )
+        registry.gauge(
+            "inference_pending",
+            "Model calls queued or running on the inference executor",
+            lambda: [((), float(self._fraud_scoring_service.inference_stats()["pending"]))],
+        )
+        registry.gauge(
+            "inference_shed",
+            "Model calls rejected by load shedding and answered with the fallback score",
+            lambda: [((), float(self._fraud_scoring_service.inference_stats()["shed"]))],
+        )
+        if self._fraud_scoring_service.shadow_stats() is not None:
+            registry.gauge(
+                "shadow_rows",
+                "Rows scored by each shadow candidate, and how many flipped the decision or failed",
+                self._shadow_row_samples,
+                ("candidate", "outcome"),
+            )
+            registry.gauge(
+                "shadow_dropped_rows",
+                "Rows skipped because the shadow scoring queue was full",
+                lambda: [((), float((self._fraud_scoring_service.shadow_stats() or {"dropped": 0})["dropped"]))],
+            )
+        if self._write_behind_queue is not None:
+            queue = self._write_behind_queue
+            registry.gauge(
+                "write_behind_pending_rows",
+                "Rows queued for the write-behind flusher",
+                lambda: [((), float(queue.pending()))],
+            )
+
+    def _shadow_row_samples(self) -> list[tuple[tuple[str, ...], float]]:
+        stats = self._fraud_scoring_service.shadow_stats()
+        if stats is None:
+            return []
+        samples: list[tuple[tuple[str, ...], float]] = []
+        for candidate in stats["candidates"]:
+            samples.append(((candidate["version"], "scored"), float(candidate["rows"])))
+            samples.append(((candidate["version"], "flipped"), float(candidate["decision_flips"])))
+            samples.append(((candidate["version"], "failed"), float(candidate["errors"])))
+        return samples
+
+    def _cache_event_samples(self) -> list[tuple[tuple[str, ...], float]]:
+        feature_store = self._feature_store.stats()
+        decision = self._decision_cache.stats()
+        idempotency = self._idempotency_index.stats()
+        return [
+            (("feature_store", "hit"), float(feature_store["hits"])),
+            (("feature_store", "miss"), float(feature_store["misses"])),
+            (("decision", "hit"), float(decision["hits"])),
+            (("decision", "miss"), float(decision["misses"])),
+            (("decision", "eviction"), float(decision["evictions"])),
+            (("idempotency", "replay"), float(idempotency["replayed"])),
+            (("idempotency", "coalesced"), float(idempotency["coalesced"])),
+            (("idempotency", "conflict"), float(idempotency["conflicts"])),
+            (("idempotency", "eviction"), float(idempotency["evictions"])),
+        ]
+
+    def _create_database(self, database_url: str) -> Database:
+        settings = self._settings
+        return Database(
+            database_url,
+            pool_size=settings.database_pool_size,
+            max_overflow=settings.database_max_overflow,
+            pool_timeout_seconds=settings.database_pool_timeout_seconds,
+            pool_pre_ping=settings.database_pool_pre_ping,
+            pool_recycle_seconds=settings.database_pool_recycle_seconds,
+            statement_cache_size=settings.database_statement_cache_size,
+            prepare_threshold=(
+                settings.database_prepare_threshold if settings.database_prepared_statements else None
+            ),
+        )
+
+    async def start(self) -> None:
+        await self._read_router.start()
+        await self._fraud_scoring_service.start()
+        await self._model_manager.start()
+        await self._rule_set_manager.start()
+        if self._write_behind_queue is not None:
+            await self._write_behind_queue.start()
+        if self._velocity_index is not None:
+            await self._warm_velocity_index()
+
+    async def _warm_velocity_index(self) -> None:
+        assert self._velocity_index is not None
+        session = self.get_database_session()
+        try:
+            repository = TransactionRepository(session)
+            async for transaction in repository.iter_since(datetime.utcnow() - timedelta(hours=24)):
+                self._velocity_index.record(transaction)
+        finally:
+            await session.close()
+        self._logger.info("Warmed velocity index", keys=self._velocity_index.stats()["keys"])
 
     def get_database_session(self) -> AsyncSession:
         return self._database._session_factory()
@@ -35,20 +328,42 @@ class DependencyRegistry:
     def get_database_session_dependency(self) -> AsyncIterator[AsyncSession]:
         return self._database.get_session()
 
+    def get_read_session(self, transaction_id: str | None = None, user_id: str | None = None) -> AsyncSession:
+        return self._read_router.read_session(transaction_id=transaction_id, user_id=user_id)
+
+    def get_database_pool_stats(self) -> DatabasePoolStats:
+        return self._database.pool_stats()
+
     def get_assess_fraud_risk_use_case(self, session: AsyncSession) -> AssessFraudRiskUseCase:
-        fraud_decision_repo = FraudDecisionRepository(session)
-        transaction_repo = TransactionRepository(session)
+        unit_of_work: SqlAlchemyUnitOfWork | WriteBehindUnitOfWork
+        transaction_repository = TransactionRepository(session)
+        fraud_decision_repository = FraudDecisionRepository(session)
+        if self._write_behind_queue is not None:
+            unit_of_work = WriteBehindUnitOfWork(self._write_behind_queue, self._read_router.recent_writes)
+            transaction_repository = WriteBehindTransactionRepository(session, self._write_behind_queue)
+            fraud_decision_repository = WriteBehindFraudDecisionRepository(session, self._write_behind_queue)
+        else:
+            unit_of_work = SqlAlchemyUnitOfWork(session, self._read_router.recent_writes)
         return AssessFraudRiskUseCase(
             fraud_scoring_port=self._fraud_scoring_service,
-            fraud_decision_repository=fraud_decision_repo,
-            transaction_repository=transaction_repo,
+            unit_of_work=unit_of_work,
+            velocity_index=self._velocity_index,
+            decision_cache=self._decision_cache,
+            stage_metrics=self._metrics.stages,
+            rule_engine=self._rule_set_manager.engine,
+            idempotency_index=self._idempotency_index,
+            transaction_repository=transaction_repository,
+            fraud_decision_repository=fraud_decision_repository,
         )
 
     def get_retrieve_fraud_decision_use_case(
         self, session: AsyncSession
     ) -> RetrieveFraudDecisionUseCase:
         fraud_decision_repo = FraudDecisionRepository(session)
-        return RetrieveFraudDecisionUseCase(fraud_decision_repository=fraud_decision_repo)
+        return RetrieveFraudDecisionUseCase(
+            fraud_decision_repository=fraud_decision_repo,
+            decision_cache=self._decision_cache,
+        )
 
     def get_retrieve_fraud_history_use_case(
         self, session: AsyncSession
@@ -56,12 +371,48 @@ class DependencyRegistry:
         fraud_decision_repo = FraudDecisionRepository(session)
         return RetrieveFraudHistoryUseCase(fraud_decision_repository=fraud_decision_repo)
 
+    def get_metrics(self) -> ServiceMetrics:
+        return self._metrics
+
+    def get_stage_metrics(self) -> StageMetrics:
+        return self._metrics.stages
+
+    def get_model_manager(self) -> ModelManager:
+        return self._model_manager
+
+    def get_rule_set_manager(self) -> RuleSetManager:
+        return self._rule_set_manager
+
+    def get_admin_token(self) -> str | None:
+        return self._settings.admin_token or None
+
     def get_fraud_scoring_service(self) -> FraudScoringService:
         return self._fraud_scoring_service
 
+    def get_feature_store(self) -> CachedFeatureStore:
+        return self._feature_store
+
+    def get_decision_cache(self) -> InMemoryDecisionCache:
+        return self._decision_cache
+
+    def get_idempotency_index(self) -> InMemoryIdempotencyIndex:
+        return self._idempotency_index
+
+    def get_velocity_index(self) -> SlidingWindowIndex | None:
+        return self._velocity_index
+
     async def test_database_connection(self) -> bool:
         return await self._database.test_connection()
 
+    async def check_replica_health(self) -> list[ReplicaHealth]:
+        return await self._read_router.check_health()
+
     async def close(self) -> None:
+        await self._model_manager.close()
+        await self._rule_set_manager.close()
+        await self._fraud_scoring_service.close()
+        if self._write_behind_queue is not None:
+            await self._write_behind_queue.close()
+        await self._read_router.close()
         await self._database.close()
 
@@ -1,3 +1,4 @@
+from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 
@@ -10,13 +11,40 @@ class Decision(Enum):
     BLOCK = "block"
 
 
+DECISION_SEVERITY: dict[Decision, int] = {Decision.APPROVE: 0, Decision.REVIEW: 1, Decision.BLOCK: 2}
+
+
+@dataclass(frozen=True, slots=True)
+class DecisionThresholds:
+    review: float = 0.3
+    block: float = 0.7
+
+    def __post_init__(self) -> None:
+        if not 0.0 <= self.review <= self.block <= 1.0:
+            raise ValueError("Decision thresholds must satisfy 0 <= review <= block <= 1")
+
+    def decide(self, risk_score: float) -> Decision:
+        if risk_score < self.review:
+            return Decision.APPROVE
+        if risk_score < self.block:
+            return Decision.REVIEW
+        return Decision.BLOCK
+
+
+DEFAULT_DECISION_THRESHOLDS = DecisionThresholds()
+
+
 class FraudDecision:
+    __slots__ = ("_transaction_id", "_risk_score", "_decision", "_timestamp", "_model_version", "_matched_rules")
+
     def __init__(
         self,
         transaction_id: TransactionId,
         risk_score: float,
         decision: Decision,
         timestamp: datetime,
+        model_version: str | None = None,
+        matched_rules: tuple[str, ...] = (),
     ) -> None:
         if risk_score < 0.0 or risk_score > 1.0:
             raise ValueError("Risk score must be between 0.0 and 1.0")
@@ -24,6 +52,8 @@ class FraudDecision:
         self._risk_score = risk_score
         self._decision = decision
         self._timestamp = timestamp
+        self._model_version = model_version
+        self._matched_rules = matched_rules
 
     @classmethod
     def create(
@@ -31,18 +61,18 @@ class FraudDecision:
         transaction_id: TransactionId,
         risk_score: float,
         timestamp: datetime,
+        model_version: str | None = None,
+        matched_rules: tuple[str, ...] = (),
+        thresholds: DecisionThresholds = DEFAULT_DECISION_THRESHOLDS,
+        decision: Decision | None = None,
     ) -> "FraudDecision":
-        if risk_score < 0.3:
-            decision = Decision.APPROVE
-        elif risk_score < 0.7:
-            decision = Decision.REVIEW
-        else:
-            decision = Decision.BLOCK
         return cls(
             transaction_id=transaction_id,
             risk_score=risk_score,
-            decision=decision,
+            decision=decision if decision is not None else thresholds.decide(risk_score),
             timestamp=timestamp,
+            model_version=model_version,
+            matched_rules=matched_rules,
         )
 
     @property
@@ -61,3 +91,10 @@ class FraudDecision:
     def timestamp(self) -> datetime:
         return self._timestamp
 
+    @property
+    def model_version(self) -> str | None:
+        return self._model_version
+
+    @property
+    def matched_rules(self) -> tuple[str, ...]:
+        return self._matched_rules
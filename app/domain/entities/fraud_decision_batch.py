@@ -0,0 +1,190 @@
+from array import array
+from collections.abc import Hashable, Iterable, Iterator
+from datetime import datetime, timedelta, timezone
+from typing import TypeVar
+from uuid import UUID
+
+from app.domain.entities.fraud_decision import Decision, FraudDecision
+from app.domain.value_objects.transaction_id import TransactionId
+
+DECISION_CODES: tuple[Decision, ...] = (Decision.APPROVE, Decision.REVIEW, Decision.BLOCK)
+
+_CODE_BY_DECISION: dict[Decision | str, int] = {
+    **{decision: code for code, decision in enumerate(DECISION_CODES)},
+    **{decision.value: code for code, decision in enumerate(DECISION_CODES)},
+}
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+_UUID_BYTES = 16
+
+CodeT = TypeVar("CodeT", bound=Hashable)
+DecisionRow = tuple[str, float, str, datetime, str | None, tuple[str, ...]]
+
+
+class FraudDecisionBatch:
+    __slots__ = (
+        "_transaction_ids",
+        "_risk_scores",
+        "_decision_codes",
+        "_timestamps",
+        "_model_version_codes",
+        "_model_versions",
+        "_model_version_index",
+        "_rule_codes",
+        "_rule_sets",
+        "_rule_set_index",
+    )
+
+    def __init__(self) -> None:
+        self._transaction_ids = bytearray()
+        self._risk_scores = array("d")
+        self._decision_codes = array("b")
+        self._timestamps = array("q")
+        self._model_version_codes = array("I")
+        self._model_versions: list[str | None] = []
+        self._model_version_index: dict[str | None, int] = {}
+        self._rule_codes = array("I")
+        self._rule_sets: list[tuple[str, ...]] = []
+        self._rule_set_index: dict[tuple[str, ...], int] = {}
+
+    @classmethod
+    def from_decisions(cls, fraud_decisions: Iterable[FraudDecision]) -> "FraudDecisionBatch":
+        batch = cls()
+        for fraud_decision in fraud_decisions:
+            batch.append_decision(fraud_decision)
+        return batch
+
+    def append(
+        self,
+        transaction_id: TransactionId | UUID | str,
+        risk_score: float,
+        decision: Decision | str,
+        timestamp: datetime,
+        model_version: str | None = None,
+        matched_rules: Iterable[str] | None = None,
+    ) -> None:
+        if risk_score < 0.0 or risk_score > 1.0:
+            raise ValueError("Risk score must be between 0.0 and 1.0")
+        self._transaction_ids += _uuid_bytes(transaction_id)
+        self._risk_scores.append(risk_score)
+        self._decision_codes.append(_CODE_BY_DECISION[decision])
+        self._timestamps.append(_to_micros(timestamp))
+        self._model_version_codes.append(_code(model_version, self._model_versions, self._model_version_index))
+        rules = tuple(matched_rules) if matched_rules else ()
+        self._rule_codes.append(_code(rules, self._rule_sets, self._rule_set_index))
+
+    def append_decision(self, fraud_decision: FraudDecision) -> None:
+        self.append(
+            fraud_decision.transaction_id,
+            fraud_decision.risk_score,
+            fraud_decision.decision,
+            fraud_decision.timestamp,
+            fraud_decision.model_version,
+            fraud_decision.matched_rules,
+        )
+
+    def __len__(self) -> int:
+        return len(self._risk_scores)
+
+    def __getitem__(self, index: int) -> FraudDecision:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("FraudDecisionBatch index out of range")
+        return FraudDecision(
+            transaction_id=TransactionId(value=self.transaction_id(index)),
+            risk_score=self._risk_scores[index],
+            decision=DECISION_CODES[self._decision_codes[index]],
+            timestamp=self.timestamp(index),
+            model_version=self._model_versions[self._model_version_codes[index]],
+            matched_rules=self._rule_sets[self._rule_codes[index]],
+        )
+
+    def __iter__(self) -> Iterator[FraudDecision]:
+        for index in range(len(self)):
+            yield self[index]
+
+    @property
+    def risk_scores(self) -> array[float]:
+        return self._risk_scores
+
+    @property
+    def decision_codes(self) -> array[int]:
+        return self._decision_codes
+
+    @property
+    def timestamps_us(self) -> array[int]:
+        return self._timestamps
+
+    def transaction_id(self, index: int) -> UUID:
+        start = index * _UUID_BYTES
+        return UUID(bytes=bytes(self._transaction_ids[start : start + _UUID_BYTES]))
+
+    def timestamp(self, index: int) -> datetime:
+        return _EPOCH + timedelta(microseconds=self._timestamps[index])
+
+    def rows(self) -> Iterator[DecisionRow]:
+        model_versions = self._model_versions
+        rule_sets = self._rule_sets
+        ids = self._transaction_ids
+        for index, (risk_score, code, micros, version_code, rule_code) in enumerate(
+            zip(self._risk_scores, self._decision_codes, self._timestamps, self._model_version_codes, self._rule_codes)
+        ):
+            start = index * _UUID_BYTES
+            digits = ids[start : start + _UUID_BYTES].hex()
+            yield (
+                f"{digits[:8]}-{digits[8:12]}-{digits[12:16]}-{digits[16:20]}-{digits[20:]}",
+                risk_score,
+                DECISION_CODES[code].value,
+                _EPOCH + timedelta(microseconds=micros),
+                model_versions[version_code],
+                rule_sets[rule_code],
+            )
+
+    def decision_counts(self) -> dict[Decision, int]:
+        counts = [0] * len(DECISION_CODES)
+        for code in self._decision_codes:
+            counts[code] += 1
+        return {decision: counts[code] for code, decision in enumerate(DECISION_CODES)}
+
+    def nbytes(self) -> int:
+        return (
+            len(self._transaction_ids)
+            + sum(
+                column.itemsize * len(column)
+                for column in (
+                    self._risk_scores,
+                    self._decision_codes,
+                    self._timestamps,
+                    self._model_version_codes,
+                    self._rule_codes,
+                )
+            )
+        )
+
+
+def _uuid_bytes(transaction_id: TransactionId | UUID | str) -> bytes:
+    if isinstance(transaction_id, TransactionId):
+        return transaction_id.value.bytes
+    if isinstance(transaction_id, UUID):
+        return transaction_id.bytes
+    try:
+        raw = bytes.fromhex(transaction_id.replace("-", ""))
+    except ValueError:
+        raw = b""
+    return raw if len(raw) == _UUID_BYTES else UUID(transaction_id).bytes
+
+
+def _to_micros(timestamp: datetime) -> int:
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+    return (timestamp - _EPOCH) // _MICROSECOND
+
+
+def _code(value: CodeT, values: list[CodeT], index: dict[CodeT, int]) -> int:
+    code = index.get(value)
+    if code is None:
+        code = len(values)
+        values.append(value)
+        index[value] = code
+    return code
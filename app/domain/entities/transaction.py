@@ -1,4 +1,5 @@
-from datetime import datetime
+from collections.abc import Hashable
+from datetime import datetime, timezone
 from typing import TypedDict
 
 from app.domain.value_objects.merchant_id import MerchantId
@@ -15,6 +16,8 @@ class TransactionMetadata(TypedDict, total=False):
 
 
 class Transaction:
+    __slots__ = ("_transaction_id", "_user_id", "_merchant_id", "_amount", "_timestamp", "_metadata")
+
     def __init__(
         self,
         transaction_id: TransactionId,
@@ -55,13 +58,14 @@ class Transaction:
     def metadata(self) -> TransactionMetadata:
         return self._metadata
 
-    def assess_fraud_risk(self, ml_score: float) -> float:
-        if ml_score < 0.0 or ml_score > 1.0:
-            raise ValueError("ML score must be between 0.0 and 1.0")
-        base_risk = ml_score
-        if self._amount.value > 10000:
-            base_risk = min(1.0, base_risk + 0.1)
-        if self._timestamp.hour < 6 or self._timestamp.hour > 22:
-            base_risk = min(1.0, base_risk + 0.05)
-        return min(1.0, base_risk)
-
+    def fingerprint(self) -> tuple[Hashable, ...]:
+        timestamp = self._timestamp
+        if timestamp.tzinfo is not None:
+            timestamp = timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+        return (
+            self._user_id.value,
+            self._merchant_id.value,
+            self._amount.value,
+            timestamp,
+            tuple(sorted(self._metadata.items())),
+        )
@@ -35,3 +35,22 @@ class FraudDecisionNotFoundError(DomainException):
 class TransactionNotFoundError(DomainException):
     pass
 
+
+@final
+class InvalidHistoryCursorError(DomainException):
+    pass
+
+
+@final
+class InvalidRuleSetError(DomainException):
+    pass
+
+
+@final
+class DuplicateTransactionError(DomainException):
+    pass
+
+
+@final
+class IdempotencyConflictError(DomainException):
+    pass
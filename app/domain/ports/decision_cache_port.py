@@ -0,0 +1,15 @@
+from typing import Protocol
+
+from app.domain.entities.fraud_decision import FraudDecision
+from app.domain.value_objects.transaction_id import TransactionId
+
+
+class DecisionCachePort(Protocol):
+    async def get(self, transaction_id: TransactionId) -> FraudDecision | None:
+        ...
+
+    async def put(self, fraud_decision: FraudDecision) -> None:
+        ...
+
+    async def put_many(self, fraud_decisions: list[FraudDecision]) -> None:
+        ...
@@ -0,0 +1,11 @@
+from typing import Protocol
+
+from app.domain.entities.transaction import Transaction
+
+
+class FeatureStorePort(Protocol):
+    async def get_features(self, transaction: Transaction) -> dict[str, float]:
+        ...
+
+    async def get_features_many(self, transactions: list[Transaction]) -> list[dict[str, float]]:
+        ...
@@ -1,6 +1,10 @@
+from collections.abc import AsyncIterator
 from typing import Protocol
 
 from app.domain.entities.fraud_decision import FraudDecision
+from app.domain.entities.fraud_decision_batch import FraudDecisionBatch
+from app.domain.value_objects.fraud_history_filter import FraudHistoryFilter
+from app.domain.value_objects.history_cursor import HistoryCursor
 from app.domain.value_objects.transaction_id import TransactionId
 from app.domain.value_objects.user_id import UserId
 
@@ -9,9 +13,31 @@ class FraudDecisionRepositoryPort(Protocol):
     async def save(self, fraud_decision: FraudDecision) -> None:
         ...
 
+    async def save_many(self, fraud_decisions: list[FraudDecision]) -> None:
+        ...
+
     async def find_by_transaction_id(self, transaction_id: TransactionId) -> FraudDecision | None:
         ...
 
+    async def find_by_transaction_ids(self, transaction_ids: list[TransactionId]) -> list[FraudDecision]:
+        ...
+
     async def find_by_user_id(self, user_id: UserId) -> list[FraudDecision]:
         ...
 
+    async def find_page_by_user_id(
+        self,
+        user_id: UserId,
+        limit: int,
+        cursor: HistoryCursor | None = None,
+        history_filter: FraudHistoryFilter = FraudHistoryFilter(),
+    ) -> tuple[FraudDecisionBatch, HistoryCursor | None]:
+        ...
+
+    def stream_batches_by_user_id(
+        self,
+        user_id: UserId,
+        history_filter: FraudHistoryFilter = FraudHistoryFilter(),
+        chunk_size: int = 1000,
+    ) -> AsyncIterator[FraudDecisionBatch]:
+        ...
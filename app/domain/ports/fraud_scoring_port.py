@@ -1,9 +1,12 @@
 from typing import Protocol
 
 from app.domain.entities.transaction import Transaction
+from app.domain.value_objects.model_score import ModelScore
 
 
 class FraudScoringPort(Protocol):
-    async def score_transaction(self, transaction: Transaction) -> float:
+    async def score_transaction(self, transaction: Transaction) -> ModelScore:
         ...
 
+    async def score_transactions(self, transactions: list[Transaction]) -> list[ModelScore]:
+        ...
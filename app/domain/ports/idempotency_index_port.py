@@ -0,0 +1,19 @@
+import asyncio
+from collections.abc import Hashable
+from typing import Protocol
+
+from app.domain.entities.fraud_decision import FraudDecision
+from app.domain.value_objects.transaction_id import TransactionId
+
+
+class IdempotencyIndexPort(Protocol):
+    def claim(
+        self, transaction_id: TransactionId, fingerprint: tuple[Hashable, ...]
+    ) -> "asyncio.Future[FraudDecision] | None":
+        ...
+
+    def resolve(self, transaction_id: TransactionId, fraud_decision: FraudDecision) -> None:
+        ...
+
+    def fail(self, transaction_id: TransactionId, error: BaseException) -> None:
+        ...
@@ -0,0 +1,6 @@
+from typing import Protocol
+
+
+class StageMetricsPort(Protocol):
+    def observe_stage(self, stage: str, seconds: float) -> None:
+        ...
@@ -0,0 +1,18 @@
+from typing import Protocol
+
+QueueMessage = tuple[int, bytes]
+
+
+class TransactionQueuePort(Protocol):
+    @property
+    def committed_offset(self) -> int:
+        ...
+
+    async def receive(self, max_messages: int, timeout_seconds: float) -> list[QueueMessage] | None:
+        ...
+
+    async def commit(self, offset: int) -> None:
+        ...
+
+    async def close(self) -> None:
+        ...
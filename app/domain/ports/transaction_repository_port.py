@@ -1,3 +1,5 @@
+from collections.abc import AsyncIterator
+from datetime import datetime
 from typing import Protocol
 
 from app.domain.entities.transaction import Transaction
@@ -8,6 +10,41 @@ class TransactionRepositoryPort(Protocol):
     async def save(self, transaction: Transaction) -> None:
         ...
 
+    async def save_many(self, transactions: list[Transaction]) -> None:
+        ...
+
     async def find_by_id(self, transaction_id: TransactionId) -> Transaction | None:
         ...
 
+    async def find_by_ids(self, transaction_ids: list[TransactionId]) -> list[Transaction]:
+        ...
+
+    def iter_since(self, since: datetime) -> AsyncIterator[Transaction]:
+        ...
+
+    async def count_in_range(self, start: datetime | None = None, end: datetime | None = None) -> int:
+        ...
+
+    async def find_id_range(
+        self, start: datetime | None = None, end: datetime | None = None
+    ) -> tuple[int, int] | None:
+        ...
+
+    async def find_chunk_after(
+        self,
+        after_id: int = 0,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        limit: int = 10000,
+        max_id: int | None = None,
+    ) -> tuple[int, list[Transaction]]:
+        ...
+
+    async def find_chunk_after_timestamp(
+        self,
+        after: tuple[datetime, int] | None = None,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        limit: int = 10000,
+    ) -> tuple[tuple[datetime, int] | None, list[Transaction]]:
+        ...
@@ -0,0 +1,24 @@
+from typing import Protocol
+
+from app.domain.entities.fraud_decision import FraudDecision
+from app.domain.entities.transaction import Transaction
+
+
+class UnitOfWorkPort(Protocol):
+    def add_transaction(self, transaction: Transaction) -> None:
+        ...
+
+    def add_transactions(self, transactions: list[Transaction]) -> None:
+        ...
+
+    def add_fraud_decision(self, fraud_decision: FraudDecision) -> None:
+        ...
+
+    def add_fraud_decisions(self, fraud_decisions: list[FraudDecision]) -> None:
+        ...
+
+    async def commit(self) -> None:
+        ...
+
+    async def rollback(self) -> None:
+        ...
@@ -0,0 +1,11 @@
+from typing import Protocol
+
+from app.domain.entities.transaction import Transaction
+
+
+class VelocityIndexPort(Protocol):
+    def record(self, transaction: Transaction) -> None:
+        ...
+
+    def record_many(self, transactions: list[Transaction]) -> None:
+        ...
@@ -0,0 +1,290 @@
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from app.domain.entities.fraud_decision import (
+    DECISION_SEVERITY,
+    DEFAULT_DECISION_THRESHOLDS,
+    Decision,
+    DecisionThresholds,
+)
+from app.domain.entities.transaction import Transaction
+from app.domain.exceptions import InvalidRuleSetError
+
+FieldValue = float | str | None
+
+NUMERIC_FIELDS: dict[str, Callable[[Transaction], float]] = {
+    "amount": lambda transaction: float(transaction.amount.value),
+    "hour": lambda transaction: float(transaction.timestamp.hour),
+    "day_of_week": lambda transaction: float(transaction.timestamp.weekday()),
+}
+CATEGORICAL_FIELDS: dict[str, Callable[[Transaction], str | None]] = {
+    "user_id": lambda transaction: transaction.user_id.value,
+    "merchant_id": lambda transaction: transaction.merchant_id.value,
+}
+METADATA_PREFIX = "metadata."
+
+SET_OPERATORS = ("eq", "in")
+THRESHOLD_OPERATORS = ("gt", "gte", "lt", "lte")
+
+
+@dataclass(frozen=True, slots=True)
+class RuleCondition:
+    field: str
+    op: str
+    value: Any
+
+    def __post_init__(self) -> None:
+        numeric = self.field in NUMERIC_FIELDS
+        if not numeric and self.field not in CATEGORICAL_FIELDS and not self.field.startswith(METADATA_PREFIX):
+            raise InvalidRuleSetError(f"Unknown rule field: {self.field}")
+        if self.op in THRESHOLD_OPERATORS:
+            if not numeric or not _is_number(self.value):
+                raise InvalidRuleSetError(f"Operator {self.op} needs a numeric field and value: {self.field}")
+            return
+        if self.op in ("in", "not_in"):
+            if isinstance(self.value, (str, bytes)) or not isinstance(self.value, (list, tuple, frozenset, set)):
+                raise InvalidRuleSetError(f"Operator {self.op} needs a list of values: {self.field}")
+            raw = tuple(self.value)
+        elif self.op in ("eq", "ne"):
+            raw = (self.value,)
+        else:
+            raise InvalidRuleSetError(f"Unknown rule operator: {self.op}")
+        if numeric and not all(_is_number(value) for value in raw):
+            raise InvalidRuleSetError(f"Operator {self.op} needs numeric values for field: {self.field}")
+
+    @property
+    def values(self) -> frozenset[FieldValue]:
+        raw = self.value if self.op in ("in", "not_in") else (self.value,)
+        if self.field in NUMERIC_FIELDS:
+            return frozenset(float(value) for value in raw)
+        return frozenset(str(value) for value in raw)
+
+
+@dataclass(frozen=True, slots=True)
+class RiskRule:
+    id: str
+    conditions: tuple[RuleCondition, ...]
+    adjustment: float = 0.0
+    decision: Decision | None = None
+    description: str = ""
+
+    def __post_init__(self) -> None:
+        if not self.id:
+            raise InvalidRuleSetError("Rules need an id")
+        if not self.conditions:
+            raise InvalidRuleSetError(f"Rule {self.id} has no conditions")
+        if self.adjustment == 0.0 and self.decision is None:
+            raise InvalidRuleSetError(f"Rule {self.id} neither adjusts the risk score nor sets a decision")
+
+
+@dataclass(frozen=True, slots=True)
+class RuleSet:
+    rules: tuple[RiskRule, ...]
+    thresholds: DecisionThresholds = DEFAULT_DECISION_THRESHOLDS
+    version: str = "default"
+
+    def __post_init__(self) -> None:
+        ids = [rule.id for rule in self.rules]
+        if len(set(ids)) != len(ids):
+            raise InvalidRuleSetError("Rule ids must be unique")
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "RuleSet":
+        try:
+            thresholds = data.get("thresholds", {})
+            return cls(
+                rules=tuple(_parse_rule(rule) for rule in data.get("rules", [])),
+                thresholds=DecisionThresholds(
+                    review=float(thresholds.get("review", DEFAULT_DECISION_THRESHOLDS.review)),
+                    block=float(thresholds.get("block", DEFAULT_DECISION_THRESHOLDS.block)),
+                ),
+                version=str(data.get("version", "unversioned")),
+            )
+        except InvalidRuleSetError:
+            raise
+        except (AttributeError, KeyError, TypeError, ValueError) as e:
+            raise InvalidRuleSetError(f"Invalid rule set: {e}") from e
+
+
+@dataclass(frozen=True, slots=True)
+class RiskAssessment:
+    risk_score: float
+    decision: Decision
+    matched_rules: tuple[str, ...] = ()
+
+
+class _CompiledRule:
+    __slots__ = ("id", "adjustment", "decision", "checks")
+
+    def __init__(self, rule: RiskRule, checks: tuple[tuple[str, Callable[[FieldValue], bool]], ...]) -> None:
+        self.id = rule.id
+        self.adjustment = rule.adjustment
+        self.decision = rule.decision
+        self.checks = checks
+
+
+class RuleEngine:
+    def __init__(self, rule_set: RuleSet) -> None:
+        self._rule_set = rule_set
+        self._rules: list[_CompiledRule] = []
+        self._hash_index: dict[str, dict[FieldValue, list[int]]] = {}
+        self._threshold_index: dict[tuple[str, str], tuple[list[float], list[int]]] = {}
+        self._unindexed: list[int] = []
+        fields: set[str] = set()
+        thresholds: dict[tuple[str, str], list[tuple[float, int]]] = {}
+        for index, rule in enumerate(rule_set.rules):
+            anchor = _anchor(rule.conditions)
+            residual = tuple(condition for condition in rule.conditions if condition is not anchor)
+            self._rules.append(_CompiledRule(rule, tuple((c.field, _check(c)) for c in residual)))
+            fields.update(condition.field for condition in rule.conditions)
+            if anchor is None:
+                self._unindexed.append(index)
+            elif anchor.op in SET_OPERATORS:
+                by_value = self._hash_index.setdefault(anchor.field, {})
+                for value in anchor.values:
+                    by_value.setdefault(value, []).append(index)
+            else:
+                thresholds.setdefault((anchor.field, anchor.op), []).append((float(anchor.value), index))
+        for key, entries in thresholds.items():
+            entries.sort()
+            self._threshold_index[key] = ([value for value, _ in entries], [index for _, index in entries])
+        self._extractors = tuple((name, _extractor(name)) for name in sorted(fields))
+
+    @property
+    def rule_set(self) -> RuleSet:
+        return self._rule_set
+
+    @property
+    def thresholds(self) -> DecisionThresholds:
+        return self._rule_set.thresholds
+
+    def matching_rules(self, transaction: Transaction) -> list[str]:
+        return [self._rules[index].id for index in self._matches(transaction)]
+
+    def assess(self, transaction: Transaction, ml_score: float) -> RiskAssessment:
+        if ml_score < 0.0 or ml_score > 1.0:
+            raise ValueError("ML score must be between 0.0 and 1.0")
+        risk_score = ml_score
+        forced: Decision | None = None
+        matched: list[str] = []
+        for index in self._matches(transaction):
+            rule = self._rules[index]
+            matched.append(rule.id)
+            risk_score += rule.adjustment
+            if rule.decision is not None and (
+                forced is None or DECISION_SEVERITY[rule.decision] > DECISION_SEVERITY[forced]
+            ):
+                forced = rule.decision
+        risk_score = min(1.0, max(0.0, risk_score))
+        decision = forced if forced is not None else self._rule_set.thresholds.decide(risk_score)
+        return RiskAssessment(risk_score=risk_score, decision=decision, matched_rules=tuple(matched))
+
+    def _matches(self, transaction: Transaction) -> list[int]:
+        values = {name: extract(transaction) for name, extract in self._extractors}
+        candidates = list(self._unindexed)
+        for name, by_value in self._hash_index.items():
+            hits = by_value.get(values[name])
+            if hits:
+                candidates.extend(hits)
+        for (name, op), (bounds, indices) in self._threshold_index.items():
+            value = values[name]
+            assert isinstance(value, float)
+            if op == "gt":
+                candidates.extend(indices[: bisect_left(bounds, value)])
+            elif op == "gte":
+                candidates.extend(indices[: bisect_right(bounds, value)])
+            elif op == "lt":
+                candidates.extend(indices[bisect_right(bounds, value) :])
+            else:
+                candidates.extend(indices[bisect_left(bounds, value) :])
+        candidates.sort()
+        return [
+            index
+            for index in candidates
+            if all(check(values[name]) for name, check in self._rules[index].checks)
+        ]
+
+
+def _parse_rule(data: Mapping[str, Any]) -> RiskRule:
+    decision = data.get("decision")
+    return RiskRule(
+        id=str(data["id"]),
+        conditions=tuple(
+            RuleCondition(field=str(condition["field"]), op=str(condition["op"]), value=condition["value"])
+            for condition in data["when"]
+        ),
+        adjustment=float(data.get("adjust", 0.0)),
+        decision=Decision(decision) if decision is not None else None,
+        description=str(data.get("description", "")),
+    )
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _anchor(conditions: tuple[RuleCondition, ...]) -> RuleCondition | None:
+    for operators in (SET_OPERATORS, THRESHOLD_OPERATORS):
+        for condition in conditions:
+            if condition.op in operators:
+                return condition
+    return None
+
+
+def _check(condition: RuleCondition) -> Callable[[FieldValue], bool]:
+    op = condition.op
+    if op in THRESHOLD_OPERATORS:
+        bound = float(condition.value)
+        if op == "gt":
+            return lambda value: value is not None and float(value) > bound
+        if op == "gte":
+            return lambda value: value is not None and float(value) >= bound
+        if op == "lt":
+            return lambda value: value is not None and float(value) < bound
+        return lambda value: value is not None and float(value) <= bound
+    values = condition.values
+    if op in SET_OPERATORS:
+        return lambda value: value in values
+    return lambda value: value is not None and value not in values
+
+
+def _extractor(name: str) -> Callable[[Transaction], FieldValue]:
+    if name in NUMERIC_FIELDS:
+        return NUMERIC_FIELDS[name]
+    if name in CATEGORICAL_FIELDS:
+        return CATEGORICAL_FIELDS[name]
+    key = name[len(METADATA_PREFIX) :]
+
+    def metadata_value(transaction: Transaction) -> str | None:
+        value = transaction.metadata.get(key)
+        return str(value) if value is not None else None
+
+    return metadata_value
+
+
+DEFAULT_RULE_SET = RuleSet(
+    rules=(
+        RiskRule(
+            id="high_amount",
+            conditions=(RuleCondition(field="amount", op="gt", value=10000),),
+            adjustment=0.1,
+            description="Amount above 10000",
+        ),
+        RiskRule(
+            id="night_early",
+            conditions=(RuleCondition(field="hour", op="lt", value=6),),
+            adjustment=0.05,
+            description="Between midnight and 6am",
+        ),
+        RiskRule(
+            id="night_late",
+            conditions=(RuleCondition(field="hour", op="gt", value=22),),
+            adjustment=0.05,
+            description="After 11pm",
+        ),
+    ),
+)
+
+DEFAULT_RULE_ENGINE = RuleEngine(DEFAULT_RULE_SET)
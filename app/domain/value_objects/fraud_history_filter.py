@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+from app.domain.entities.fraud_decision import Decision
+
+
+@dataclass(frozen=True, slots=True)
+class FraudHistoryFilter:
+    start: datetime | None = None
+    end: datetime | None = None
+    decision: Decision | None = None
@@ -0,0 +1,25 @@
+import base64
+import binascii
+from dataclasses import dataclass
+from datetime import datetime
+
+from app.domain.exceptions import InvalidHistoryCursorError
+
+
+@dataclass(frozen=True, slots=True)
+class HistoryCursor:
+    timestamp: datetime
+    id: int
+
+    @classmethod
+    def decode(cls, value: str) -> "HistoryCursor":
+        try:
+            raw = base64.urlsafe_b64decode(value.encode("ascii") + b"=" * (-len(value) % 4)).decode("utf-8")
+            timestamp, _, row_id = raw.partition("|")
+            return cls(timestamp=datetime.fromisoformat(timestamp), id=int(row_id))
+        except (ValueError, UnicodeError, binascii.Error):
+            raise InvalidHistoryCursorError(f"Invalid history cursor: {value}")
+
+    def encode(self) -> str:
+        raw = f"{self.timestamp.isoformat()}|{self.id}".encode("utf-8")
+        return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
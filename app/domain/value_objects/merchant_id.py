@@ -1,17 +1,25 @@
+import sys
 from dataclasses import dataclass
+from functools import lru_cache
 
 from app.domain.exceptions import InvalidMerchantIdError
 
+MERCHANT_ID_CACHE_SIZE = 16384
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class MerchantId:
     value: str
 
     @classmethod
     def create(cls, value: str) -> "MerchantId":
-        if not value or not value.strip():
-            raise InvalidMerchantIdError("Merchant ID cannot be empty")
-        if len(value) > 100:
-            raise InvalidMerchantIdError("Merchant ID exceeds maximum length")
-        return cls(value=value.strip())
+        return _interned(value)
+
 
+@lru_cache(maxsize=MERCHANT_ID_CACHE_SIZE)
+def _interned(value: str) -> MerchantId:
+    if not value or not value.strip():
+        raise InvalidMerchantIdError("Merchant ID cannot be empty")
+    if len(value) > 100:
+        raise InvalidMerchantIdError("Merchant ID exceeds maximum length")
+    return MerchantId(value=sys.intern(value.strip()))
@@ -0,0 +1,7 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class ModelScore:
+    value: float
+    model_version: str | None = None
@@ -3,24 +3,20 @@ from decimal import Decimal
 
 from app.domain.exceptions import InvalidTransactionAmountError
 
+MAX_TRANSACTION_AMOUNT = Decimal("999999999.99")
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class TransactionAmount:
     value: Decimal
 
     @classmethod
     def create(cls, value: Decimal | float | int | str) -> "TransactionAmount":
-        if isinstance(value, (int, float, str)):
-            decimal_value = Decimal(str(value))
-        else:
-            decimal_value = value
-        if decimal_value <= 0:
-            raise InvalidTransactionAmountError("Transaction amount must be greater than zero")
-        if decimal_value > Decimal("999999999.99"):
+        decimal_value = value if isinstance(value, Decimal) else Decimal(str(value))
+        if decimal_value > MAX_TRANSACTION_AMOUNT:
             raise InvalidTransactionAmountError("Transaction amount exceeds maximum allowed")
         return cls(value=decimal_value)
 
     def __post_init__(self) -> None:
         if self.value <= 0:
             raise InvalidTransactionAmountError("Transaction amount must be greater than zero")
-
@@ -1,10 +1,12 @@
 from dataclasses import dataclass
-from uuid import UUID
+from uuid import UUID, uuid5
 
 from app.domain.exceptions import InvalidTransactionIdError
 
+IDEMPOTENCY_NAMESPACE = UUID("6f1c8e52-3b7a-4d0e-9a61-2c5f0b8d4e17")
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class TransactionId:
     value: UUID
 
@@ -19,6 +21,12 @@ class TransactionId:
             uuid_value = value
         return cls(value=uuid_value)
 
+    @classmethod
+    def from_idempotency_key(cls, key: str, scope: str) -> "TransactionId":
+        if not key:
+            raise InvalidTransactionIdError("Idempotency key must not be empty")
+        return cls(value=uuid5(IDEMPOTENCY_NAMESPACE, f"{scope}\x00{key}"))
+
     def __str__(self) -> str:
         return str(self.value)
 
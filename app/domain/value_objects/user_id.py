@@ -1,17 +1,25 @@
+import sys
 from dataclasses import dataclass
+from functools import lru_cache
 
 from app.domain.exceptions import InvalidUserIdError
 
+USER_ID_CACHE_SIZE = 65536
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class UserId:
     value: str
 
     @classmethod
     def create(cls, value: str) -> "UserId":
-        if not value or not value.strip():
-            raise InvalidUserIdError("User ID cannot be empty")
-        if len(value) > 100:
-            raise InvalidUserIdError("User ID exceeds maximum length")
-        return cls(value=value.strip())
+        return _interned(value)
+
 
+@lru_cache(maxsize=USER_ID_CACHE_SIZE)
+def _interned(value: str) -> UserId:
+    if not value or not value.strip():
+        raise InvalidUserIdError("User ID cannot be empty")
+    if len(value) > 100:
+        raise InvalidUserIdError("User ID exceeds maximum length")
+    return UserId(value=sys.intern(value.strip()))
@@ -8,11 +8,15 @@ from app.adapters.inbound.http.endpoints import (
     fraud_decision_endpoint,
     fraud_history_endpoint,
     health_check_endpoint,
+    metrics_endpoint,
+    model_admin_endpoint,
+    rule_admin_endpoint,
 )
 from app.adapters.inbound.http.exception_handlers import (
     domain_exception_handler,
     value_error_handler,
 )
+from app.adapters.inbound.http.metrics_middleware import MetricsMiddleware
 from app.adapters.outbound.config import Settings
 from app.composition.dependency_registry import DependencyRegistry
 from app.domain.exceptions import DomainException
@@ -22,6 +26,7 @@ from app.domain.exceptions import DomainException
 async def lifespan(app: FastAPI):
     settings = Settings()
     app.state.registry = DependencyRegistry(settings)
+    await app.state.registry.start()
     yield
     await app.state.registry.close()
 
@@ -33,6 +38,12 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+app.add_middleware(
+    MetricsMiddleware,
+    get_metrics=lambda scope: (
+        registry.get_metrics() if (registry := getattr(scope["app"].state, "registry", None)) else None
+    ),
+)
 app.add_exception_handler(DomainException, domain_exception_handler)
 app.add_exception_handler(ValueError, value_error_handler)
 
@@ -40,6 +51,9 @@ app.include_router(fraud_assessment_endpoint.router, tags=["Fraud Assessment"])
 app.include_router(fraud_decision_endpoint.router, tags=["Fraud Decisions"])
 app.include_router(fraud_history_endpoint.router, tags=["Fraud History"])
 app.include_router(health_check_endpoint.router, tags=["Health"])
+app.include_router(metrics_endpoint.router, tags=["Metrics"])
+app.include_router(model_admin_endpoint.router, tags=["Model Administration"])
+app.include_router(rule_admin_endpoint.router, tags=["Rule Administration"])
 
 
 class RootResponse(TypedDict):
@@ -59,9 +73,19 @@ async def root() -> RootResponse:
         documentation="/docs",
         endpoints={
             "assess_fraud": "POST /assess-fraud",
+            "assess_fraud_batch": "POST /assess-fraud/batch",
             "get_fraud_decision": "GET /fraud-decisions/{transaction_id}",
             "get_fraud_history": "GET /fraud-decisions/user/{user_id}",
+            "stream_fraud_history": "GET /fraud-decisions/user/{user_id}/stream",
             "health_check": "GET /health",
+            "metrics": "GET /metrics",
+            "metrics_summary": "GET /metrics/summary",
+            "model_status": "GET /admin/model",
+            "model_reload": "POST /admin/model/reload",
+            "model_rollback": "POST /admin/model/rollback",
+            "model_shadow": "GET /admin/model/shadow",
+            "rules": "GET /admin/rules",
+            "rules_reload": "POST /admin/rules/reload",
         },
     )
 
@@ -0,0 +1,167 @@
+import argparse
+import os
+import signal
+import socket
+import sys
+import time
+from collections import deque
+from types import FrameType
+
+import uvicorn
+
+from app.adapters.outbound.config import Settings
+from app.adapters.outbound.logging.logger import StructuredLogger
+from app.adapters.outbound.ml.compiled_tree_ensemble import CompiledTreeEnsemble
+from app.adapters.outbound.ml.model_loader import ModelLoader
+from app.adapters.outbound.ml.model_registry import ModelRegistry
+
+
+class Supervisor:
+    def __init__(
+        self,
+        sock: socket.socket,
+        workers: int,
+        log_level: str,
+        backlog: int,
+        logger: StructuredLogger,
+        restart_delay_seconds: float = 0.5,
+        max_restart_delay_seconds: float = 30.0,
+        max_crashes: int = 10,
+        crash_window_seconds: float = 60.0,
+    ) -> None:
+        self._sock = sock
+        self._workers = workers
+        self._log_level = log_level
+        self._backlog = backlog
+        self._logger = logger
+        self._restart_delay = restart_delay_seconds
+        self._max_restart_delay = max_restart_delay_seconds
+        self._max_crashes = max_crashes
+        self._crash_window = crash_window_seconds
+        self._crashes: deque[float] = deque()
+        self._children: set[int] = set()
+        self._stopping = False
+
+    def run(self) -> int:
+        signal.signal(signal.SIGTERM, self._stop)
+        signal.signal(signal.SIGINT, self._stop)
+        for _ in range(self._workers):
+            self._spawn()
+        exit_code = 0
+        while self._children:
+            try:
+                pid, status = os.wait()
+            except ChildProcessError:
+                break
+            except InterruptedError:
+                continue
+            self._children.discard(pid)
+            if self._stopping:
+                continue
+            now = time.monotonic()
+            self._crashes.append(now)
+            while self._crashes[0] < now - self._crash_window:
+                self._crashes.popleft()
+            if len(self._crashes) > self._max_crashes:
+                self._logger.error(
+                    "Workers crashing too often, shutting down",
+                    crashes=len(self._crashes),
+                    window_seconds=self._crash_window,
+                )
+                self._stop(signal.SIGTERM, None)
+                exit_code = 1
+                continue
+            delay = min(self._max_restart_delay, self._restart_delay * 2 ** (len(self._crashes) - 1))
+            self._logger.error("Worker exited, restarting", pid=pid, status=status, delay_seconds=delay)
+            self._sleep(delay)
+            if not self._stopping:
+                self._spawn()
+        return exit_code
+
+    def _sleep(self, seconds: float) -> None:
+        deadline = time.monotonic() + seconds
+        while not self._stopping and (remaining := deadline - time.monotonic()) > 0:
+            time.sleep(min(remaining, 0.1))
+
+    def _spawn(self) -> None:
+        pid = os.fork()
+        if pid == 0:
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            signal.signal(signal.SIGINT, signal.SIG_DFL)
+            server = uvicorn.Server(uvicorn.Config("app.main:app", log_level=self._log_level, backlog=self._backlog))
+            server.run(sockets=[self._sock])
+            os._exit(0 if server.started else 1)
+        self._children.add(pid)
+        self._logger.info("Started worker", pid=pid)
+
+    def _stop(self, signum: int, frame: FrameType | None) -> None:
+        self._stopping = True
+        for pid in list(self._children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                self._children.discard(pid)
+
+
+def preload_model(settings: Settings, logger: StructuredLogger) -> None:
+    if settings.model_registry_path and ModelRegistry(settings.model_registry_path).active_version() is not None:
+        logger.info("Skipping preload; registry models are memory-mapped by each worker")
+        return
+    model = ModelLoader.load_inference_model(settings.model_path, settings.model_compiled_inference, logger)
+    if not isinstance(model, CompiledTreeEnsemble):
+        raise SystemExit(
+            f"--preload requires a compiled model; {type(model).__name__} cannot be shared safely across "
+            "forked workers. Export one with scripts/export_compiled_model.py or enable MODEL_COMPILED_INFERENCE."
+        )
+    logger.info("Preloaded model", trees=model.n_trees, nbytes=model.nbytes)
+
+
+def bind(host: str, port: int, backlog: int) -> socket.socket:
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(backlog)
+    sock.set_inheritable(True)
+    return sock
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve the API from several forked worker processes")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--backlog", type=int, default=2048)
+    parser.add_argument("--log-level", default="info")
+    parser.add_argument(
+        "--max-crashes",
+        type=int,
+        default=10,
+        help="Worker crashes tolerated within --crash-window before the supervisor shuts down",
+    )
+    parser.add_argument("--crash-window", type=float, default=60.0, help="Seconds over which crashes are counted")
+    parser.add_argument(
+        "--preload",
+        action="store_true",
+        help="Load and compile the model once in the supervisor so workers inherit it instead of loading their own",
+    )
+    args = parser.parse_args()
+
+    logger = StructuredLogger()
+    if args.preload:
+        preload_model(Settings(), logger)
+    sock = bind(args.host, args.port, args.backlog)
+    supervisor = Supervisor(
+        sock,
+        workers=args.workers,
+        log_level=args.log_level,
+        backlog=args.backlog,
+        logger=logger,
+        max_crashes=args.max_crashes,
+        crash_window_seconds=args.crash_window,
+    )
+    sys.exit(supervisor.run())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+import argparse
+from datetime import datetime
+from typing import Any
+from uuid import uuid4
+
+from app.domain.entities.fraud_decision import FraudDecision
+from app.domain.entities.transaction import Transaction
+from app.domain.services.rule_engine import DEFAULT_RULE_ENGINE
+from app.domain.value_objects.merchant_id import MerchantId
+from app.domain.value_objects.transaction_amount import TransactionAmount
+from app.domain.value_objects.transaction_id import TransactionId
+from app.domain.value_objects.user_id import UserId
+from benchmarks.fixtures import BASE_TIME
+from benchmarks.harness import bench, report
+
+
+def run(iterations: int) -> dict[str, Any]:
+    transaction_id = TransactionId.create(uuid4())
+    user_id = UserId.create("user_1")
+    merchant_id = MerchantId.create("merchant_1")
+    amount = TransactionAmount.create(150.0)
+    transaction_id_text = str(transaction_id.value)
+    transaction = Transaction(
+        transaction_id=transaction_id,
+        user_id=user_id,
+        merchant_id=merchant_id,
+        amount=amount,
+        timestamp=BASE_TIME,
+        metadata={"ip_address": "10.0.0.1"},
+    )
+    decided_at = datetime(2024, 1, 15, 0, 0, 1)
+    return {
+        "transaction_id_create": bench(lambda: TransactionId.create(transaction_id_text), iterations),
+        "user_id_create": bench(lambda: UserId.create("user_1"), iterations),
+        "merchant_id_create": bench(lambda: MerchantId.create("merchant_1"), iterations),
+        "transaction_amount_create": bench(lambda: TransactionAmount.create(150.0), iterations),
+        "transaction_init": bench(
+            lambda: Transaction(
+                transaction_id=transaction_id,
+                user_id=user_id,
+                merchant_id=merchant_id,
+                amount=amount,
+                timestamp=BASE_TIME,
+                metadata={"ip_address": "10.0.0.1"},
+            ),
+            iterations,
+        ),
+        "assess_fraud_risk": bench(lambda: DEFAULT_RULE_ENGINE.assess(transaction, 0.42), iterations),
+        "fraud_decision_create": bench(
+            lambda: FraudDecision.create(transaction_id=transaction_id, risk_score=0.42, timestamp=decided_at),
+            iterations,
+        ),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Domain value object and entity construction microbenchmarks")
+    parser.add_argument("--iterations", type=int, default=50000)
+    parser.add_argument("--output", default=None, help="Write JSON here; 'auto' uses benchmarks/results/<suite>-<commit>.json")
+    args = parser.parse_args()
+    report("domain", run(args.iterations), args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+import argparse
+import asyncio
+import json
+import statistics
+import time
+
+from sqlalchemy import text
+
+from app.adapters.outbound.persistence.database import Database
+from app.adapters.outbound.persistence.repositories.fraud_decision_repository import (
+    FraudDecisionRepository,
+)
+from app.domain.value_objects.user_id import UserId
+
+_SEED_TRANSACTIONS = """
+INSERT INTO transactions (transaction_id, user_id, merchant_id, amount, timestamp, metadata)
+SELECT
+    md5(g::text),
+    'user_' || (g % :users),
+    'merchant_' || (g % 1000),
+    round((random() * 5000)::numeric, 2),
+    timestamp '2024-01-01' + (g || ' seconds')::interval,
+    '{"ip_address": "10.0.0.1"}'::jsonb
+FROM generate_series(:start, :end) AS g
+"""
+
+_SEED_DECISIONS = """
+INSERT INTO fraud_decisions (transaction_id, risk_score, decision, timestamp)
+SELECT
+    md5(g::text),
+    random(),
+    (ARRAY['approve', 'review', 'block'])[1 + (g % 3)],
+    timestamp '2024-01-01' + (g || ' seconds')::interval
+FROM generate_series(:start, :end) AS g
+"""
+
+
+async def seed(database: Database, rows: int, users: int, chunk_size: int) -> None:
+    async with database.engine.connect() as connection:
+        existing = (await connection.execute(text("SELECT COUNT(*) FROM transactions"))).scalar_one()
+    for start in range(existing + 1, rows + 1, chunk_size):
+        end = min(start + chunk_size - 1, rows)
+        async with database.engine.begin() as connection:
+            await connection.execute(text(_SEED_TRANSACTIONS), {"start": start, "end": end, "users": users})
+            await connection.execute(text(_SEED_DECISIONS), {"start": start, "end": end})
+        print(f"Seeded {end}/{rows} rows", flush=True)
+    async with database.engine.begin() as connection:
+        await connection.execute(text("ANALYZE transactions"))
+        await connection.execute(text("ANALYZE fraud_decisions"))
+
+
+async def measure(database: Database, users: int, iterations: int, page_size: int) -> dict[str, dict[str, float]]:
+    timings: dict[str, list[float]] = {"first_page": [], "deep_page": [], "full_history": []}
+    for i in range(iterations):
+        user_id = UserId.create(f"user_{(i * 7919) % users}")
+        async with database._session_factory() as session:
+            repository = FraudDecisionRepository(session)
+
+            started = time.perf_counter()
+            _, cursor = await repository.find_page_by_user_id(user_id, page_size)
+            timings["first_page"].append(time.perf_counter() - started)
+
+            for _ in range(5):
+                if cursor is None:
+                    break
+                started = time.perf_counter()
+                _, cursor = await repository.find_page_by_user_id(user_id, page_size, cursor)
+            timings["deep_page"].append(time.perf_counter() - started)
+
+            started = time.perf_counter()
+            await repository.find_by_user_id(user_id)
+            timings["full_history"].append(time.perf_counter() - started)
+    return {name: _summary(values) for name, values in timings.items()}
+
+
+def _summary(values: list[float]) -> dict[str, float]:
+    ordered = sorted(values)
+    return {
+        "p50_ms": statistics.median(ordered) * 1000,
+        "p95_ms": ordered[int(len(ordered) * 0.95) - 1] * 1000,
+        "p99_ms": ordered[max(int(len(ordered) * 0.99) - 1, 0)] * 1000,
+        "mean_ms": statistics.fmean(ordered) * 1000,
+    }
+
+
+async def run(args: argparse.Namespace) -> None:
+    database = Database(args.database_url)
+    try:
+        if not args.skip_seed:
+            await seed(database, args.rows, args.users, args.chunk_size)
+        results = await measure(database, args.users, args.iterations, args.page_size)
+        print(json.dumps({"rows": args.rows, "users": args.users, "page_size": args.page_size, "results": results}, indent=2))
+    finally:
+        await database.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="History query latency against a local PostgreSQL database")
+    parser.add_argument("--database-url", required=True)
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--users", type=int, default=100_000)
+    parser.add_argument("--chunk-size", type=int, default=500_000)
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--skip-seed", action="store_true")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
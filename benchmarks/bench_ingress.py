@@ -0,0 +1,226 @@
+import argparse
+import asyncio
+import json
+from datetime import datetime
+from typing import Any
+from uuid import uuid4
+
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from app.adapters.inbound.http import fast_codec
+from app.adapters.inbound.http.fast_codec import (
+    JSON_MEDIA_TYPE,
+    MSGPACK_MEDIA_TYPE,
+    decision_payload,
+    decode_body,
+    encode_body,
+    parse_assessment_batch_request,
+    parse_assessment_request,
+)
+from app.adapters.inbound.http.models.fraud_assessment_batch_request import FraudAssessmentBatchRequest
+from app.adapters.inbound.http.models.fraud_assessment_batch_response import FraudAssessmentBatchResponse
+from app.adapters.inbound.http.models.fraud_assessment_request import FraudAssessmentRequest
+from app.adapters.inbound.http.models.fraud_assessment_response import FraudAssessmentResponse
+from app.domain.entities.fraud_decision import FraudDecision
+from app.domain.value_objects.merchant_id import MerchantId
+from app.domain.value_objects.transaction_amount import TransactionAmount
+from app.domain.value_objects.transaction_id import TransactionId
+from app.domain.value_objects.user_id import UserId
+from benchmarks.fixtures import request_bodies
+from benchmarks.harness import bench, bench_async, report
+
+RESPONSE_FIELD = create_response_field(name="assess_fraud_response", type_=FraudAssessmentResponse)
+BATCH_RESPONSE_FIELD = create_response_field(name="assess_fraud_batch_response", type_=FraudAssessmentBatchResponse)
+
+
+def _value_objects(request: FraudAssessmentRequest) -> tuple[Any, ...]:
+    return (
+        TransactionId.create(uuid4()),
+        UserId.create(request.user_id),
+        MerchantId.create(request.merchant_id),
+        TransactionAmount.create(request.amount),
+    )
+
+
+def _pydantic_decode(body: bytes) -> tuple[Any, ...]:
+    return _value_objects(FraudAssessmentRequest.model_validate(json.loads(body)))
+
+
+def _fast_decode(body: bytes, content_type: str) -> tuple[Any, ...]:
+    return _value_objects(parse_assessment_request(decode_body(body, content_type)))
+
+
+def _pydantic_response(fraud_decision: FraudDecision) -> FraudAssessmentResponse:
+    return FraudAssessmentResponse(
+        transaction_id=str(fraud_decision.transaction_id.value),
+        risk_score=fraud_decision.risk_score,
+        decision=fraud_decision.decision.value,
+        timestamp=fraud_decision.timestamp,
+        model_version=fraud_decision.model_version,
+        matched_rules=list(fraud_decision.matched_rules),
+    )
+
+
+async def _pydantic_encode(fraud_decision: FraudDecision) -> bytes:
+    content = await serialize_response(field=RESPONSE_FIELD, response_content=_pydantic_response(fraud_decision))
+    return JSONResponse(content).body
+
+
+async def _pydantic_encode_batch(fraud_decisions: list[FraudDecision]) -> bytes:
+    response = FraudAssessmentBatchResponse(results=[_pydantic_response(d) for d in fraud_decisions])
+    content = await serialize_response(field=BATCH_RESPONSE_FIELD, response_content=response)
+    return JSONResponse(content).body
+
+
+def _app(fraud_decision: FraudDecision) -> FastAPI:
+    app = FastAPI()
+
+    @app.post("/pydantic", response_model=FraudAssessmentResponse, status_code=201)
+    async def pydantic_route(request: FraudAssessmentRequest) -> FraudAssessmentResponse:
+        _value_objects(request)
+        return _pydantic_response(fraud_decision)
+
+    @app.post("/fast", response_model=FraudAssessmentResponse, status_code=201)
+    async def fast_route(http_request: Request) -> Response:
+        body = decode_body(await http_request.body(), http_request.headers.get("content-type"))
+        _value_objects(parse_assessment_request(body))
+        return encode_body(decision_payload(fraud_decision), http_request.headers.get("accept"), 201)
+
+    return app
+
+
+async def _call(app: FastAPI, path: str, body: bytes, media_type: str) -> None:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [
+            (b"content-type", media_type.encode()),
+            (b"accept", media_type.encode()),
+            (b"content-length", str(len(body)).encode()),
+        ],
+        "client": ("127.0.0.1", 50000),
+        "server": ("bench", 80),
+    }
+
+    async def receive() -> dict[str, Any]:
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message: dict[str, Any]) -> None:
+        if message["type"] == "http.response.start" and message["status"] != 201:
+            raise RuntimeError(f"{path} answered {message['status']}")
+
+    await app(scope, receive, send)
+
+
+def _saving(results: dict[str, Any], baseline: tuple[str, ...], fast: tuple[str, ...]) -> dict[str, float]:
+    baseline_us = sum(results[name]["mean_us"] for name in baseline)
+    fast_us = sum(results[name]["mean_us"] for name in fast)
+    return {
+        "baseline_mean_us": baseline_us,
+        "fast_mean_us": fast_us,
+        "saved_us": baseline_us - fast_us,
+        "speedup": baseline_us / fast_us if fast_us else 0.0,
+    }
+
+
+async def run(iterations: int, batch_size: int) -> dict[str, Any]:
+    bodies = request_bodies(iterations)
+    json_bodies = [json.dumps(body).encode() for body in bodies]
+    msgpack_bodies = [fast_codec.msgpack.packb(body) for body in bodies] if fast_codec.msgpack is not None else []
+    fraud_decisions = [
+        FraudDecision.create(
+            transaction_id=TransactionId.create(uuid4()),
+            risk_score=0.42,
+            timestamp=datetime(2024, 1, 15, 0, 0, 1),
+            model_version="v3",
+            matched_rules=("high_amount",),
+        )
+        for _ in range(batch_size)
+    ]
+    fraud_decision = fraud_decisions[0]
+    batch_json = json.dumps({"transactions": bodies[:batch_size]}).encode()
+
+    results: dict[str, Any] = {
+        "codecs": {"orjson": fast_codec.orjson is not None, "msgpack": fast_codec.msgpack is not None},
+    }
+    rows = iter(json_bodies * 2)
+    results["decode_pydantic"] = bench(lambda: _pydantic_decode(next(rows)), iterations)
+    rows = iter(json_bodies * 2)
+    results["decode_fast_json"] = bench(lambda: _fast_decode(next(rows), JSON_MEDIA_TYPE), iterations)
+    results["encode_pydantic"] = await bench_async(lambda: _pydantic_encode(fraud_decision), iterations)
+    results["encode_fast_json"] = bench(
+        lambda: encode_body(decision_payload(fraud_decision), JSON_MEDIA_TYPE).body, iterations
+    )
+    results["decode_batch_pydantic"] = bench(
+        lambda: FraudAssessmentBatchRequest.model_validate(json.loads(batch_json)), max(iterations // batch_size, 20)
+    )
+    results["decode_batch_fast_json"] = bench(
+        lambda: parse_assessment_batch_request(decode_body(batch_json, JSON_MEDIA_TYPE)),
+        max(iterations // batch_size, 20),
+    )
+    results["encode_batch_pydantic"] = await bench_async(
+        lambda: _pydantic_encode_batch(fraud_decisions), max(iterations // batch_size, 20)
+    )
+    results["encode_batch_fast_json"] = bench(
+        lambda: encode_body({"results": [decision_payload(d) for d in fraud_decisions]}, JSON_MEDIA_TYPE).body,
+        max(iterations // batch_size, 20),
+    )
+    app = _app(fraud_decision)
+    rows = iter(json_bodies * 2)
+    results["asgi_request_pydantic"] = await bench_async(
+        lambda: _call(app, "/pydantic", next(rows), JSON_MEDIA_TYPE), iterations
+    )
+    rows = iter(json_bodies * 2)
+    results["asgi_request_fast_json"] = await bench_async(
+        lambda: _call(app, "/fast", next(rows), JSON_MEDIA_TYPE), iterations
+    )
+    savings = {
+        "asgi_request_json": _saving(results, ("asgi_request_pydantic",), ("asgi_request_fast_json",)),
+        "request_json": _saving(
+            results, ("decode_pydantic", "encode_pydantic"), ("decode_fast_json", "encode_fast_json")
+        ),
+        "batch_json": _saving(
+            results,
+            ("decode_batch_pydantic", "encode_batch_pydantic"),
+            ("decode_batch_fast_json", "encode_batch_fast_json"),
+        ),
+    }
+    if msgpack_bodies:
+        rows = iter(msgpack_bodies * 2)
+        results["decode_fast_msgpack"] = bench(lambda: _fast_decode(next(rows), MSGPACK_MEDIA_TYPE), iterations)
+        results["encode_fast_msgpack"] = bench(
+            lambda: encode_body(decision_payload(fraud_decision), MSGPACK_MEDIA_TYPE).body, iterations
+        )
+        rows = iter(msgpack_bodies * 2)
+        results["asgi_request_fast_msgpack"] = await bench_async(
+            lambda: _call(app, "/fast", next(rows), MSGPACK_MEDIA_TYPE), iterations
+        )
+        savings["asgi_request_msgpack"] = _saving(results, ("asgi_request_pydantic",), ("asgi_request_fast_msgpack",))
+        savings["request_msgpack"] = _saving(
+            results, ("decode_pydantic", "encode_pydantic"), ("decode_fast_msgpack", "encode_fast_msgpack")
+        )
+    results["per_request_savings"] = savings
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Request decoding and response serialization microbenchmarks")
+    parser.add_argument("--iterations", type=int, default=20000)
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument("--output", default=None, help="Write JSON here; 'auto' uses benchmarks/results/<suite>-<commit>.json")
+    args = parser.parse_args()
+    report("ingress", asyncio.run(run(args.iterations, args.batch_size)), args.output)
+
+
+if __name__ == "__main__":
+    main()
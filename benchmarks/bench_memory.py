@@ -0,0 +1,149 @@
+import argparse
+import gc
+import random
+import tracemalloc
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from typing import Any, TypedDict
+from uuid import UUID
+
+from app.adapters.inbound.http.fast_codec import encode_ndjson, history_payloads
+from app.domain.entities.fraud_decision import Decision, FraudDecision
+from app.domain.entities.fraud_decision_batch import FraudDecisionBatch
+from app.domain.value_objects.transaction_id import TransactionId
+from app.domain.value_objects.user_id import UserId
+from benchmarks.fixtures import BASE_TIME, SEED, transactions
+from benchmarks.harness import bench, report
+
+HistoryRow = tuple[str, float, str, datetime, str | None, list[str] | None]
+
+
+class AllocationSummary(TypedDict):
+    rows: int
+    bytes_per_row: float
+    blocks_per_row: float
+    total_mib: float
+
+
+def measure(build: Callable[[], Any], rows: int) -> AllocationSummary:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    retained = build()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    stats = after.compare_to(before, "filename")
+    size = sum(stat.size_diff for stat in stats)
+    blocks = sum(stat.count_diff for stat in stats)
+    del retained
+    return AllocationSummary(
+        rows=rows,
+        bytes_per_row=size / rows,
+        blocks_per_row=blocks / rows,
+        total_mib=size / 2**20,
+    )
+
+
+def history_rows(n: int, seed: int = SEED) -> list[HistoryRow]:
+    rng = random.Random(seed)
+    decisions = [decision.value for decision in Decision]
+    return [
+        (
+            str(UUID(int=rng.getrandbits(128), version=4)),
+            rng.random(),
+            rng.choice(decisions),
+            BASE_TIME + timedelta(seconds=i * 7, microseconds=rng.randrange(1_000_000)),
+            "model.pkl@1",
+            ["high_amount"] if rng.random() < 0.1 else None,
+        )
+        for i in range(n)
+    ]
+
+
+def decisions_from_rows(rows: list[HistoryRow]) -> list[FraudDecision]:
+    return [
+        FraudDecision(
+            transaction_id=TransactionId.create(transaction_id),
+            risk_score=risk_score,
+            decision=Decision(decision),
+            timestamp=timestamp,
+            model_version=model_version,
+            matched_rules=tuple(matched_rules or ()),
+        )
+        for transaction_id, risk_score, decision, timestamp, model_version, matched_rules in rows
+    ]
+
+
+def batch_from_rows(rows: list[HistoryRow]) -> FraudDecisionBatch:
+    batch = FraudDecisionBatch()
+    for row in rows:
+        batch.append(*row)
+    return batch
+
+
+def user_ids(n: int, users: int, intern: bool) -> list[UserId]:
+    rng = random.Random(SEED)
+    raw = [f"user_{rng.randrange(users)}" for _ in range(n)]
+    if intern:
+        return [UserId.create(value) for value in raw]
+    return [UserId(value=value.strip()) for value in raw]
+
+
+def _page_payloads(fraud_decisions: list[FraudDecision]) -> list[dict[str, Any]]:
+    return [
+        {
+            "transaction_id": str(fraud_decision.transaction_id.value),
+            "risk_score": fraud_decision.risk_score,
+            "decision": fraud_decision.decision.value,
+            "timestamp": fraud_decision.timestamp,
+            "model_version": fraud_decision.model_version,
+            "matched_rules": list(fraud_decision.matched_rules),
+        }
+        for fraud_decision in fraud_decisions
+    ]
+
+
+def run(rows: int, users: int, page_size: int, iterations: int) -> dict[str, Any]:
+    raw = history_rows(rows)
+    page = raw[:page_size]
+    page_objects = decisions_from_rows(page)
+    page_batch = batch_from_rows(page)
+    batch = batch_from_rows(raw)
+    results: dict[str, Any] = {
+        "transactions": measure(lambda: transactions(rows), rows),
+        "fraud_decision_list": measure(lambda: decisions_from_rows(raw), rows),
+        "fraud_decision_batch": measure(lambda: batch_from_rows(raw), rows),
+        "fraud_decision_batch_nbytes_per_row": batch.nbytes() / rows,
+        "user_ids_copied": measure(lambda: user_ids(rows, users, intern=False), rows),
+        "user_ids_interned": measure(lambda: user_ids(rows, users, intern=True), rows),
+        "build_page_objects": bench(lambda: decisions_from_rows(page), iterations),
+        "build_page_batch": bench(lambda: batch_from_rows(page), iterations),
+        "encode_page_objects": bench(lambda: encode_ndjson(_page_payloads(page_objects)), iterations),
+        "encode_page_batch": bench(lambda: encode_ndjson(history_payloads(page_batch)), iterations),
+        "history_page_objects": bench(lambda: encode_ndjson(_page_payloads(decisions_from_rows(page))), iterations),
+        "history_page_batch": bench(lambda: encode_ndjson(history_payloads(batch_from_rows(page))), iterations),
+        "decision_counts_objects": bench(
+            lambda: {decision: sum(d.decision is decision for d in page_objects) for decision in Decision},
+            iterations,
+        ),
+        "decision_counts_batch": bench(page_batch.decision_counts, iterations),
+    }
+    results["fraud_decision_memory_ratio"] = (
+        results["fraud_decision_list"]["bytes_per_row"] / results["fraud_decision_batch"]["bytes_per_row"]
+    )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Domain object memory footprint and allocation microbenchmarks")
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--page-size", type=int, default=1000)
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--output", default=None, help="Write JSON here; 'auto' uses benchmarks/results/<suite>-<commit>.json")
+    args = parser.parse_args()
+    report("memory", run(args.rows, args.users, args.page_size, args.iterations), args.output)
+
+
+if __name__ == "__main__":
+    main()
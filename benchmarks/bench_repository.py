@@ -0,0 +1,105 @@
+import argparse
+import asyncio
+import tempfile
+from datetime import datetime
+from itertools import cycle
+from pathlib import Path
+from typing import Any
+
+from app.adapters.outbound.persistence.database import Base, Database
+from app.adapters.outbound.persistence.models import FraudDecisionModel, TransactionModel
+from app.adapters.outbound.persistence.repositories.fraud_decision_repository import (
+    FraudDecisionRepository,
+)
+from app.adapters.outbound.persistence.repositories.transaction_repository import (
+    TransactionRepository,
+)
+from app.adapters.outbound.persistence.unit_of_work import SqlAlchemyUnitOfWork
+from app.domain.entities.fraud_decision import FraudDecision
+from benchmarks.fixtures import transactions
+from benchmarks.harness import bench_async, report
+
+_TABLES = [TransactionModel.__table__, FraudDecisionModel.__table__]
+
+
+async def run(args: argparse.Namespace) -> dict[str, Any]:
+    with tempfile.TemporaryDirectory() as directory:
+        database_url = args.database_url or f"sqlite+aiosqlite:///{Path(directory) / 'bench.sqlite'}"
+        database = Database(database_url)
+        try:
+            async with database.engine.begin() as connection:
+                await connection.run_sync(Base.metadata.drop_all, tables=_TABLES)
+                await connection.run_sync(Base.metadata.create_all, tables=_TABLES)
+            return {"database": database.engine.url.get_backend_name(), **await _measure(database, args)}
+        finally:
+            await database.close()
+
+
+async def _measure(database: Database, args: argparse.Namespace) -> dict[str, Any]:
+    batch = 100
+    single_count = args.iterations + 50
+    batch_count = args.iterations // 10 + 5
+    sample = transactions(single_count + batch_count * batch)
+    decided_at = datetime(2024, 1, 15, 12, 0, 0)
+    single = iter(sample[:single_count])
+    batches = iter([sample[i : i + batch] for i in range(single_count, len(sample), batch)])
+
+    async def save_one() -> None:
+        transaction = next(single)
+        async with database._session_factory() as session:
+            unit_of_work = SqlAlchemyUnitOfWork(session)
+            unit_of_work.add_transaction(transaction)
+            unit_of_work.add_fraud_decision(
+                FraudDecision.create(transaction.transaction_id, 0.42, decided_at)
+            )
+            await unit_of_work.commit()
+
+    async def save_batch() -> None:
+        chunk = next(batches)
+        async with database._session_factory() as session:
+            unit_of_work = SqlAlchemyUnitOfWork(session)
+            unit_of_work.add_transactions(chunk)
+            unit_of_work.add_fraud_decisions(
+                [FraudDecision.create(t.transaction_id, 0.42, decided_at) for t in chunk]
+            )
+            await unit_of_work.commit()
+
+    results: dict[str, Any] = {
+        "save_transaction_and_decision": await bench_async(save_one, args.iterations),
+        f"save_batch_{batch}": await bench_async(save_batch, args.iterations // 10, warmup=5),
+    }
+
+    saved = sample[: args.iterations]
+    lookups = cycle(saved)
+    async with database._session_factory() as session:
+        transaction_repository = TransactionRepository(session)
+        fraud_decision_repository = FraudDecisionRepository(session)
+        results["find_transaction_by_id"] = await bench_async(
+            lambda: transaction_repository.find_by_id(next(lookups).transaction_id), args.iterations
+        )
+        results["find_decision_by_transaction_id"] = await bench_async(
+            lambda: fraud_decision_repository.find_by_transaction_id(next(lookups).transaction_id),
+            args.iterations,
+        )
+        results["find_history_page"] = await bench_async(
+            lambda: fraud_decision_repository.find_page_by_user_id(next(lookups).user_id, 100),
+            args.iterations,
+        )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Repository save/find microbenchmarks")
+    parser.add_argument(
+        "--database-url",
+        default=None,
+        help="Benchmark database (tables are dropped and recreated); defaults to a temporary SQLite file",
+    )
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--output", default=None, help="Write JSON here; 'auto' uses benchmarks/results/<suite>-<commit>.json")
+    args = parser.parse_args()
+    report("repository", asyncio.run(run(args)), args.output)
+
+
+if __name__ == "__main__":
+    main()
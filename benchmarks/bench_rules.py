@@ -0,0 +1,92 @@
+import argparse
+import random
+from typing import Any
+
+from app.domain.services.rule_engine import DEFAULT_RULE_ENGINE, RuleEngine, RuleSet
+from benchmarks.fixtures import SEED, transactions
+from benchmarks.harness import bench, report
+
+
+def rule_set(n_rules: int, seed: int = SEED) -> RuleSet:
+    rng = random.Random(seed)
+    rules: list[dict[str, Any]] = []
+    for index in range(n_rules):
+        kind = index % 4
+        if kind == 0:
+            rules.append(
+                {
+                    "id": f"merchant_limit_{index}",
+                    "when": [
+                        {"field": "merchant_id", "op": "eq", "value": f"merchant_{rng.randrange(200)}"},
+                        {"field": "amount", "op": "gt", "value": round(rng.uniform(500, 9000), 2)},
+                    ],
+                    "adjust": 0.15,
+                }
+            )
+        elif kind == 1:
+            rules.append(
+                {
+                    "id": f"user_blocklist_{index}",
+                    "when": [
+                        {
+                            "field": "user_id",
+                            "op": "in",
+                            "value": [f"user_{rng.randrange(100000)}" for _ in range(20)],
+                        }
+                    ],
+                    "decision": "block",
+                }
+            )
+        elif kind == 2:
+            rules.append(
+                {
+                    "id": f"ip_watchlist_{index}",
+                    "when": [
+                        {
+                            "field": "metadata.ip_address",
+                            "op": "in",
+                            "value": [f"10.0.{rng.randrange(256)}.{rng.randrange(256)}" for _ in range(10)],
+                        },
+                        {"field": "hour", "op": "gte", "value": rng.randrange(24)},
+                    ],
+                    "adjust": 0.2,
+                }
+            )
+        else:
+            rules.append(
+                {
+                    "id": f"amount_band_{index}",
+                    "when": [{"field": "amount", "op": "gt", "value": round(rng.uniform(9000, 50000), 2)}],
+                    "adjust": 0.01,
+                }
+            )
+    return RuleSet.from_dict({"version": f"bench-{n_rules}", "rules": rules})
+
+
+def run(iterations: int, sizes: list[int]) -> dict[str, Any]:
+    sample = transactions(iterations)
+    results: dict[str, Any] = {}
+    rows = iter(sample * 2)
+    results["assess_default_rules"] = bench(lambda: DEFAULT_RULE_ENGINE.assess(next(rows), 0.42), iterations)
+    for size in sizes:
+        rules = rule_set(size)
+        results[f"compile_{size}_rules"] = bench(lambda rules=rules: RuleEngine(rules), 20, warmup=2)
+        engine = RuleEngine(rules)
+        rows = iter(sample * 2)
+        summary = bench(lambda engine=engine: engine.assess(next(rows), 0.42), iterations)
+        matched = sum(len(engine.assess(transaction, 0.42).matched_rules) for transaction in sample)
+        results[f"assess_{size}_rules"] = {**summary, "mean_matched_rules": matched / len(sample)}
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Risk rule engine compilation and evaluation microbenchmarks")
+    parser.add_argument("--iterations", type=int, default=20000)
+    parser.add_argument("--rules", type=int, nargs="+", default=[10, 100, 1000, 5000])
+    parser.add_argument("--output", default=None, help="Write JSON here; 'auto' uses benchmarks/results/<suite>-<commit>.json")
+    args = parser.parse_args()
+    report("rules", run(args.iterations, args.rules), args.output)
+
+
+if __name__ == "__main__":
+    main()
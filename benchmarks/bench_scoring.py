@@ -0,0 +1,99 @@
+import argparse
+import asyncio
+from typing import Any
+
+from app.adapters.outbound.ml.feature_pipeline import DEFAULT_FEATURE_PIPELINE
+from app.adapters.outbound.ml.fraud_scoring_service import FraudScoringService
+from app.adapters.outbound.ml.inference_executor import InferenceExecutor, create_inference_executor
+from benchmarks.fixtures import load_model, transactions
+from benchmarks.harness import bench, bench_async, report, summarize
+
+
+async def run(args: argparse.Namespace) -> dict[str, Any]:
+    model = load_model(args.model_path, compiled=not args.uncompiled)
+    sample = transactions(args.iterations)
+    results: dict[str, Any] = {"model": type(model).__name__, "executor": args.executor, "workers": args.workers}
+
+    service = FraudScoringService(model, executor=await _executor(args, model))
+    rows = iter(sample * 2)
+    results["extract_features"] = bench(lambda: service._extract_features(next(rows)), args.iterations)
+
+    rows = iter(sample * 2)
+    results["score_transaction"] = await bench_async(
+        lambda: service.score_transaction(next(rows)), args.iterations
+    )
+
+    batched = FraudScoringService(
+        model,
+        max_batch_size=args.batch_size,
+        max_wait_us=args.max_wait_us,
+        executor=await _executor(args, model),
+    )
+    results["score_transaction_concurrent"] = await _concurrent(batched, sample, args.concurrency)
+    await batched.close()
+
+    for size in (32, 256, 1024):
+        chunk = sample[:size]
+        summary = await bench_async(
+            lambda chunk=chunk: service.score_transactions(chunk),
+            max(args.iterations // size, 20),
+            warmup=5,
+        )
+        results[f"score_transactions_{size}"] = {**summary, "rows_per_second": summary["ops_per_second"] * size}
+    await service.close()
+    return results
+
+
+async def _executor(args: argparse.Namespace, model: Any) -> InferenceExecutor:
+    executor = create_inference_executor(
+        args.executor,
+        workers=args.workers,
+        model=model,
+        n_features=len(DEFAULT_FEATURE_PIPELINE.feature_names),
+        max_pending=1_000_000,
+        sla_ms=0.0,
+        slot_rows=1024,
+    )
+    await executor.start()
+    return executor
+
+
+async def _concurrent(service: FraudScoringService, sample: list, concurrency: int) -> dict[str, Any]:
+    loop = asyncio.get_running_loop()
+    samples: list[float] = []
+    queue = iter(sample)
+
+    async def worker() -> None:
+        for transaction in queue:
+            started = loop.time()
+            await service.score_transaction(transaction)
+            samples.append(loop.time() - started)
+
+    started = loop.time()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    summary = summarize(samples, wall_seconds=loop.time() - started)
+    return {
+        **summary,
+        "concurrency": concurrency,
+        "batching": service.batching_stats(),
+        "inference": service.inference_stats(),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Feature extraction and model scoring microbenchmarks")
+    parser.add_argument("--model-path", default=None, help="Pickled model; defaults to a model trained on sample data")
+    parser.add_argument("--uncompiled", action="store_true", help="Score with the library model instead of the compiled ensemble")
+    parser.add_argument("--iterations", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--max-wait-us", type=int, default=500)
+    parser.add_argument("--executor", choices=("thread", "process"), default="thread")
+    parser.add_argument("--workers", type=int, default=4, help="Inference executor threads or processes")
+    parser.add_argument("--output", default=None, help="Write JSON here; 'auto' uses benchmarks/results/<suite>-<commit>.json")
+    args = parser.parse_args()
+    report("scoring", asyncio.run(run(args)), args.output)
+
+
+if __name__ == "__main__":
+    main()
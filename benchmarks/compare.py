@@ -0,0 +1,64 @@
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any
+
+_LATENCY_KEYS = ("p50_us", "p95_us", "p99_us")
+
+
+def flatten(results: dict[str, Any], prefix: str = "") -> dict[str, dict[str, float]]:
+    flat: dict[str, dict[str, float]] = {}
+    for name, value in results.items():
+        if not isinstance(value, dict):
+            continue
+        key = f"{prefix}{name}"
+        if "p50_us" in value:
+            flat[key] = value
+        else:
+            flat.update(flatten(value, f"{key}."))
+    return flat
+
+
+def compare(base: dict[str, Any], head: dict[str, Any], threshold: float) -> tuple[list[str], int]:
+    base_metrics = flatten(base["results"])
+    head_metrics = flatten(head["results"])
+    lines = [
+        f"{'benchmark':<48} {'metric':<16} {'base':>12} {'head':>12} {'change':>8}",
+    ]
+    regressions = 0
+    for name in sorted(base_metrics.keys() & head_metrics.keys()):
+        for metric in ("ops_per_second",) + _LATENCY_KEYS:
+            before = base_metrics[name].get(metric)
+            after = head_metrics[name].get(metric)
+            if not before or after is None:
+                continue
+            change = (after - before) / before
+            worse = change < -threshold if metric == "ops_per_second" else change > threshold
+            regressions += worse
+            marker = " !" if worse else ""
+            lines.append(f"{name:<48} {metric:<16} {before:>12.1f} {after:>12.1f} {change:>+8.1%}{marker}")
+    return lines, regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare two benchmark JSON reports")
+    parser.add_argument("base", type=Path)
+    parser.add_argument("head", type=Path)
+    parser.add_argument("--threshold", type=float, default=0.10, help="Relative change reported as a regression")
+    parser.add_argument("--fail-on-regression", action="store_true")
+    args = parser.parse_args()
+    base = json.loads(args.base.read_text())
+    head = json.loads(args.head.read_text())
+    if base["suite"] != head["suite"]:
+        parser.error(f"Cannot compare suite {base['suite']!r} with {head['suite']!r}")
+    print(f"base {base['environment']['git_commit']}  head {head['environment']['git_commit']}")
+    lines, regressions = compare(base, head, args.threshold)
+    print("\n".join(lines))
+    print(f"{regressions} regression(s) beyond {args.threshold:.0%}")
+    if args.fail_on_regression and regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
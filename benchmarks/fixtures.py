@@ -0,0 +1,63 @@
+import random
+from datetime import datetime, timedelta
+from typing import Any
+from uuid import UUID
+
+from app.adapters.outbound.logging.logger import StructuredLogger
+from app.adapters.outbound.ml.model_loader import ModelLoader
+from app.domain.entities.transaction import Transaction
+from app.domain.value_objects.merchant_id import MerchantId
+from app.domain.value_objects.transaction_amount import TransactionAmount
+from app.domain.value_objects.transaction_id import TransactionId
+from app.domain.value_objects.user_id import UserId
+from scripts.train_model import load_sample_data, train_xgboost_model
+
+SEED = 42
+BASE_TIME = datetime(2024, 1, 15, 0, 0, 0)
+
+
+def load_model(model_path: str | None, compiled: bool) -> Any:
+    if model_path is not None:
+        model = ModelLoader.load_model(model_path)
+    else:
+        X, y = load_sample_data()
+        model = train_xgboost_model(X, y)
+    if compiled:
+        model = ModelLoader.compile_model(model, StructuredLogger("benchmarks"))
+    return model
+
+
+def request_bodies(n: int, users: int = 1000, merchants: int = 200, seed: int = SEED) -> list[dict[str, Any]]:
+    rng = random.Random(seed)
+    bodies = []
+    for i in range(n):
+        metadata = {}
+        if rng.random() < 0.8:
+            metadata["ip_address"] = f"10.0.{rng.randrange(256)}.{rng.randrange(256)}"
+        if rng.random() < 0.6:
+            metadata["device_id"] = f"device_{rng.randrange(10000)}"
+        bodies.append(
+            {
+                "user_id": f"user_{rng.randrange(users)}",
+                "merchant_id": f"merchant_{rng.randrange(merchants)}",
+                "amount": round(rng.uniform(1, 10000), 2),
+                "timestamp": (BASE_TIME + timedelta(seconds=i * 7)).isoformat(),
+                "metadata": metadata,
+            }
+        )
+    return bodies
+
+
+def transactions(n: int, seed: int = SEED) -> list[Transaction]:
+    rng = random.Random(seed)
+    return [
+        Transaction(
+            transaction_id=TransactionId.create(UUID(int=rng.getrandbits(128), version=4)),
+            user_id=UserId.create(body["user_id"]),
+            merchant_id=MerchantId.create(body["merchant_id"]),
+            amount=TransactionAmount.create(body["amount"]),
+            timestamp=datetime.fromisoformat(body["timestamp"]),
+            metadata=body["metadata"],
+        )
+        for body in request_bodies(n, seed=seed)
+    ]
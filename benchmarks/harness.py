@@ -0,0 +1,104 @@
+import json
+import os
+import platform
+import statistics
+import subprocess
+import time
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, TypedDict
+
+RESULTS_DIR = Path(__file__).parent / "results"
+
+
+class LatencySummary(TypedDict):
+    iterations: int
+    ops_per_second: float
+    mean_us: float
+    p50_us: float
+    p95_us: float
+    p99_us: float
+
+
+def summarize(samples_seconds: list[float], wall_seconds: float | None = None, operations: int | None = None) -> LatencySummary:
+    ordered = sorted(samples_seconds)
+    total = wall_seconds if wall_seconds is not None else sum(ordered)
+    count = operations if operations is not None else len(ordered)
+    return LatencySummary(
+        iterations=len(ordered),
+        ops_per_second=count / total if total else 0.0,
+        mean_us=statistics.fmean(ordered) * 1e6,
+        p50_us=percentile(ordered, 0.50) * 1e6,
+        p95_us=percentile(ordered, 0.95) * 1e6,
+        p99_us=percentile(ordered, 0.99) * 1e6,
+    )
+
+
+def percentile(ordered: list[float], quantile: float) -> float:
+    if not ordered:
+        return 0.0
+    index = min(int(round(quantile * (len(ordered) - 1))), len(ordered) - 1)
+    return ordered[index]
+
+
+def bench(fn: Callable[[], Any], iterations: int, warmup: int = 100) -> LatencySummary:
+    for _ in range(warmup):
+        fn()
+    samples = []
+    clock = time.perf_counter
+    for _ in range(iterations):
+        started = clock()
+        fn()
+        samples.append(clock() - started)
+    return summarize(samples)
+
+
+async def bench_async(fn: Callable[[], Awaitable[Any]], iterations: int, warmup: int = 50) -> LatencySummary:
+    for _ in range(warmup):
+        await fn()
+    samples = []
+    clock = time.perf_counter
+    for _ in range(iterations):
+        started = clock()
+        await fn()
+        samples.append(clock() - started)
+    return summarize(samples)
+
+
+def environment() -> dict[str, Any]:
+    return {
+        "git_commit": _git("rev-parse", "HEAD"),
+        "git_dirty": bool(_git("status", "--porcelain")),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "recorded_at": datetime.now(timezone.utc).isoformat(),
+    }
+
+
+def report(suite: str, results: dict[str, Any], output: str | None) -> None:
+    document = {"suite": suite, "environment": environment(), "results": results}
+    text = json.dumps(document, indent=2, default=str)
+    print(text)
+    if output is None:
+        return
+    path = Path(output)
+    if output == "auto":
+        commit = (document["environment"]["git_commit"] or "unknown")[:12]
+        path = RESULTS_DIR / f"{suite}-{commit}.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text + "\n")
+
+
+def _git(*args: str) -> str | None:
+    try:
+        return subprocess.run(
+            ["git", *args],
+            cwd=Path(__file__).parent,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
@@ -0,0 +1,148 @@
+import argparse
+import asyncio
+import random
+import time
+from collections import defaultdict
+from typing import Any
+
+import httpx
+
+from benchmarks.fixtures import SEED, request_bodies
+from benchmarks.harness import report, summarize
+
+SCENARIOS = ("assess", "assess_batch", "decision", "history", "history_page")
+
+
+class LoadGenerator:
+    def __init__(self, client: httpx.AsyncClient, bodies: list[dict[str, Any]], batch_size: int, seed: int) -> None:
+        self._client = client
+        self._bodies = bodies
+        self._batch_size = batch_size
+        self._rng = random.Random(seed)
+        self._next_body = 0
+        self._transaction_ids: list[str] = []
+        self._user_ids = sorted({body["user_id"] for body in bodies})
+        self.samples: dict[str, list[float]] = defaultdict(list)
+        self.errors: dict[str, int] = defaultdict(int)
+
+    async def warm(self, requests: int) -> None:
+        for _ in range(requests):
+            await self._assess()
+
+    async def worker(self, mix: list[tuple[str, float]], deadline: float) -> None:
+        scenarios = [name for name, _ in mix]
+        weights = [weight for _, weight in mix]
+        while time.perf_counter() < deadline:
+            scenario = self._rng.choices(scenarios, weights)[0]
+            started = time.perf_counter()
+            try:
+                ok = await getattr(self, f"_{scenario}")()
+            except httpx.HTTPError:
+                ok = False
+            elapsed = time.perf_counter() - started
+            if ok:
+                self.samples[scenario].append(elapsed)
+            else:
+                self.errors[scenario] += 1
+
+    def _body(self) -> dict[str, Any]:
+        body = self._bodies[self._next_body % len(self._bodies)]
+        self._next_body += 1
+        return body
+
+    async def _assess(self) -> bool:
+        response = await self._client.post("/assess-fraud", json=self._body())
+        if response.status_code != 201:
+            return False
+        self._transaction_ids.append(response.json()["transaction_id"])
+        return True
+
+    async def _assess_batch(self) -> bool:
+        batch = [self._body() for _ in range(self._batch_size)]
+        response = await self._client.post("/assess-fraud/batch", json={"transactions": batch})
+        return response.status_code == 201
+
+    async def _decision(self) -> bool:
+        if not self._transaction_ids:
+            return await self._assess()
+        transaction_id = self._rng.choice(self._transaction_ids)
+        response = await self._client.get(f"/fraud-decisions/{transaction_id}")
+        return response.status_code == 200
+
+    async def _history(self) -> bool:
+        user_id = self._rng.choice(self._user_ids)
+        response = await self._client.get(f"/fraud-decisions/user/{user_id}", params={"limit": 100})
+        return response.status_code == 200
+
+    async def _history_page(self) -> bool:
+        user_id = self._rng.choice(self._user_ids)
+        response = await self._client.get(f"/fraud-decisions/user/{user_id}", params={"limit": 10})
+        if response.status_code != 200:
+            return False
+        cursor = response.json().get("next_cursor")
+        if cursor is None:
+            return True
+        response = await self._client.get(
+            f"/fraud-decisions/user/{user_id}", params={"limit": 10, "cursor": cursor}
+        )
+        return response.status_code == 200
+
+
+def parse_mix(value: str) -> list[tuple[str, float]]:
+    mix = []
+    for part in value.split(","):
+        name, _, weight = part.partition("=")
+        if name not in SCENARIOS:
+            raise argparse.ArgumentTypeError(f"Unknown scenario {name!r}; expected one of {', '.join(SCENARIOS)}")
+        mix.append((name, float(weight or 1)))
+    return mix
+
+
+async def run(args: argparse.Namespace) -> dict[str, Any]:
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=args.base_url, limits=limits, timeout=args.timeout) as client:
+        generator = LoadGenerator(client, request_bodies(args.bodies, users=args.users), args.batch_size, SEED)
+        await generator.warm(args.warmup)
+        started = time.perf_counter()
+        deadline = started + args.duration
+        await asyncio.gather(*(generator.worker(args.mix, deadline) for _ in range(args.concurrency)))
+        wall = time.perf_counter() - started
+    completed = sum(len(samples) for samples in generator.samples.values())
+    return {
+        "base_url": args.base_url,
+        "duration_seconds": wall,
+        "concurrency": args.concurrency,
+        "mix": dict(args.mix),
+        "requests": completed,
+        "requests_per_second": completed / wall,
+        "errors": dict(generator.errors),
+        "endpoints": {
+            name: summarize(samples, wall_seconds=wall)
+            for name, samples in sorted(generator.samples.items())
+        },
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Closed-loop HTTP load generator for a running API")
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds to generate load")
+    parser.add_argument("--concurrency", type=int, default=32, help="Concurrent in-flight requests")
+    parser.add_argument(
+        "--mix",
+        type=parse_mix,
+        default=parse_mix("assess=6,decision=2,history=1,history_page=1"),
+        help=f"Weighted scenarios, e.g. assess=6,history=1 (scenarios: {', '.join(SCENARIOS)})",
+    )
+    parser.add_argument("--batch-size", type=int, default=50, help="Transactions per assess_batch request")
+    parser.add_argument("--bodies", type=int, default=10000, help="Distinct request bodies to cycle through")
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--warmup", type=int, default=100, help="Sequential assess requests before measuring")
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--output", default=None, help="Write JSON here; 'auto' uses benchmarks/results/<suite>-<commit>.json")
+    args = parser.parse_args()
+    report("load", asyncio.run(run(args)), args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+import argparse
+import asyncio
+
+from app.adapters.outbound.config import Settings
+from app.adapters.outbound.logging.logger import StructuredLogger
+from app.adapters.outbound.persistence.database import Database
+from app.adapters.outbound.persistence.migrations.backfill import TypedColumnBackfill
+
+
+async def run(chunk_size: int, start_id: int, pause_seconds: float) -> None:
+    database = Database(Settings().database_url)
+    try:
+        backfill = TypedColumnBackfill(database.engine, StructuredLogger())
+        updated = await backfill.run(chunk_size=chunk_size, start_id=start_id, pause_seconds=pause_seconds)
+        print(f"Backfilled {updated} rows")
+    finally:
+        await database.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Copy legacy amount/metadata values into the typed columns added by migration 2"
+    )
+    parser.add_argument("--chunk-size", type=int, default=10000, help="Rows per transaction, by id range")
+    parser.add_argument("--start-id", type=int, default=0, help="Resume after this transactions.id")
+    parser.add_argument("--pause", type=float, default=0.0, help="Seconds to sleep between chunks")
+    args = parser.parse_args()
+    asyncio.run(run(args.chunk_size, args.start_id, args.pause))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+import argparse
+import asyncio
+import json
+import signal
+import sys
+from pathlib import Path
+from uuid import uuid4
+
+from app.adapters.inbound.stream.decision_sink import NdjsonDecisionSink
+from app.adapters.inbound.stream.ndjson_queue import FileBackedQueue, NdjsonFileQueue, StdinQueue
+from app.adapters.inbound.stream.stream_consumer import StreamConsumer
+from app.adapters.outbound.config import Settings
+from app.adapters.outbound.logging.logger import StructuredLogger
+from app.composition.dependency_registry import DependencyRegistry
+from app.domain.ports.transaction_queue_port import TransactionQueuePort
+
+
+def build_queue(args: argparse.Namespace) -> tuple[TransactionQueuePort, str]:
+    if args.queue_dir:
+        return FileBackedQueue(args.queue_dir), args.stream_name or str(Path(args.queue_dir).resolve())
+    if args.input == "-":
+        return StdinQueue(), args.stream_name or f"stdin-{uuid4().hex}"
+    checkpoint = args.checkpoint or f"{args.input}.offset"
+    queue = NdjsonFileQueue(args.input, checkpoint_path=checkpoint, follow=args.follow)
+    return queue, args.stream_name or str(Path(args.input).resolve())
+
+
+async def run(args: argparse.Namespace) -> None:
+    settings = Settings()
+    queue, stream_name = build_queue(args)
+    sink = NdjsonDecisionSink(args.output)
+    registry = DependencyRegistry(settings)
+    await registry.start()
+    consumer = StreamConsumer(
+        queue,
+        registry,
+        sink,
+        StructuredLogger("stream_consumer"),
+        stream_name=stream_name,
+        batch_size=args.batch_size or settings.stream_batch_size,
+        max_in_flight=args.max_in_flight or settings.stream_max_in_flight,
+        linger_ms=settings.stream_linger_ms,
+        max_retries=settings.stream_max_retries,
+    )
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, consumer.stop)
+    try:
+        stats = await consumer.run()
+    finally:
+        await queue.close()
+        sink.close()
+        await registry.close()
+    print(json.dumps(stats), file=sys.stderr)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Score NDJSON transactions from a file, stdin or a file-backed queue and write decisions as NDJSON"
+    )
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--input", help="NDJSON file of /assess-fraud bodies, or - for stdin")
+    source.add_argument("--queue-dir", help="Directory of a file-backed queue; consumes until interrupted")
+    parser.add_argument("--output", default="-", help="Decision NDJSON file, or - for stdout")
+    parser.add_argument("--checkpoint", default=None, help="Offset file for --input (default: <input>.offset)")
+    parser.add_argument("--follow", action="store_true", help="Keep reading --input as it grows")
+    parser.add_argument(
+        "--stream-name", default=None, help="Scope for offset-derived transaction ids (default: the input path)"
+    )
+    parser.add_argument("--batch-size", type=int, default=None, help="Records per assessment batch")
+    parser.add_argument("--max-in-flight", type=int, default=None, help="Batches scored concurrently")
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,24 @@
+import argparse
+from pathlib import Path
+
+from app.adapters.outbound.logging.logger import StructuredLogger
+from app.adapters.outbound.ml.model_loader import COMPILED_SUFFIX, ModelLoader
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Convert a pickled tree model into a memory-mappable compiled ensemble"
+    )
+    parser.add_argument("--model-path", default="app/adapters/outbound/ml/models/model.pkl")
+    parser.add_argument("--output", default=None, help=f"Defaults to the model path with a {COMPILED_SUFFIX} suffix")
+    args = parser.parse_args()
+
+    output = args.output or str(Path(args.model_path).with_suffix(COMPILED_SUFFIX))
+    model = ModelLoader.load_model(args.model_path)
+    compiled = ModelLoader.export_compiled(model, output, StructuredLogger())
+    print(f"Wrote {compiled.n_trees} trees ({compiled.nbytes} bytes of arrays) to {output}")
+    print(f"Serve it with MODEL_PATH={output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+import argparse
+import asyncio
+
+from app.adapters.outbound.config import Settings
+from app.adapters.outbound.logging.logger import StructuredLogger
+from app.adapters.outbound.persistence.database import Database
+from app.adapters.outbound.persistence.migrations.runner import MigrationRunner
+
+
+async def run(command: str, target: int | None) -> None:
+    database = Database(Settings().database_url)
+    runner = MigrationRunner(database.engine, StructuredLogger())
+    try:
+        if command == "status":
+            applied = await runner.applied_versions()
+            pending = await runner.pending()
+            print(f"Applied: {sorted(applied)}")
+            for migration in pending:
+                print(f"Pending: {migration.version} - {migration.description}")
+        else:
+            applied_now = await runner.upgrade(target)
+            for migration in applied_now:
+                print(f"Applied {migration.version} - {migration.description}")
+            if not applied_now:
+                print("Database schema is up to date")
+    finally:
+        await database.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Apply versioned database migrations")
+    parser.add_argument("command", choices=["upgrade", "status"], nargs="?", default="upgrade")
+    parser.add_argument("--target", type=int, default=None, help="Stop after this migration version")
+    args = parser.parse_args()
+    asyncio.run(run(args.command, args.target))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+import argparse
+import asyncio
+import json
+import os
+import sys
+from datetime import datetime
+from pathlib import Path
+
+from app.adapters.inbound.batch.rescore_job import RescoreJob
+from app.adapters.outbound.analytics.rescore_sinks import create_rescore_sink
+from app.adapters.outbound.config import Settings
+from app.adapters.outbound.feature_store.composite_feature_store import CompositeFeatureStore
+from app.adapters.outbound.feature_store.in_memory_feature_store import InMemoryFeatureStore
+from app.adapters.outbound.feature_store.velocity_index import VELOCITY_FEATURES, SlidingWindowIndex
+from app.adapters.outbound.logging.logger import StructuredLogger
+from app.adapters.outbound.ml.feature_pipeline import DEFAULT_FEATURE_PIPELINE, DEFAULT_FEATURES, FeaturePipeline
+from app.adapters.outbound.ml.fraud_scoring_service import FraudScoringService
+from app.adapters.outbound.ml.inference_executor import PROCESS, THREAD, create_inference_executor
+from app.adapters.outbound.ml.model_manager import ModelManager
+from app.adapters.outbound.ml.model_registry import ModelRegistry
+from app.adapters.outbound.persistence.database import Database
+from app.adapters.outbound.rules.rule_set_manager import RuleSetManager
+from app.application.use_cases.rescore_transactions_use_case import RescoreTransactionsUseCase
+
+
+async def run(args: argparse.Namespace) -> None:
+    settings = Settings()
+    logger = StructuredLogger("rescore")
+    registry = ModelRegistry(settings.model_registry_path) if settings.model_registry_path else None
+    feature_pipeline = DEFAULT_FEATURE_PIPELINE
+    feature_store: InMemoryFeatureStore | CompositeFeatureStore = InMemoryFeatureStore()
+    velocity_index = None
+    if settings.velocity_features_enabled:
+        velocity_index = SlidingWindowIndex(max_keys=settings.velocity_index_max_keys)
+        feature_pipeline = FeaturePipeline(DEFAULT_FEATURES + VELOCITY_FEATURES)
+        feature_store = CompositeFeatureStore([feature_store, velocity_index])
+    if args.model:
+        candidate = ModelManager.load_candidate(
+            args.model, feature_pipeline.feature_names, settings.model_compiled_inference, logger, registry
+        )
+        model, model_version = candidate.model, candidate.version
+    else:
+        model, model_version = ModelManager.load_initial(
+            settings.model_path, feature_pipeline.feature_names, settings.model_compiled_inference, logger, registry
+        )
+    run_id = args.resume or args.run_id or f"{model_version}-{datetime.utcnow():%Y%m%dT%H%M%S}"
+    checkpoint_path = args.checkpoint or str(Path(args.checkpoint_dir) / f"{run_id}.json")
+    workers = args.workers or os.cpu_count() or 1
+    rule_set_manager = RuleSetManager(logger, path=args.rules or settings.risk_rules_path)
+    scoring_service = FraudScoringService(
+        model,
+        feature_pipeline=feature_pipeline,
+        feature_store=feature_store,
+        model_version=model_version,
+        executor=create_inference_executor(
+            args.executor,
+            workers=workers,
+            model=model,
+            n_features=len(feature_pipeline.feature_names),
+            max_pending=max(settings.inference_max_pending, args.chunk_size * args.max_in_flight),
+            sla_ms=0.0,
+            slot_rows=max(1, -(-args.chunk_size // workers)),
+        ),
+    )
+    database = Database(settings.database_url)
+    sink = create_rescore_sink(args.output, database._session_factory)
+    job = RescoreJob(
+        database._session_factory,
+        RescoreTransactionsUseCase(scoring_service, rule_set_manager.engine),
+        sink,
+        logger,
+        run_id=run_id,
+        checkpoint_path=checkpoint_path,
+        chunk_size=args.chunk_size,
+        max_in_flight=args.max_in_flight,
+        start=args.start,
+        end=args.end,
+        velocity_index=velocity_index,
+        progress_interval_seconds=args.progress_interval,
+        exact_total=args.exact_total,
+    )
+    await scoring_service.start()
+    try:
+        stats = await job.run(resume=bool(args.resume))
+    finally:
+        await sink.close()
+        await scoring_service.close()
+        await database.close()
+    print(json.dumps({**stats, "checkpoint": checkpoint_path}), file=sys.stderr)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Rescore stored transactions with a model version and rule set, comparing against stored decisions"
+    )
+    parser.add_argument(
+        "--output", required=True, help="'table' for rescored_decisions, a .csv file or a .parquet directory"
+    )
+    parser.add_argument("--model", default=None, help="Registry version or model path (default: the served model)")
+    parser.add_argument("--rules", default=None, help="Rule set file (default: RISK_RULES_PATH or the built-in rules)")
+    parser.add_argument("--start", type=datetime.fromisoformat, default=None, help="Only transactions at or after")
+    parser.add_argument("--end", type=datetime.fromisoformat, default=None, help="Only transactions before")
+    parser.add_argument("--run-id", default=None, help="Run identifier (default: <model version>-<timestamp>)")
+    parser.add_argument("--resume", default=None, metavar="RUN_ID", help="Continue a run from its checkpoint")
+    parser.add_argument("--checkpoint", default=None, help="Checkpoint file (default: <checkpoint-dir>/<run id>.json)")
+    parser.add_argument("--checkpoint-dir", default="data/rescore", help="Directory for checkpoint files")
+    parser.add_argument("--chunk-size", type=int, default=10000, help="Transactions per chunk, by id range")
+    parser.add_argument("--max-in-flight", type=int, default=2, help="Chunks scored concurrently")
+    parser.add_argument("--executor", choices=[PROCESS, THREAD], default=PROCESS, help="Model inference executor")
+    parser.add_argument("--workers", type=int, default=None, help="Inference workers (default: CPU count)")
+    parser.add_argument("--progress-interval", type=float, default=10.0, help="Seconds between progress logs")
+    parser.add_argument(
+        "--exact-total",
+        action="store_true",
+        help="Count the rows in range for progress (default: estimate from the id range, no extra scan)",
+    )
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
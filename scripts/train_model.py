@@ -1,12 +1,64 @@
+import argparse
+import hashlib
+import json
+import os
 import pickle
+import shutil
+import time
+from collections.abc import Callable, Iterable
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from typing import Any
+from uuid import UUID
 
 import numpy as np
 from sklearn.ensemble import GradientBoostingClassifier
-from sklearn.model_selection import train_test_split
-from sklearn.metrics import classification_report, roc_auc_score
+from sklearn.model_selection import RandomizedSearchCV, StratifiedKFold, train_test_split
+from sklearn.metrics import (
+    average_precision_score,
+    classification_report,
+    f1_score,
+    precision_score,
+    recall_score,
+    roc_auc_score,
+)
 import xgboost as xgb
 
+from app.adapters.outbound.feature_store.velocity_index import VELOCITY_FEATURES, SlidingWindowIndex
+from app.adapters.outbound.logging.logger import StructuredLogger
+from app.adapters.outbound.ml.feature_pipeline import DEFAULT_FEATURE_PIPELINE, DEFAULT_FEATURES, FeaturePipeline
+from app.adapters.outbound.ml.model_loader import COMPILED_SUFFIX, ModelLoader
+from app.adapters.outbound.ml.model_registry import ModelRegistry
+from app.domain.entities.transaction import Transaction, TransactionMetadata
+from app.domain.value_objects.merchant_id import MerchantId
+from app.domain.value_objects.transaction_amount import TransactionAmount
+from app.domain.value_objects.transaction_id import TransactionId
+from app.domain.value_objects.user_id import UserId
+
+DEFAULT_MODEL_PATH = "app/adapters/outbound/ml/models/model.pkl"
+DEFAULT_REGISTRY_PATH = "app/adapters/outbound/ml/models/registry"
+DEFAULT_CACHE_DIR = "data/feature_cache"
+
+FEATURES_FILE = "features.npy"
+LABELS_FILE = "labels.npy"
+MANIFEST_FILE = "manifest.json"
+KAGGLE_COLUMNS = ["Time", "Amount", "Class"]
+TRANSACTION_COLUMNS = ["user_id", "merchant_id", "amount", "timestamp", "is_fraud"]
+METADATA_COLUMNS = ["ip_address", "device_id"]
+VELOCITY_FEATURE_PIPELINE = FeaturePipeline(DEFAULT_FEATURES + VELOCITY_FEATURES)
+VELOCITY_INDEX_KEYS = 200000
+
+N_ESTIMATORS = 100
+MAX_BIN = 256
+PARAM_DISTRIBUTIONS: dict[str, list[Any]] = {
+    "max_depth": [4, 6, 8],
+    "learning_rate": [0.05, 0.1, 0.2],
+    "min_child_weight": [1, 5, 10],
+    "subsample": [0.8, 1.0],
+    "colsample_bytree": [0.8, 1.0],
+}
+DEFAULT_PARAMS: dict[str, Any] = {"max_depth": 6, "learning_rate": 0.1}
+
 try:
     import kagglehub
 except ImportError:
@@ -23,7 +75,15 @@ def load_sample_data() -> tuple[np.ndarray, np.ndarray]:
     has_ip = np.random.choice([0, 1], n_samples)
     has_device = np.random.choice([0, 1], n_samples)
     
-    X = np.column_stack([amount, hour, day_of_week, has_ip, has_device])
+    X = DEFAULT_FEATURE_PIPELINE.transform_columns(
+        {
+            "amount": amount,
+            "hour": hour,
+            "day_of_week": day_of_week,
+            "metadata.ip_address": has_ip,
+            "metadata.device_id": has_device,
+        }
+    )
     
     fraud_prob = (
         (amount > 5000) * 0.3 +
@@ -36,56 +96,358 @@ def load_sample_data() -> tuple[np.ndarray, np.ndarray]:
     return X, y
 
 
-def load_kaggle_credit_card_data() -> tuple[np.ndarray, np.ndarray] | None:
+def load_sample_transactions(n_samples: int = 20000) -> tuple[np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(42)
+    start = datetime(2024, 1, 1)
+    offsets = np.sort(rng.uniform(0, 7 * 24 * 3600, n_samples))
+    users = rng.integers(0, 500, n_samples)
+    merchants = rng.integers(0, 100, n_samples)
+    amounts = rng.uniform(10, 10000, n_samples).round(2)
+    has_ip = rng.integers(0, 2, n_samples)
+    has_device = rng.integers(0, 2, n_samples)
+    transactions = [
+        _transaction(
+            index,
+            f"user_{users[index]}",
+            f"merchant_{merchants[index]}",
+            float(amounts[index]),
+            start + timedelta(seconds=float(offsets[index])),
+            bool(has_ip[index]),
+            bool(has_device[index]),
+        )
+        for index in range(n_samples)
+    ]
+    X = VelocityReplay().features(transactions)
+    names = VELOCITY_FEATURE_PIPELINE.feature_names
+    user_count_1h = X[:, names.index("user_count_1h")]
+    hour = X[:, names.index("hour")]
+    fraud_prob = (
+        (amounts > 5000) * 0.25
+        + (user_count_1h >= 2) * 0.3
+        + (hour < 6) * 0.15
+        + rng.uniform(0, 0.2, n_samples)
+    )
+    y = (fraud_prob > 0.5).astype(int)
+    return X, y
+
+
+class VelocityReplay:
+    def __init__(self, max_keys: int = VELOCITY_INDEX_KEYS) -> None:
+        self._index = SlidingWindowIndex(max_keys=max_keys)
+        self._last_timestamp: datetime | None = None
+
+    def features(self, transactions: list[Transaction]) -> np.ndarray:
+        enrichments = []
+        for transaction in transactions:
+            if self._last_timestamp is not None and transaction.timestamp < self._last_timestamp:
+                raise ValueError("Velocity features need transactions sorted by timestamp")
+            self._last_timestamp = transaction.timestamp
+            enrichments.append(self._index.snapshot(transaction))
+            self._index.record(transaction)
+        return VELOCITY_FEATURE_PIPELINE.extract_batch(transactions, enrichments)
+
+
+def _transaction(
+    index: int,
+    user_id: str,
+    merchant_id: str,
+    amount: float,
+    timestamp: datetime,
+    has_ip: bool,
+    has_device: bool,
+) -> Transaction:
+    metadata = TransactionMetadata()
+    if has_ip:
+        metadata["ip_address"] = "present"
+    if has_device:
+        metadata["device_id"] = "present"
+    return Transaction(
+        TransactionId.create(UUID(int=index)),
+        UserId.create(user_id),
+        MerchantId.create(merchant_id),
+        TransactionAmount.create(amount),
+        timestamp,
+        metadata,
+    )
+
+
+def transaction_chunk_features(replay: VelocityReplay, first_row: int, chunk: Any) -> np.ndarray:
+    import pandas as pd
+
+    timestamps = chunk["timestamp"]
+    if pd.api.types.is_numeric_dtype(timestamps):
+        parsed: Iterable[datetime] = (
+            datetime.fromtimestamp(float(value), timezone.utc).replace(tzinfo=None) for value in timestamps
+        )
+    else:
+        parsed = (datetime.fromisoformat(str(value)) for value in timestamps)
+    flags = {column: chunk[column].fillna("").astype(bool) if column in chunk else None for column in METADATA_COLUMNS}
+    transactions = [
+        _transaction(
+            first_row + offset,
+            str(user_id),
+            str(merchant_id),
+            float(amount),
+            timestamp,
+            bool(flags["ip_address"].iat[offset]) if flags["ip_address"] is not None else False,
+            bool(flags["device_id"].iat[offset]) if flags["device_id"] is not None else False,
+        )
+        for offset, (user_id, merchant_id, amount, timestamp) in enumerate(
+            zip(chunk["user_id"], chunk["merchant_id"], chunk["amount"], parsed)
+        )
+    ]
+    return replay.features(transactions)
+
+
+def find_kaggle_csv(data_path: str | None) -> Path | None:
+    if data_path:
+        return Path(data_path)
+    if kagglehub is None:
+        csv_path = Path("creditcard.csv")
+        return csv_path if csv_path.exists() else None
+    print("Downloading Kaggle dataset...")
+    dataset_path = kagglehub.dataset_download("mlg-ulb/creditcardfraud")
+    csv_path = Path(dataset_path) / "creditcard.csv"
+    if csv_path.exists():
+        return csv_path
+    csv_files = list(Path(dataset_path).glob("*.csv"))
+    return csv_files[0] if csv_files else None
+
+
+def kaggle_features(time_col: np.ndarray, amount: np.ndarray) -> np.ndarray:
+    return DEFAULT_FEATURE_PIPELINE.transform_columns(
+        {
+            "amount": amount,
+            "hour": time_col % (24 * 3600) // 3600,
+            "day_of_week": (time_col // (24 * 3600)) % 7,
+            "metadata.ip_address": np.ones(len(amount)),
+            "metadata.device_id": np.ones(len(amount)),
+        }
+    )
+
+
+def count_csv_rows(csv_path: Path) -> int:
+    lines = 0
+    last = b"\n"
+    with open(csv_path, "rb") as f:
+        while block := f.read(1 << 20):
+            lines += block.count(b"\n")
+            last = block[-1:]
+    if last != b"\n":
+        lines += 1
+    return max(lines - 1, 0)
+
+
+ChunkFeatures = Callable[[int, Any], tuple[np.ndarray, np.ndarray]]
+
+
+def kaggle_chunk_features(first_row: int, chunk: Any) -> tuple[np.ndarray, np.ndarray]:
+    return kaggle_features(chunk["Time"].to_numpy(), chunk["Amount"].to_numpy()), chunk["Class"].to_numpy()
+
+
+def feature_cache_key(csv_path: Path, pipeline: FeaturePipeline) -> str:
+    stat = csv_path.stat()
+    fingerprint = [str(csv_path.resolve()), stat.st_size, stat.st_mtime_ns, pipeline.feature_names]
+    return hashlib.sha256(json.dumps(fingerprint).encode()).hexdigest()[:16]
+
+
+def build_feature_cache(
+    csv_path: Path,
+    cache_dir: Path,
+    chunk_rows: int,
+    rebuild: bool = False,
+    pipeline: FeaturePipeline = DEFAULT_FEATURE_PIPELINE,
+    columns: list[str] | None = None,
+    chunk_features: ChunkFeatures = kaggle_chunk_features,
+) -> Path:
+    import pandas as pd
+
+    key = feature_cache_key(csv_path, pipeline)
+    directory = cache_dir / key
+    if (directory / MANIFEST_FILE).exists() and not rebuild:
+        print(f"Using cached features in {directory}")
+        return directory
+    n_rows = count_csv_rows(csv_path)
+    n_features = len(pipeline.feature_names)
+    staging = cache_dir / f".{key}.tmp"
+    shutil.rmtree(staging, ignore_errors=True)
+    staging.mkdir(parents=True)
+    print(f"Caching {n_rows} rows of features from {csv_path} in chunks of {chunk_rows}...")
+    features = np.lib.format.open_memmap(
+        staging / FEATURES_FILE, mode="w+", dtype=np.float32, shape=(n_rows, n_features)
+    )
+    labels = np.lib.format.open_memmap(staging / LABELS_FILE, mode="w+", dtype=np.int8, shape=(n_rows,))
+    offset = 0
+    for chunk in pd.read_csv(csv_path, usecols=columns or KAGGLE_COLUMNS, chunksize=chunk_rows):
+        end = offset + len(chunk)
+        if end > n_rows:
+            raise ValueError(f"{csv_path} has more rows than the {n_rows} lines counted")
+        features[offset:end], labels[offset:end] = chunk_features(offset, chunk)
+        offset = end
+    if offset != n_rows:
+        raise ValueError(f"Read {offset} rows from {csv_path}, expected {n_rows}")
+    features.flush()
+    labels.flush()
+    del features, labels
+    manifest = {
+        "source": str(csv_path.resolve()),
+        "rows": n_rows,
+        "feature_names": pipeline.feature_names,
+        "dtype": "float32",
+    }
+    (staging / MANIFEST_FILE).write_text(json.dumps(manifest, indent=2))
+    shutil.rmtree(directory, ignore_errors=True)
+    staging.rename(directory)
+    return directory
+
+
+def load_feature_cache(directory: Path) -> tuple[np.ndarray, np.ndarray]:
+    features = np.load(directory / FEATURES_FILE, mmap_mode="r")
+    labels = np.load(directory / LABELS_FILE, mmap_mode="r")
+    return features, labels
+
+
+def load_kaggle_credit_card_data(
+    data_path: str | None = None,
+    cache_dir: str = DEFAULT_CACHE_DIR,
+    chunk_rows: int = 100000,
+    rebuild_cache: bool = False,
+) -> tuple[np.ndarray, np.ndarray] | None:
     try:
-        import pandas as pd
-        
-        if kagglehub is None:
-            csv_path = Path("creditcard.csv")
-            if not csv_path.exists():
-                return None
-        else:
-            print("Downloading Kaggle dataset...")
-            dataset_path = kagglehub.dataset_download("mlg-ulb/creditcardfraud")
-            csv_path = Path(dataset_path) / "creditcard.csv"
-            if not csv_path.exists():
-                csv_files = list(Path(dataset_path).glob("*.csv"))
-                if csv_files:
-                    csv_path = csv_files[0]
-                else:
-                    return None
-        
-        print(f"Loading data from {csv_path}...")
-        df = pd.read_csv(csv_path)
-        
-        amount_col = df["Amount"].values.reshape(-1, 1)
-        time_col = df["Time"].values
-        
-        hour = (time_col % (24 * 3600) // 3600).reshape(-1, 1)
-        day_of_week = ((time_col // (24 * 3600)) % 7).reshape(-1, 1)
-        
-        has_ip = np.ones((len(df), 1))
-        has_device = np.ones((len(df), 1))
-        
-        X_custom = np.column_stack([amount_col, hour, day_of_week, has_ip, has_device])
-        
-        y = df["Class"].values
-        
-        return X_custom, y
+        csv_path = find_kaggle_csv(data_path)
+        if csv_path is None or not csv_path.exists():
+            return None
+        directory = build_feature_cache(csv_path, Path(cache_dir), chunk_rows, rebuild_cache)
+        return load_feature_cache(directory)
     except Exception as e:
         print(f"Error loading Kaggle dataset: {e}")
         return None
 
 
-def train_xgboost_model(X_train: np.ndarray, y_train: np.ndarray) -> xgb.XGBClassifier:
-    model = xgb.XGBClassifier(
-        n_estimators=100,
-        max_depth=6,
-        learning_rate=0.1,
+def load_transactions_csv(
+    csv_path: str,
+    cache_dir: str = DEFAULT_CACHE_DIR,
+    chunk_rows: int = 100000,
+    rebuild_cache: bool = False,
+) -> tuple[np.ndarray, np.ndarray]:
+    import pandas as pd
+
+    path = Path(csv_path)
+    header = pd.read_csv(path, nrows=0).columns
+    missing = [column for column in TRANSACTION_COLUMNS if column not in header]
+    if missing:
+        raise ValueError(f"{path} is missing columns {missing}")
+    replay = VelocityReplay()
+    directory = build_feature_cache(
+        path,
+        Path(cache_dir),
+        chunk_rows,
+        rebuild_cache,
+        pipeline=VELOCITY_FEATURE_PIPELINE,
+        columns=TRANSACTION_COLUMNS + [column for column in METADATA_COLUMNS if column in header],
+        chunk_features=lambda first_row, chunk: (
+            transaction_chunk_features(replay, first_row, chunk),
+            chunk["is_fraud"].to_numpy(),
+        ),
+    )
+    return load_feature_cache(directory)
+
+
+class MatrixBatches(xgb.DataIter):
+    def __init__(
+        self,
+        features: np.ndarray,
+        labels: np.ndarray,
+        indices: np.ndarray,
+        batch_rows: int,
+        cache_prefix: str | None = None,
+    ) -> None:
+        self._features = features
+        self._labels = labels
+        self._indices = indices
+        self._batch_rows = batch_rows
+        self._position = 0
+        super().__init__(cache_prefix=cache_prefix)
+
+    def next(self, input_data: Callable[..., None]) -> bool:
+        if self._position >= len(self._indices):
+            return False
+        batch = self._indices[self._position : self._position + self._batch_rows]
+        self._position += len(batch)
+        input_data(data=np.asarray(self._features[batch]), label=np.asarray(self._labels[batch]))
+        return True
+
+    def reset(self) -> None:
+        self._position = 0
+
+
+def search_parameters(
+    X: np.ndarray,
+    y: np.ndarray,
+    train_idx: np.ndarray,
+    search_rows: int,
+    iterations: int,
+    folds: int,
+    n_jobs: int,
+) -> tuple[dict[str, Any], float]:
+    sample = train_idx
+    if len(train_idx) > search_rows:
+        sample, _ = train_test_split(train_idx, train_size=search_rows, random_state=42, stratify=y[train_idx])
+        sample = np.sort(sample)
+    search = RandomizedSearchCV(
+        xgb.XGBClassifier(
+            n_estimators=N_ESTIMATORS,
+            tree_method="hist",
+            max_bin=MAX_BIN,
+            n_jobs=1,
+            random_state=42,
+            eval_metric="logloss",
+        ),
+        PARAM_DISTRIBUTIONS,
+        n_iter=iterations,
+        scoring="average_precision",
+        cv=StratifiedKFold(n_splits=folds, shuffle=True, random_state=42),
+        n_jobs=n_jobs,
+        refit=False,
         random_state=42,
-        eval_metric="logloss",
     )
-    model.fit(X_train, y_train)
+    search.fit(np.asarray(X[sample]), np.asarray(y[sample]))
+    return dict(search.best_params_), float(search.best_score_)
+
+
+def train_xgboost_model(
+    X: np.ndarray,
+    y: np.ndarray,
+    train_idx: np.ndarray,
+    params: dict[str, Any],
+    batch_rows: int = 100000,
+    n_threads: int | None = None,
+    external_memory_dir: Path | None = None,
+) -> xgb.XGBClassifier:
+    if external_memory_dir is not None:
+        external_memory_dir.mkdir(parents=True, exist_ok=True)
+        batches = MatrixBatches(X, y, train_idx, batch_rows, cache_prefix=str(external_memory_dir / "xgb"))
+        if hasattr(xgb, "ExtMemQuantileDMatrix"):
+            dtrain = xgb.ExtMemQuantileDMatrix(batches, max_bin=MAX_BIN)
+        else:
+            dtrain = xgb.DMatrix(batches)
+    else:
+        dtrain = xgb.QuantileDMatrix(MatrixBatches(X, y, train_idx, batch_rows), max_bin=MAX_BIN)
+    booster = xgb.train(
+        {
+            "objective": "binary:logistic",
+            "eval_metric": "logloss",
+            "tree_method": "hist",
+            "max_bin": MAX_BIN,
+            "nthread": n_threads or os.cpu_count() or 1,
+            "seed": 42,
+            **params,
+        },
+        dtrain,
+        num_boost_round=N_ESTIMATORS,
+    )
+    model = xgb.XGBClassifier()
+    model.load_model(bytearray(booster.save_raw("ubj")))
     return model
 
 
@@ -102,42 +464,133 @@ def train_gradient_boosting_model(
     return model
 
 
-def evaluate_model(model: xgb.XGBClassifier | GradientBoostingClassifier, X_test: np.ndarray, y_test: np.ndarray) -> None:
+def evaluate_model(
+    model: xgb.XGBClassifier | GradientBoostingClassifier, X_test: np.ndarray, y_test: np.ndarray
+) -> dict[str, float]:
     y_pred = model.predict(X_test)
     y_pred_proba = model.predict_proba(X_test)[:, 1]
     
     print("Classification Report:")
     print(classification_report(y_test, y_pred))
-    print(f"\nROC-AUC Score: {roc_auc_score(y_test, y_pred_proba):.4f}")
+    metrics = {
+        "roc_auc": float(roc_auc_score(y_test, y_pred_proba)),
+        "average_precision": float(average_precision_score(y_test, y_pred_proba)),
+        "precision": float(precision_score(y_test, y_pred, zero_division=0)),
+        "recall": float(recall_score(y_test, y_pred, zero_division=0)),
+        "f1": float(f1_score(y_test, y_pred, zero_division=0)),
+        "positive_rate": float(np.mean(y_test)),
+    }
+    print(f"\nROC-AUC Score: {metrics['roc_auc']:.4f}")
+    return metrics
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Train the fraud model and publish it to the model registry")
+    parser.add_argument("--model-path", default=DEFAULT_MODEL_PATH)
+    parser.add_argument("--registry", default=DEFAULT_REGISTRY_PATH)
+    parser.add_argument("--no-registry", action="store_true", help="Only write the standalone model files")
+    parser.add_argument(
+        "--no-activate",
+        action="store_true",
+        help="Register the new version without making it the active model",
+    )
+    parser.add_argument(
+        "--velocity-features",
+        action="store_true",
+        help="Train on the default plus velocity features, for VELOCITY_FEATURES_ENABLED=true",
+    )
+    parser.add_argument(
+        "--transactions-csv",
+        default=None,
+        help="Timestamp-ordered CSV with user_id, merchant_id, amount, timestamp and is_fraud for --velocity-features",
+    )
+    parser.add_argument("--data", default=None, help="Path to creditcard.csv (default: download or ./creditcard.csv)")
+    parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR, help="Directory for memory-mapped feature caches")
+    parser.add_argument("--rebuild-cache", action="store_true", help="Rebuild the feature cache from the CSV")
+    parser.add_argument("--chunk-rows", type=int, default=100000, help="CSV rows read per chunk")
+    parser.add_argument("--batch-rows", type=int, default=100000, help="Rows per batch handed to XGBoost")
+    parser.add_argument(
+        "--external-memory", action="store_true", help="Page the training matrix through an on-disk XGBoost cache"
+    )
+    parser.add_argument("--no-search", action="store_true", help="Skip the parameter search and use the defaults")
+    parser.add_argument("--search-iterations", type=int, default=12, help="Parameter settings sampled")
+    parser.add_argument("--cv-folds", type=int, default=3, help="Cross-validation folds per setting")
+    parser.add_argument("--search-rows", type=int, default=200000, help="Training rows sampled for the search")
+    parser.add_argument("--n-jobs", type=int, default=-1, help="Parallel search fits (default: all cores)")
+    return parser.parse_args()
 
 
 def main() -> None:
+    args = parse_args()
     print("Loading data...")
-    data = load_kaggle_credit_card_data()
-    if data is None:
-        print("Kaggle dataset not found, using sample data...")
-        X, y = load_sample_data()
+    pipeline = VELOCITY_FEATURE_PIPELINE if args.velocity_features else DEFAULT_FEATURE_PIPELINE
+    if args.velocity_features:
+        if args.transactions_csv:
+            X, y = load_transactions_csv(args.transactions_csv, args.cache_dir, args.chunk_rows, args.rebuild_cache)
+            print(f"Loaded {len(X)} transactions from {args.transactions_csv}")
+        else:
+            print("No transactions CSV given, using sample transactions...")
+            X, y = load_sample_transactions()
     else:
-        X, y = data
-        print(f"Loaded {len(X)} samples from Kaggle dataset")
-    
+        data = load_kaggle_credit_card_data(args.data, args.cache_dir, args.chunk_rows, args.rebuild_cache)
+        if data is None:
+            print("Kaggle dataset not found, using sample data...")
+            X, y = load_sample_data()
+        else:
+            X, y = data
+            print(f"Loaded {len(X)} samples from Kaggle dataset")
+
     print("Splitting data...")
-    X_train, X_test, y_train, y_test = train_test_split(
-        X, y, test_size=0.2, random_state=42, stratify=y
-    )
-    
+    y = np.asarray(y)
+    train_idx, test_idx = train_test_split(np.arange(len(y)), test_size=0.2, random_state=42, stratify=y)
+    train_idx = np.sort(train_idx)
+    test_idx = np.sort(test_idx)
+
+    metrics: dict[str, float] = {}
+    params = dict(DEFAULT_PARAMS)
+    if not args.no_search:
+        print(f"Searching {args.search_iterations} parameter settings with {args.cv_folds}-fold cross-validation...")
+        started = time.perf_counter()
+        params, cv_score = search_parameters(
+            X, y, train_idx, args.search_rows, args.search_iterations, args.cv_folds, args.n_jobs
+        )
+        metrics["cv_average_precision"] = cv_score
+        metrics["search_seconds"] = time.perf_counter() - started
+        print(f"Best parameters: {params} (CV average precision {cv_score:.4f})")
+
     print("Training XGBoost model...")
-    model = train_xgboost_model(X_train, y_train)
-    
+    started = time.perf_counter()
+    external_memory_dir = Path(args.cache_dir) / "xgb-external" if args.external_memory else None
+    try:
+        model = train_xgboost_model(X, y, train_idx, params, args.batch_rows, external_memory_dir=external_memory_dir)
+    finally:
+        if external_memory_dir is not None:
+            shutil.rmtree(external_memory_dir, ignore_errors=True)
+    metrics["training_seconds"] = time.perf_counter() - started
+
     print("Evaluating model...")
-    evaluate_model(model, X_test, y_test)
-    
-    model_path = Path("app/adapters/outbound/ml/models/model.pkl")
+    metrics.update(evaluate_model(model, np.asarray(X[test_idx]), y[test_idx]))
+
+    model_path = Path(args.model_path)
     model_path.parent.mkdir(parents=True, exist_ok=True)
     
     print(f"Saving model to {model_path}...")
     with open(model_path, "wb") as f:
         pickle.dump(model, f)
+
+    compiled_path = model_path.with_suffix(COMPILED_SUFFIX)
+    print(f"Exporting memory-mappable model to {compiled_path}...")
+    ModelLoader.export_compiled(model, str(compiled_path), StructuredLogger())
+
+    if not args.no_registry:
+        registry = ModelRegistry(args.registry)
+        metadata = registry.register(
+            model, pipeline, metrics, training_rows=len(train_idx), params=params
+        )
+        print(f"Registered model version {metadata['version']} in {registry.root}")
+        if not args.no_activate:
+            registry.activate(metadata["version"])
+            print(f"Activated model version {metadata['version']}")
     
     print("Model training complete!")
 
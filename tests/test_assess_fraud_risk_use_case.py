@@ -0,0 +1,260 @@
+import asyncio
+import uuid
+from collections.abc import Callable
+from datetime import datetime
+
+import pytest
+
+from app.adapters.outbound.cache.idempotency_index import InMemoryIdempotencyIndex
+from app.application.dtos import FraudAssessmentCommand, FraudAssessmentOutcome
+from app.application.use_cases.assess_fraud_risk_use_case import AssessFraudRiskUseCase
+from app.domain.entities.fraud_decision import FraudDecision
+from app.domain.entities.transaction import Transaction
+from app.domain.exceptions import DuplicateTransactionError, IdempotencyConflictError
+from app.domain.value_objects.merchant_id import MerchantId
+from app.domain.value_objects.model_score import ModelScore
+from app.domain.value_objects.transaction_amount import TransactionAmount
+from app.domain.value_objects.transaction_id import TransactionId
+from app.domain.value_objects.user_id import UserId
+
+TIMESTAMP = datetime(2024, 3, 1, 12, 0)
+
+
+class StubScoring:
+    def __init__(self) -> None:
+        self.single_calls = 0
+        self.batch_sizes: list[int] = []
+        self.gate: asyncio.Event | None = None
+
+    async def score_transaction(self, transaction: Transaction) -> ModelScore:
+        self.single_calls += 1
+        if self.gate is not None:
+            await self.gate.wait()
+        return ModelScore(0.2, "v1")
+
+    async def score_transactions(self, transactions: list[Transaction]) -> list[ModelScore]:
+        self.batch_sizes.append(len(transactions))
+        if self.gate is not None:
+            await self.gate.wait()
+        return [ModelScore(0.2, "v1") for _ in transactions]
+
+
+class InMemoryStore:
+    def __init__(self) -> None:
+        self.transactions: dict[TransactionId, Transaction] = {}
+        self.fraud_decisions: dict[TransactionId, FraudDecision] = {}
+        self.before_commit: Callable[[], None] | None = None
+
+
+class InMemoryUnitOfWork:
+    def __init__(self, store: InMemoryStore) -> None:
+        self._store = store
+        self._transactions: list[Transaction] = []
+        self._fraud_decisions: list[FraudDecision] = []
+
+    def add_transaction(self, transaction: Transaction) -> None:
+        self._transactions.append(transaction)
+
+    def add_transactions(self, transactions: list[Transaction]) -> None:
+        self._transactions.extend(transactions)
+
+    def add_fraud_decision(self, fraud_decision: FraudDecision) -> None:
+        self._fraud_decisions.append(fraud_decision)
+
+    def add_fraud_decisions(self, fraud_decisions: list[FraudDecision]) -> None:
+        self._fraud_decisions.extend(fraud_decisions)
+
+    async def commit(self) -> None:
+        if self._store.before_commit is not None:
+            self._store.before_commit()
+            self._store.before_commit = None
+        if any(t.transaction_id in self._store.transactions for t in self._transactions):
+            raise DuplicateTransactionError("Transaction already stored")
+        self._store.transactions.update((t.transaction_id, t) for t in self._transactions)
+        self._store.fraud_decisions.update((d.transaction_id, d) for d in self._fraud_decisions)
+        await self.rollback()
+
+    async def rollback(self) -> None:
+        self._transactions = []
+        self._fraud_decisions = []
+
+
+class InMemoryTransactionRepository:
+    def __init__(self, store: InMemoryStore) -> None:
+        self._store = store
+
+    async def find_by_ids(self, transaction_ids: list[TransactionId]) -> list[Transaction]:
+        return [self._store.transactions[t] for t in transaction_ids if t in self._store.transactions]
+
+
+class InMemoryFraudDecisionRepository:
+    def __init__(self, store: InMemoryStore) -> None:
+        self._store = store
+
+    async def find_by_transaction_ids(self, transaction_ids: list[TransactionId]) -> list[FraudDecision]:
+        return [self._store.fraud_decisions[t] for t in transaction_ids if t in self._store.fraud_decisions]
+
+
+def _use_case(
+    store: InMemoryStore, scoring: StubScoring, index: InMemoryIdempotencyIndex | None = None
+) -> AssessFraudRiskUseCase:
+    return AssessFraudRiskUseCase(
+        fraud_scoring_port=scoring,
+        unit_of_work=InMemoryUnitOfWork(store),
+        idempotency_index=index,
+        transaction_repository=InMemoryTransactionRepository(store),
+        fraud_decision_repository=InMemoryFraudDecisionRepository(store),
+    )
+
+
+def _command(transaction_id: str, amount: str = "120.00") -> FraudAssessmentCommand:
+    return FraudAssessmentCommand(
+        transaction_id=TransactionId.create(transaction_id),
+        user_id=UserId.create("user_1"),
+        merchant_id=MerchantId.create("merchant_1"),
+        amount=TransactionAmount.create(amount),
+        timestamp=TIMESTAMP,
+    )
+
+
+async def _execute(use_case: AssessFraudRiskUseCase, command: FraudAssessmentCommand) -> FraudAssessmentOutcome:
+    return await use_case.execute_idempotent(
+        command.transaction_id, command.user_id, command.merchant_id, command.amount, command.timestamp
+    )
+
+
+def _index() -> InMemoryIdempotencyIndex:
+    return InMemoryIdempotencyIndex(max_entries=100, ttl_seconds=60)
+
+
+def test_replay_returns_stored_decision() -> None:
+    async def scenario() -> None:
+        store, scoring = InMemoryStore(), StubScoring()
+        command = _command(str(uuid.uuid4()))
+        first = await _execute(_use_case(store, scoring, _index()), command)
+        same_worker = _use_case(store, scoring, _index())
+        await _execute(same_worker, command)
+        from_index = await _execute(same_worker, command)
+        other_worker = await _execute(_use_case(store, scoring), command)
+        assert not first.replayed
+        assert from_index.replayed and other_worker.replayed
+        assert from_index.fraud_decision == first.fraud_decision
+        assert other_worker.fraud_decision == first.fraud_decision
+        assert scoring.single_calls == 1
+        assert len(store.transactions) == 1
+
+    asyncio.run(scenario())
+
+
+def test_different_payload_under_same_id_conflicts() -> None:
+    async def scenario() -> None:
+        store, scoring = InMemoryStore(), StubScoring()
+        transaction_id = str(uuid.uuid4())
+        use_case = _use_case(store, scoring, _index())
+        await _execute(use_case, _command(transaction_id))
+        with pytest.raises(IdempotencyConflictError):
+            await _execute(use_case, _command(transaction_id, amount="121.00"))
+        with pytest.raises(IdempotencyConflictError):
+            await _execute(_use_case(store, scoring), _command(transaction_id, amount="121.00"))
+        assert scoring.single_calls == 1
+
+    asyncio.run(scenario())
+
+
+def test_concurrent_duplicates_coalesce_onto_one_assessment() -> None:
+    async def scenario() -> None:
+        store, scoring = InMemoryStore(), StubScoring()
+        scoring.gate = asyncio.Event()
+        use_case = _use_case(store, scoring, _index())
+        command = _command(str(uuid.uuid4()))
+        tasks = [asyncio.create_task(_execute(use_case, command)) for _ in range(5)]
+        await asyncio.sleep(0)
+        scoring.gate.set()
+        outcomes = await asyncio.gather(*tasks)
+        assert scoring.single_calls == 1
+        assert scoring.batch_sizes == []
+        assert sorted(outcome.replayed for outcome in outcomes) == [False, True, True, True, True]
+        assert len({outcome.fraud_decision for outcome in outcomes}) == 1
+
+    asyncio.run(scenario())
+
+
+def test_concurrent_conflicting_payload_is_rejected_while_in_flight() -> None:
+    async def scenario() -> None:
+        store, scoring = InMemoryStore(), StubScoring()
+        scoring.gate = asyncio.Event()
+        use_case = _use_case(store, scoring, _index())
+        transaction_id = str(uuid.uuid4())
+        first = asyncio.create_task(_execute(use_case, _command(transaction_id)))
+        await asyncio.sleep(0)
+        with pytest.raises(IdempotencyConflictError):
+            await _execute(use_case, _command(transaction_id, amount="999.00"))
+        scoring.gate.set()
+        assert not (await first).replayed
+
+    asyncio.run(scenario())
+
+
+def test_duplicate_stored_by_another_worker_is_replayed() -> None:
+    async def scenario() -> None:
+        store, scoring = InMemoryStore(), StubScoring()
+        command = _command(str(uuid.uuid4()))
+        other = await _execute(_use_case(InMemoryStore(), StubScoring()), command)
+
+        def race() -> None:
+            store.transactions[command.transaction_id] = Transaction(
+                transaction_id=command.transaction_id,
+                user_id=command.user_id,
+                merchant_id=command.merchant_id,
+                amount=command.amount,
+                timestamp=command.timestamp,
+            )
+            store.fraud_decisions[command.transaction_id] = other.fraud_decision
+
+        store.before_commit = race
+        outcome = await _execute(_use_case(store, scoring, _index()), command)
+        assert outcome.replayed
+        assert outcome.fraud_decision == other.fraud_decision
+
+    asyncio.run(scenario())
+
+
+def test_duplicate_id_inside_batch_is_replayed() -> None:
+    async def scenario() -> None:
+        store, scoring = InMemoryStore(), StubScoring()
+        first, second = _command(str(uuid.uuid4())), _command(str(uuid.uuid4()))
+        outcomes = await _use_case(store, scoring, _index()).execute_many_idempotent([first, second, first])
+        assert [outcome.replayed for outcome in outcomes] == [False, False, True]
+        assert [outcome.fraud_decision.transaction_id for outcome in outcomes] == [
+            first.transaction_id,
+            second.transaction_id,
+            first.transaction_id,
+        ]
+        assert outcomes[2].fraud_decision == outcomes[0].fraud_decision
+        assert scoring.batch_sizes == [2]
+        assert len(store.transactions) == 2
+
+    asyncio.run(scenario())
+
+
+def test_conflicting_duplicate_inside_batch_is_rejected() -> None:
+    async def scenario() -> None:
+        store, scoring = InMemoryStore(), StubScoring()
+        transaction_id = str(uuid.uuid4())
+        use_case = _use_case(store, scoring, _index())
+        with pytest.raises(IdempotencyConflictError):
+            await use_case.execute_many_idempotent([_command(transaction_id), _command(transaction_id, "5.00")])
+        assert store.transactions == {}
+        assert not (await _execute(use_case, _command(transaction_id, "5.00"))).replayed
+
+    asyncio.run(scenario())
+
+
+def test_single_keyed_request_uses_single_scoring() -> None:
+    async def scenario() -> None:
+        scoring = StubScoring()
+        await _execute(_use_case(InMemoryStore(), scoring, _index()), _command(str(uuid.uuid4())))
+        assert scoring.single_calls == 1
+        assert scoring.batch_sizes == []
+
+    asyncio.run(scenario())
@@ -0,0 +1,114 @@
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+import pytest
+import xgboost as xgb
+from sklearn.ensemble import GradientBoostingClassifier
+
+from app.adapters.outbound.ml.compiled_tree_ensemble import CompiledTreeEnsemble
+
+N_FEATURES = 5
+TOLERANCE = 1e-6
+
+
+def _training_data() -> tuple[npt.NDArray[np.float64], npt.NDArray[np.int64]]:
+    rng = np.random.default_rng(7)
+    X = np.column_stack(
+        [
+            rng.uniform(1, 10000, 2000).round(2),
+            rng.integers(0, 24, 2000),
+            rng.integers(0, 7, 2000),
+            rng.integers(0, 2, 2000),
+            rng.integers(0, 2, 2000),
+        ]
+    ).astype(np.float64)
+    y = ((X[:, 0] > 5000) & (X[:, 1] < 6) | (rng.uniform(size=2000) < 0.1)).astype(np.int64)
+    return X, y
+
+
+def _gradient_boosting() -> GradientBoostingClassifier:
+    X, y = _training_data()
+    return GradientBoostingClassifier(n_estimators=30, max_depth=3, random_state=42).fit(X, y)
+
+
+def _xgboost() -> xgb.XGBClassifier:
+    X, y = _training_data()
+    return xgb.XGBClassifier(n_estimators=30, max_depth=4, tree_method="hist", random_state=42).fit(X, y)
+
+
+@pytest.fixture(scope="module", params=["gradient_boosting", "xgboost"])
+def model(request: pytest.FixtureRequest) -> Any:
+    return _gradient_boosting() if request.param == "gradient_boosting" else _xgboost()
+
+
+@pytest.fixture(scope="module")
+def rows() -> npt.NDArray[np.float64]:
+    X, _ = _training_data()
+    rng = np.random.default_rng(11)
+    unseen = np.column_stack(
+        [
+            rng.uniform(0, 20000, 500),
+            rng.integers(0, 24, 500),
+            rng.integers(0, 7, 500),
+            rng.integers(0, 2, 500),
+            rng.integers(0, 2, 500),
+        ]
+    )
+    return np.vstack([X[:500], unseen])
+
+
+def _assert_parity(compiled: CompiledTreeEnsemble, model: Any, X: npt.NDArray[np.float64]) -> None:
+    np.testing.assert_allclose(compiled.predict_proba(X), model.predict_proba(X), rtol=0, atol=TOLERANCE)
+
+
+def test_single_rows_match_native_model(model: Any, rows: npt.NDArray[np.float64]) -> None:
+    compiled = CompiledTreeEnsemble.from_model(model)
+    for row in rows[:50]:
+        _assert_parity(compiled, model, row.reshape(1, -1))
+    np.testing.assert_allclose(
+        compiled.predict_proba(rows[0]), model.predict_proba(rows[:1]), rtol=0, atol=TOLERANCE
+    )
+
+
+def test_batches_match_native_model(model: Any, rows: npt.NDArray[np.float64]) -> None:
+    compiled = CompiledTreeEnsemble.from_model(model)
+    _assert_parity(compiled, model, rows)
+    _assert_parity(compiled, model, compiled.parity_probe())
+
+
+def test_split_thresholds_match_native_model(model: Any) -> None:
+    compiled = CompiledTreeEnsemble.from_model(model)
+    probe = compiled.parity_probe(n_rows=2000, seed=3)
+    assert compiled.max_abs_error(model, probe) <= TOLERANCE
+
+
+@pytest.mark.parametrize("mmap", [True, False])
+def test_saved_model_matches_native_model(
+    model: Any, rows: npt.NDArray[np.float64], tmp_path: Path, mmap: bool
+) -> None:
+    compiled = CompiledTreeEnsemble.from_model(model)
+    path = tmp_path / "model.cte"
+    compiled.save(path)
+    loaded = CompiledTreeEnsemble.load(path, mmap=mmap)
+    assert loaded.n_features == N_FEATURES
+    assert loaded.n_trees == compiled.n_trees
+    _assert_parity(loaded, model, rows)
+    for row in rows[:10]:
+        _assert_parity(loaded, model, row.reshape(1, -1))
+
+
+def test_rejects_wrong_feature_count(model: Any) -> None:
+    compiled = CompiledTreeEnsemble.from_model(model)
+    with pytest.raises(ValueError):
+        compiled.predict_proba(np.zeros((1, N_FEATURES + 1)))
+
+
+def test_xgboost_missing_values_match_native_model(rows: npt.NDArray[np.float64]) -> None:
+    model = _xgboost()
+    compiled = CompiledTreeEnsemble.from_model(model)
+    X = rows[:100].copy()
+    X[::3, 0] = np.nan
+    X[1::3, 1] = np.nan
+    _assert_parity(compiled, model, X)
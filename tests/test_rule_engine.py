@@ -0,0 +1,148 @@
+import json
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from app.adapters.outbound.logging.logger import StructuredLogger
+from app.adapters.outbound.rules.rule_set_manager import RuleSetManager
+from app.domain.entities.fraud_decision import Decision
+from app.domain.entities.transaction import Transaction, TransactionMetadata
+from app.domain.exceptions import InvalidRuleSetError
+from app.domain.services.rule_engine import DEFAULT_RULE_ENGINE, RuleEngine, RuleSet
+from app.domain.value_objects.merchant_id import MerchantId
+from app.domain.value_objects.transaction_amount import TransactionAmount
+from app.domain.value_objects.transaction_id import TransactionId
+from app.domain.value_objects.user_id import UserId
+
+
+def _transaction(
+    amount: str = "100.00", hour: int = 12, metadata: TransactionMetadata | None = None
+) -> Transaction:
+    return Transaction(
+        transaction_id=TransactionId.create(str(uuid.uuid4())),
+        user_id=UserId.create("user_1"),
+        merchant_id=MerchantId.create("merchant_1"),
+        amount=TransactionAmount.create(amount),
+        timestamp=datetime(2024, 3, 1, hour, 30),
+        metadata=metadata,
+    )
+
+
+def _engine(*conditions: dict[str, Any], **rule: Any) -> RuleEngine:
+    return RuleEngine(
+        RuleSet.from_dict({"rules": [{"id": "rule", "adjust": 0.1, "when": list(conditions), **rule}]})
+    )
+
+
+def _legacy_risk(transaction: Transaction, ml_score: float) -> float:
+    risk = ml_score
+    if transaction.amount.value > 10000:
+        risk = min(1.0, risk + 0.1)
+    if transaction.timestamp.hour < 6 or transaction.timestamp.hour > 22:
+        risk = min(1.0, risk + 0.05)
+    return min(1.0, risk)
+
+
+@pytest.mark.parametrize(
+    ("op", "below", "at", "above"),
+    [
+        ("gt", False, False, True),
+        ("gte", False, True, True),
+        ("lt", True, False, False),
+        ("lte", True, True, False),
+    ],
+)
+def test_threshold_operators_at_the_boundary(op: str, below: bool, at: bool, above: bool) -> None:
+    engine = _engine({"field": "amount", "op": op, "value": 500})
+    for amount, expected in (("499.99", below), ("500.00", at), ("500.01", above)):
+        assert (engine.matching_rules(_transaction(amount=amount)) == ["rule"]) is expected
+
+
+def test_threshold_and_residual_conditions_must_all_match() -> None:
+    engine = _engine({"field": "amount", "op": "gte", "value": 500}, {"field": "hour", "op": "lt", "value": 6})
+    assert engine.matching_rules(_transaction(amount="500", hour=5)) == ["rule"]
+    assert engine.matching_rules(_transaction(amount="500", hour=6)) == []
+    assert engine.matching_rules(_transaction(amount="499", hour=5)) == []
+
+
+def test_in_on_metadata_field() -> None:
+    engine = _engine({"field": "metadata.country", "op": "in", "value": ["NG", "RU"]})
+    assert engine.matching_rules(_transaction(metadata={"country": "NG"})) == ["rule"]
+    assert engine.matching_rules(_transaction(metadata={"country": "DE"})) == []
+    assert engine.matching_rules(_transaction(metadata={"ip_address": "10.0.0.1"})) == []
+    assert engine.matching_rules(_transaction()) == []
+
+
+def test_not_in_on_metadata_field_skips_missing_key() -> None:
+    engine = _engine({"field": "metadata.country", "op": "not_in", "value": ["US", "DE"]})
+    assert engine.matching_rules(_transaction(metadata={"country": "NG"})) == ["rule"]
+    assert engine.matching_rules(_transaction(metadata={"country": "US"})) == []
+    assert engine.matching_rules(_transaction(metadata={"ip_address": "10.0.0.1"})) == []
+    assert engine.matching_rules(_transaction()) == []
+
+
+def test_most_severe_forced_decision_wins() -> None:
+    engine = RuleEngine(
+        RuleSet.from_dict(
+            {
+                "rules": [
+                    {"id": "review", "decision": "review", "when": [{"field": "amount", "op": "gt", "value": 100}]},
+                    {"id": "block", "decision": "block", "when": [{"field": "hour", "op": "lt", "value": 6}]},
+                    {
+                        "id": "approve",
+                        "decision": "approve",
+                        "when": [{"field": "user_id", "op": "eq", "value": "user_1"}],
+                    },
+                ]
+            }
+        )
+    )
+    assessment = engine.assess(_transaction(amount="200", hour=3), 0.0)
+    assert assessment.decision is Decision.BLOCK
+    assert assessment.matched_rules == ("review", "block", "approve")
+    assert engine.assess(_transaction(amount="200", hour=12), 0.0).decision is Decision.REVIEW
+    assert engine.assess(_transaction(amount="50", hour=12), 0.9).decision is Decision.APPROVE
+
+
+@pytest.mark.parametrize("amount", ["10.00", "10000.00", "10000.01", "999999.00"])
+@pytest.mark.parametrize("hour", [0, 5, 6, 12, 22, 23])
+@pytest.mark.parametrize("ml_score", [0.0, 0.25, 0.9, 0.97, 1.0])
+def test_default_rule_set_matches_legacy_scoring(amount: str, hour: int, ml_score: float) -> None:
+    transaction = _transaction(amount=amount, hour=hour)
+    assessment = DEFAULT_RULE_ENGINE.assess(transaction, ml_score)
+    assert assessment.risk_score == pytest.approx(_legacy_risk(transaction, ml_score))
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "{not json",
+        json.dumps([]),
+        json.dumps({"rules": [{"id": "r", "adjust": 0.1, "when": [{"field": "amount", "op": "eq", "value": "abc"}]}]}),
+        json.dumps({"rules": [{"id": "r", "adjust": 0.1, "when": [{"field": "amount", "op": "gt", "value": "5"}]}]}),
+        json.dumps({"rules": [{"id": "r", "adjust": 0.1, "when": [{"field": "colour", "op": "eq", "value": 1}]}]}),
+        json.dumps({"rules": [{"id": "r", "adjust": 0.1, "when": [{"field": "amount", "op": "near", "value": 1}]}]}),
+        json.dumps({"rules": [{"id": "r", "adjust": 0.1, "when": [{"field": "user_id", "op": "in", "value": "u"}]}]}),
+        json.dumps({"rules": [{"id": "r", "adjust": 0.1, "when": []}]}),
+        json.dumps({"rules": [{"id": "r", "when": [{"field": "hour", "op": "lt", "value": 6}]}]}),
+        json.dumps({"rules": [{"id": "r", "decision": "maybe", "when": [{"field": "hour", "op": "lt", "value": 6}]}]}),
+        json.dumps({"rules": [{"adjust": 0.1, "when": [{"field": "hour", "op": "lt", "value": 6}]}]}),
+        json.dumps({"thresholds": {"review": 0.8, "block": 0.2}}),
+        json.dumps(
+            {
+                "rules": [
+                    {"id": "r", "adjust": 0.1, "when": [{"field": "hour", "op": "lt", "value": 6}]},
+                    {"id": "r", "adjust": 0.1, "when": [{"field": "hour", "op": "gt", "value": 22}]},
+                ]
+            }
+        ),
+    ],
+)
+def test_invalid_rule_file_raises_invalid_rule_set_error(tmp_path: Path, content: str) -> None:
+    path = tmp_path / "rules.json"
+    path.write_text(content)
+    with pytest.raises(InvalidRuleSetError):
+        RuleSetManager(StructuredLogger("test"), path=str(path))